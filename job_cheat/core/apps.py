@@ -0,0 +1,86 @@
+import asyncio
+import atexit
+import logging
+import os
+import threading
+
+from django.apps import AppConfig
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'core'
+
+    def ready(self):
+        _start_log_queue_listener()
+        if not getattr(settings, "SERVICE_WARMUP_ENABLED", False):
+            return
+        # runserver 자동 리로더의 부모 프로세스에서는 실행하지 않음
+        if settings.DEBUG and os.environ.get("RUN_MAIN") != "true":
+            return
+        threading.Thread(target=_warm_up_services, daemon=True).start()
+
+
+LOG_QUEUE_HANDLER_NAME = "queue"
+
+# 리스너를 시작한 QueueHandler (ready가 여러 번 호출되어도 한 번만 시작)
+_started_log_queue_handler = None
+
+
+def _start_log_queue_listener() -> None:
+    """LOGGING의 QueueHandler에 연결된 리스너 스레드를 시작한다 (로그 출력 I/O를 요청 경로 밖으로 이동)."""
+
+    global _started_log_queue_handler
+    handler = logging.getHandlerByName(LOG_QUEUE_HANDLER_NAME)
+    listener = getattr(handler, "listener", None)
+    if listener is None or handler is _started_log_queue_handler:
+        return
+    listener.start()
+    atexit.register(listener.stop)
+    _started_log_queue_handler = handler
+
+
+WARMUP_RAG_QUERY = "프로젝트 경험 성과"
+WARMUP_RAG_USER_ID = "__warmup__"
+
+
+def _warm_up_services() -> None:
+    """외부 서비스 클라이언트를 미리 초기화하여 첫 요청의 초기화 비용을 줄인다.
+
+    아래 asyncio.run 루프는 예열 작업을 동시에 실행하기 위한 일회성 루프이므로,
+    루프와 무관한 상태(SDK import, 인증 정보, Gemini/Firestore/Cohere/Pinecone 동기 클라이언트)만
+    예열한다. 루프에 묶이는 비동기 클라이언트는 요청 루프에서 처음 사용할 때 생성된다.
+    """
+
+    from core.services.conversation_rag_service import get_rag_context
+    from core.services.gemini_service import get_gemini_service
+    from core.services.tts_service import get_tts_service
+    from core.services.whisper_service import get_whisper_service
+
+    def _touch_firestore() -> None:
+        db = getattr(settings, "FIREBASE_DB", None)
+        if db is not None:
+            # 인증 토큰 발급 및 채널 수립
+            db.collection("users").limit(1).get()
+
+    async def _warm_up() -> None:
+        results = await asyncio.gather(
+            # TTS/STT 비동기 클라이언트는 루프별로 만들어지므로 루프와 무관한 준비만 수행
+            asyncio.to_thread(get_tts_service().warm_up),
+            asyncio.to_thread(get_whisper_service().warm_up),
+            asyncio.to_thread(get_gemini_service().warm_up),
+            asyncio.to_thread(_touch_firestore),
+            get_rag_context(WARMUP_RAG_QUERY, WARMUP_RAG_USER_ID, top_k=1),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning("서비스 예열 실패: %s", result)
+
+    try:
+        asyncio.run(_warm_up())
+    except Exception as exc:  # pragma: no cover - 최상위 예외 로깅
+        logger.warning("서비스 예열 실패: %s", exc)
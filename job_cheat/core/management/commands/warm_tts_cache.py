@@ -0,0 +1,61 @@
+"""
+자주 쓰이는 문장을 미리 TTS 변환하여 캐시에 채워 두는 관리 명령.
+
+사용 예: python manage.py warm_tts_cache --corpus interview_prompts.txt
+"""
+
+import asyncio
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.services.tts_service import TTS_BATCH_CONCURRENCY, get_tts_service
+
+
+class Command(BaseCommand):
+    help = "문장 목록 파일(한 줄에 한 문장)을 미리 TTS 변환하여 캐시에 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--corpus", required=True, help="미리 변환할 문장 목록 파일 경로")
+        parser.add_argument("--voice", default="ko-KR-Wavenet-A", help="음성 이름")
+        parser.add_argument("--encoding", default=None, help="오디오 인코딩 (기본값: 서비스 기본 인코딩)")
+
+    def handle(self, *args, **options):
+        corpus_path = Path(options["corpus"])
+        if not corpus_path.exists():
+            raise CommandError(f"문장 목록 파일을 찾을 수 없습니다: {corpus_path}")
+
+        # 빈 줄과 중복 문장은 제외
+        prompts = list(dict.fromkeys(
+            line.strip()
+            for line in corpus_path.read_text(encoding="utf-8").splitlines()
+            if line.strip()
+        ))
+        if not prompts:
+            self.stdout.write(self.style.WARNING("변환할 문장이 없습니다."))
+            return
+
+        synthesize_kwargs = {"voice_name": options["voice"]}
+        if options["encoding"]:
+            synthesize_kwargs["audio_encoding"] = options["encoding"]
+
+        success_count, failures = asyncio.run(self._warm(prompts, synthesize_kwargs))
+        for prompt, error in failures:
+            self.stderr.write(f"변환 실패: {prompt[:50]} ({error})")
+        self.stdout.write(self.style.SUCCESS(f"TTS 캐시 예열 완료: 성공 {success_count}/{len(prompts)}개"))
+
+    async def _warm(self, prompts, synthesize_kwargs):
+        tts_service = get_tts_service()
+        semaphore = asyncio.Semaphore(TTS_BATCH_CONCURRENCY)
+
+        async def _synthesize(prompt):
+            async with semaphore:
+                await tts_service.synthesize_speech(prompt, **synthesize_kwargs)
+
+        results = await asyncio.gather(*(_synthesize(prompt) for prompt in prompts), return_exceptions=True)
+        failures = [
+            (prompt, result)
+            for prompt, result in zip(prompts, results)
+            if isinstance(result, BaseException)
+        ]
+        return len(prompts) - len(failures), failures
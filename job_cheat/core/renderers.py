@@ -0,0 +1,27 @@
+"""DRF 응답 렌더러 모듈."""
+
+from __future__ import annotations
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+# datetime은 DRF 인코더로 넘겨 기존 응답 형식(UTC → "Z" 표기)을 그대로 유지한다.
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+class ORJSONRenderer(JSONRenderer):
+    """orjson으로 응답 본문을 직렬화하는 JSON 렌더러."""
+
+    _encoder = encoders.JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            # 들여쓰기 요청은 드물고 orjson이 임의 폭을 지원하지 않으므로 기본 렌더러에 맡긴다.
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return orjson.dumps(data, default=self._encoder.default, option=_ORJSON_OPTIONS)
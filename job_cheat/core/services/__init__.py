@@ -3,29 +3,32 @@
 Place Firestore-facing reusable functions here to keep views thin.
 """
 
-# RAG 시스템 서비스들
-from .rag_embedding_service import get_embedding_service, RAGEmbeddingService
-from .rag_vector_store import get_vector_store, RAGVectorStore
-from .pinecone_service import get_pinecone_service, PineconeService
-from .gemini_service import get_gemini_service, GeminiService
-from .rag_competency_evaluator import (
-    get_competency_evaluator,
-    RAGCompetencyEvaluator,
-)
-from .tts_service import get_tts_service, TTSService
+import importlib
 
-__all__ = [
-    'get_embedding_service',
-    'RAGEmbeddingService',
-    'get_vector_store',
-    'RAGVectorStore',
-    'get_pinecone_service',
-    'PineconeService',
-    'get_gemini_service',
-    'GeminiService',
-    'get_competency_evaluator',
-    'RAGCompetencyEvaluator',
-    'get_tts_service',
-    'TTSService',
-]
+# RAG 시스템 서비스들 (이름 → 하위 모듈)
+# 무거운 SDK(sentence-transformers, Pinecone, Gemini, TTS)는 처음 접근할 때 import한다.
+_LAZY_EXPORTS = {
+    'get_embedding_service': 'rag_embedding_service',
+    'RAGEmbeddingService': 'rag_embedding_service',
+    'get_vector_store': 'rag_vector_store',
+    'RAGVectorStore': 'rag_vector_store',
+    'get_pinecone_service': 'pinecone_service',
+    'PineconeService': 'pinecone_service',
+    'get_gemini_service': 'gemini_service',
+    'GeminiService': 'gemini_service',
+    'get_competency_evaluator': 'rag_competency_evaluator',
+    'RAGCompetencyEvaluator': 'rag_competency_evaluator',
+    'get_tts_service': 'tts_service',
+    'TTSService': 'tts_service',
+}
 
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
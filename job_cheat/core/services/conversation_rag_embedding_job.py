@@ -10,6 +10,7 @@ from datetime import datetime
 from threading import Thread
 from typing import Any, Dict, List, Optional
 
+import orjson
 from firebase_admin import firestore
 
 from .firebase_personas import update_persona_document
@@ -342,10 +343,9 @@ async def _evaluate_competency_with_citations(
         if evaluation_result:
             # JSON 파싱 (Gemini 서비스에서 이미 정리됨)
             try:
-                import json
-                evaluation_data = json.loads(evaluation_result.strip())
+                evaluation_data = orjson.loads(evaluation_result.strip())
                 return evaluation_data
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error(f"JSON 파싱 실패: {e}")
                 logger.error(f"원본 응답: {evaluation_result}")
                 return None
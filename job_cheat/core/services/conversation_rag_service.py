@@ -10,16 +10,22 @@ Firestore에 저장한 후 Pinecone에 임베딩하여 RAG 검색을 수행하
 
 import json
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 
 from .cohere_service import CohereService
 from .pinecone_service import PineconeService
 from .firebase_storage import download_persona_json
+from .rag_cache import get_rag_cache
 
 logger = logging.getLogger(__name__)
 
+QUERY_EMBEDDING_MODEL = "embed-multilingual-v3.0"
+QUERY_EMBEDDING_CACHE_MAX_ENTRIES = 8192
+
 
 class ConversationRAGServiceError(RuntimeError):
     """대화 RAG 서비스 관련 예외."""
@@ -32,6 +38,33 @@ class ConversationRAGService:
         """서비스 초기화."""
         self.cohere_service = CohereService()
         self.pinecone_service = PineconeService()
+        # 쿼리 문자열 → 검색용 임베딩 (사용자와 무관하므로 LRU로 공유)
+        self._query_embeddings: "OrderedDict[str, Tuple[float, ...]]" = OrderedDict()
+        self._query_embedding_lock = threading.Lock()
+
+    async def _embed_query(self, query: str) -> Optional[Tuple[float, ...]]:
+        """검색 쿼리 임베딩을 반환한다. 같은 쿼리는 캐시된 값을 재사용한다."""
+        with self._query_embedding_lock:
+            cached = self._query_embeddings.get(query)
+            if cached is not None:
+                self._query_embeddings.move_to_end(query)
+                return cached
+
+        embeddings = await self.cohere_service.embed_texts(
+            [query],
+            model=QUERY_EMBEDDING_MODEL,
+            input_type="search_query"
+        )
+        if not embeddings or not embeddings[0]:
+            return None
+
+        embedding = tuple(embeddings[0])
+        with self._query_embedding_lock:
+            self._query_embeddings[query] = embedding
+            self._query_embeddings.move_to_end(query)
+            while len(self._query_embeddings) > QUERY_EMBEDDING_CACHE_MAX_ENTRIES:
+                self._query_embeddings.popitem(last=False)
+        return embedding
     
     def process_conversation_json(self, user_id: str, document_id: str) -> List[Dict[str, Any]]:
         """
@@ -112,8 +145,6 @@ class ConversationRAGService:
         Returns:
             필터링된 벡터 리스트
         """
-        import json
-        
         # Pinecone 메타데이터 크기 제한 (40KB)
         MAX_METADATA_SIZE = 40 * 1024  # 40KB
         
@@ -163,8 +194,6 @@ class ConversationRAGService:
         Returns:
             축소된 벡터 또는 None (축소 실패 시)
         """
-        import json
-        
         # 텍스트 필드들을 축소할 수 있는 순서 (중요도 순)
         text_fields = ['assistant_text', 'text']
         
@@ -303,6 +332,8 @@ class ConversationRAGService:
                 logger.info(f"Pinecone 배치 {batch_num} 업로드 완료: {uploaded_count}/{total_vectors}개 벡터 업로드됨")
             
             logger.info(f"Pinecone 업로드 완료: 총 {uploaded_count}개 벡터 (namespace: {user_id})")
+            # 벡터가 바뀌었으므로 해당 사용자의 RAG 컨텍스트 캐시 무효화
+            get_rag_cache().invalidate(user_id)
             return True
             
         except Exception as exc:
@@ -332,24 +363,22 @@ class ConversationRAGService:
             
             # 1. 검색 단계: 쿼리 임베딩 및 유사도 검색
             logger.info(f"📤 쿼리 임베딩 생성 시작")
-            logger.info(f"   🔗 cohere_service.embed_texts 호출")
-            logger.info(f"   📋 모델: embed-multilingual-v3.0")
-            logger.info(f"   📋 입력 타입: search_query")
-            
-            query_embeddings = await self.cohere_service.embed_texts(
-                [query],
-                model="embed-multilingual-v3.0",
-                input_type="search_query"
-            )
-            
-            logger.info(f"📥 쿼리 임베딩 생성 완료")
-            logger.info(f"   📊 임베딩 수: {len(query_embeddings) if query_embeddings else 0}")
-            logger.info(f"   📊 임베딩 차원: {len(query_embeddings[0]) if query_embeddings and query_embeddings[0] else 0}")
+            query_embedding = await self._embed_query(query)
             
-            if not query_embeddings:
+            if not query_embedding:
                 logger.error(f"❌ 쿼리 임베딩 생성 실패")
                 raise ConversationRAGServiceError("쿼리 임베딩 생성 실패")
             
+            logger.info(f"📥 쿼리 임베딩 생성 완료")
+            logger.info(f"   📊 임베딩 차원: {len(query_embedding)}")
+            
+            # 유사한 쿼리로 조합한 컨텍스트가 캐시에 있으면 Pinecone 검색 생략
+            rag_cache = get_rag_cache()
+            cached_context = rag_cache.lookup(user_id, query_embedding, top_k)
+            if cached_context is not None:
+                logger.info(f"✅ RAG 컨텍스트 캐시 적중: {len(cached_context)}자")
+                return cached_context
+            
             # Pinecone에서 해당 사용자의 User 발화만 검색 (user_id namespace 사용)
             logger.info(f"📤 Pinecone 유사도 검색 시작")
             logger.info(f"   🔗 pinecone_service.query_similar 호출")
@@ -358,7 +387,7 @@ class ConversationRAGService:
             logger.info(f"   📋 namespace: {user_id}")
             
             search_response = self.pinecone_service.query_similar(
-                query_embeddings[0],
+                list(query_embedding),
                 top_k=top_k,
                 include_metadata=True,
                 namespace=user_id  # user_id를 namespace로 사용
@@ -370,6 +399,7 @@ class ConversationRAGService:
             matches = search_response.get('matches', [])
             if not matches:
                 logger.warning("해당 사용자의 대화에서 유사한 발화를 찾을 수 없습니다.")
+                rag_cache.insert(user_id, query_embedding, top_k, "")
                 return ""
             
             # 모든 매치를 처리하여 컨텍스트 조합
@@ -396,6 +426,8 @@ class ConversationRAGService:
             # 최종 컨텍스트 조합 (답변 → 질문 순서)
             final_context = "\n\n".join(context_parts)
             
+            rag_cache.insert(user_id, query_embedding, top_k, final_context)
+            
             logger.info(f"RAG 컨텍스트 검색 완료: {len(final_context)}자")
             return final_context
             
@@ -404,22 +436,33 @@ class ConversationRAGService:
             raise ConversationRAGServiceError(f"RAG 컨텍스트 검색 실패: {exc}") from exc
 
 
+_conversation_rag_service: Optional[ConversationRAGService] = None
+_conversation_rag_lock = threading.Lock()
+
+
+def get_conversation_rag_service() -> ConversationRAGService:
+    """대화 RAG 서비스 인스턴스를 반환합니다 (Cohere/Pinecone 클라이언트 재사용)."""
+    global _conversation_rag_service
+    if _conversation_rag_service is None:
+        with _conversation_rag_lock:
+            if _conversation_rag_service is None:
+                _conversation_rag_service = ConversationRAGService()
+    return _conversation_rag_service
+
+
 # 편의 함수들
 def process_conversation_json(user_id: str, document_id: str) -> List[Dict[str, Any]]:
     """Firebase Storage에서 대화 JSON 파일을 다운로드하여 청크 리스트를 반환합니다."""
-    service = ConversationRAGService()
-    return service.process_conversation_json(user_id, document_id)
+    return get_conversation_rag_service().process_conversation_json(user_id, document_id)
 
 
 
 
 async def embed_and_upsert_to_pinecone(chunks: List[Dict[str, Any]], user_id: str) -> bool:
     """User 발화를 임베딩하여 Pinecone에 업로드합니다."""
-    service = ConversationRAGService()
-    return await service.embed_and_upsert_to_pinecone(chunks, user_id)
+    return await get_conversation_rag_service().embed_and_upsert_to_pinecone(chunks, user_id)
 
 
 async def get_rag_context(query: str, user_id: str, top_k: int = 5) -> str:
     """RAG 검색을 통해 관련 컨텍스트를 조회합니다."""
-    service = ConversationRAGService()
-    return await service.get_rag_context(query, user_id, top_k)
\ No newline at end of file
+    return await get_conversation_rag_service().get_rag_context(query, user_id, top_k)
\ No newline at end of file
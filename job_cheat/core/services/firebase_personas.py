@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from uuid import uuid4
 
 from django.conf import settings
@@ -16,6 +19,13 @@ logger = logging.getLogger(__name__)
 USER_COLLECTION = "users"
 PERSONA_SUBCOLLECTION = "personas"
 
+# 페르소나 문서 캐시 설정 (읽기 전용 화면에서 반복 조회 방지)
+PERSONA_CACHE_MAX_ENTRIES = 4096
+PERSONA_CACHE_TTL_SECONDS = 300
+
+_persona_cache: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_persona_cache_lock = threading.Lock()
+
 
 class PersonaInputSaveError(RuntimeError):
     """페르소나 입력을 Firestore에 저장하는 과정에서 발생한 예외."""
@@ -81,6 +91,8 @@ def save_user_persona_input(
 
     try:
         doc_ref.set(firestore_payload)
+        # 쓰기 이후에 무효화해야 그 사이 조회가 이전 문서를 다시 캐시하지 않음
+        invalidate_persona_cache(user_id=user_id, persona_id=resolved_document_id)
         snapshot = doc_ref.get()
     except google_exceptions.GoogleAPICallError as exc:
         logger.exception("Firestore API 호출 도중 오류", extra={"user_id": user_id})
@@ -112,6 +124,34 @@ def get_persona_document(*, user_id: str, persona_id: str, db=None) -> Dict[str,
     return data
 
 
+def get_cached_persona_document(*, user_id: str, persona_id: str, db=None) -> Dict[str, Any]:
+    """TTL 캐시를 거쳐 페르소나 문서를 조회합니다.
+
+    임베딩 상태처럼 최신 값이 필요한 경우에는 get_persona_document를 사용합니다.
+    """
+    key = (user_id, persona_id)
+    with _persona_cache_lock:
+        entry = _persona_cache.get(key)
+        if entry is not None and entry[0] >= time.monotonic():
+            _persona_cache.move_to_end(key)
+            return dict(entry[1])
+
+    data = get_persona_document(user_id=user_id, persona_id=persona_id, db=db)
+
+    with _persona_cache_lock:
+        _persona_cache[key] = (time.monotonic() + PERSONA_CACHE_TTL_SECONDS, data)
+        _persona_cache.move_to_end(key)
+        while len(_persona_cache) > PERSONA_CACHE_MAX_ENTRIES:
+            _persona_cache.popitem(last=False)
+    return dict(data)
+
+
+def invalidate_persona_cache(*, user_id: str, persona_id: str) -> None:
+    """페르소나 문서가 변경되었을 때 캐시에서 제거합니다."""
+    with _persona_cache_lock:
+        _persona_cache.pop((user_id, persona_id), None)
+
+
 def update_persona_document(
     *,
     user_id: str,
@@ -132,6 +172,8 @@ def update_persona_document(
 
     try:
         doc_ref.set(payload, merge=merge)
+        # 쓰기 이후에 무효화해야 그 사이 조회가 이전 문서를 다시 캐시하지 않음
+        invalidate_persona_cache(user_id=user_id, persona_id=persona_id)
         snapshot = doc_ref.get()
     except google_exceptions.NotFound as exc:
         logger.warning("업데이트 대상 페르소나가 존재하지 않습니다: user_id=%s, persona_id=%s", user_id, persona_id)
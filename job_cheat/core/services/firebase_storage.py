@@ -1,7 +1,8 @@
 ﻿from __future__ import annotations
 
+import io
 import logging
-from typing import Any, Dict
+from typing import Any, BinaryIO, Dict, Union
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
@@ -10,6 +11,13 @@ from google.cloud import exceptions as gcloud_exceptions
 
 logger = logging.getLogger(__name__)
 
+# Storage 경로 템플릿
+_PERSONA_HTML_PATH_TEMPLATE = "users/{user_id}/html/{document_id}.html"
+_PERSONA_JSON_PATH_TEMPLATE = "users/{user_id}/json/{document_id}.json"
+_INTERVIEW_AUDIO_PATH_TEMPLATE = (
+    "users/{user_id}/interviews/{interview_session_id}/questions/{question_id}.{file_extension}"
+)
+
 
 class PersonaHtmlUploadError(RuntimeError):
     """페르소나 HTML 파일 업로드 중 발생한 예외."""
@@ -63,7 +71,7 @@ def upload_persona_html(
 
     bucket_instance = _resolve_bucket(bucket=bucket)
     # 요구사항에 따라 userid 기반으로 HTML 파일 저장 (document_id 사용)
-    blob_path = f"users/{user_id}/html/{document_id}.html"
+    blob_path = _PERSONA_HTML_PATH_TEMPLATE.format(user_id=user_id, document_id=document_id)
     blob = bucket_instance.blob(blob_path)
     blob.cache_control = cache_control
 
@@ -108,7 +116,7 @@ def upload_persona_json(
 
     bucket_instance = _resolve_bucket(bucket=bucket)
     # 요구사항에 따라 userid.json으로 저장 (document_id 사용)
-    blob_path = f"users/{user_id}/json/{document_id}.json"
+    blob_path = _PERSONA_JSON_PATH_TEMPLATE.format(user_id=user_id, document_id=document_id)
     blob = bucket_instance.blob(blob_path)
     blob.cache_control = cache_control
 
@@ -156,11 +164,17 @@ def upload_interview_audio(
     user_id: str,
     interview_session_id: str,
     question_id: str,
-    audio_data: bytes,
+    audio_data: Union[bytes, BinaryIO],
+    file_extension: str = "ogg",
+    content_type: str = "audio/ogg",
     bucket=None,
     cache_control: str = "public, max-age=3600",
 ) -> Dict[str, Any]:
-    """면접 질문 TTS 오디오 파일을 Storage에 업로드하고 메타데이터를 반환한다."""
+    """면접 질문 TTS 오디오 파일을 Storage에 업로드하고 메타데이터를 반환한다.
+
+    audio_data는 bytes 또는 파일 형태 객체를 받으며, 추가 복사 없이 스트림으로 업로드한다.
+    기본 형식은 OGG(Opus)이며 MP3는 file_extension="mp3", content_type="audio/mpeg"로 지정한다.
+    """
 
     if not user_id:
         raise ValueError("user_id 값이 필요합니다.")
@@ -172,13 +186,28 @@ def upload_interview_audio(
         raise ValueError("audio_data 값이 필요합니다.")
 
     bucket_instance = _resolve_bucket(bucket=bucket)
-    # 면접 오디오 파일 저장 경로: users/{user_id}/interviews/{session_id}/questions/{question_id}.mp3
-    blob_path = f"users/{user_id}/interviews/{interview_session_id}/questions/{question_id}.mp3"
+    blob_path = _INTERVIEW_AUDIO_PATH_TEMPLATE.format(
+        user_id=user_id,
+        interview_session_id=interview_session_id,
+        question_id=question_id,
+        file_extension=file_extension,
+    )
     blob = bucket_instance.blob(blob_path)
     blob.cache_control = cache_control
 
+    # bytes는 BytesIO로 감싸 버퍼를 공유한다 (복사본을 만들지 않음)
+    if isinstance(audio_data, (bytes, bytearray, memoryview)):
+        audio_stream = io.BytesIO(audio_data)
+        size = len(audio_data)
+    else:
+        audio_stream = audio_data
+        size = getattr(audio_data, "size", None)
+        if size is None:
+            size = audio_stream.seek(0, io.SEEK_END)
+        audio_stream.seek(0)
+
     try:
-        blob.upload_from_string(audio_data, content_type="audio/mpeg")
+        blob.upload_from_file(audio_stream, content_type=content_type, size=size, rewind=False)
         logger.info(f"면접 오디오 파일 Firebase Storage 업로드 성공: {blob_path}")
     except (gcloud_exceptions.GoogleCloudError, Exception) as exc:
         logger.exception("면접 오디오 파일 Firebase Storage 업로드 실패", extra={
@@ -196,8 +225,8 @@ def upload_interview_audio(
     
     return {
         "path": blob_path,
-        "content_type": "audio/mpeg",
-        "size": len(audio_data),
+        "content_type": content_type,
+        "size": size,
         "url": public_url,
     }
 
@@ -216,7 +245,7 @@ def download_persona_json(
         raise ValueError("document_id 값이 필요합니다.")
     
     bucket_instance = _resolve_bucket(bucket=bucket)
-    blob_path = f"users/{user_id}/json/{document_id}.json"
+    blob_path = _PERSONA_JSON_PATH_TEMPLATE.format(user_id=user_id, document_id=document_id)
     blob = bucket_instance.blob(blob_path)
     
     try:
@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from typing import Iterable, List, Optional
+import re
+import threading
+from typing import Any, Iterable, List, Optional
 
 import google.generativeai as genai
+import orjson
 from asgiref.sync import sync_to_async
 from dotenv import load_dotenv
 
 
 logger = logging.getLogger(__name__)
 
+# 프로세스 전체에서 동시에 진행할 Gemini 텍스트 생성 호출 수
+GEMINI_MAX_CONCURRENCY = int(os.getenv("GEMINI_MAX_CONCURRENCY", "20"))
+
 
 class GeminiServiceError(RuntimeError):
     """Gemini 연동 과정에서 발생한 예외."""
@@ -37,14 +44,28 @@ class GeminiService:
         )
 
         self._generative_model = genai.GenerativeModel(self.text_model)
+        self._concurrency = threading.BoundedSemaphore(GEMINI_MAX_CONCURRENCY)
+
+    def warm_up(self) -> None:
+        """과금되지 않는 토큰 계산 호출로 Gemini 연결을 미리 수립한다.
+
+        동기 클라이언트의 연결이므로 어느 스레드/이벤트 루프에서 호출해도 이후 요청이 재사용한다.
+        """
+
+        self._generative_model.count_tokens("ping")
 
     async def generate_structured_response(
         self,
         prompt: str,
         *,
         response_format: str = "json",
+        response_schema: Optional[Any] = None,
     ) -> str:
-        """프롬프트를 Gemini 모델에 전달해 응답을 반환한다."""
+        """프롬프트를 Gemini 모델에 전달해 응답을 반환한다.
+
+        response_schema(TypedDict 등)를 지정하면 Gemini 구조화 출력으로
+        응답이 해당 스키마를 따르도록 강제한다.
+        """
 
         if not prompt:
             raise ValueError("prompt 값이 비어 있습니다.")
@@ -73,23 +94,23 @@ class GeminiService:
         logger.info(f"📤 Gemini API 호출 시작 - 최종 프롬프트 길이: {len(json_prompt)}자")
         logger.info(f"🔗 API 연결 상태: 연결 시도 중...")
         
-        # sync_to_async 대신 직접 비동기 처리
-        def _call_model_sync() -> str:
-            try:
-                result = self._generative_model.generate_content(json_prompt)
-                return result
-            except Exception as exc:
-                logger.error(f"❌ Gemini 텍스트 생성 실패: {exc}")
-                logger.error(f"🔍 오류 타입: {type(exc).__name__}")
-                logger.error(f"📋 오류 상세: {str(exc)}")
-                raise GeminiServiceError(f"Gemini 텍스트 생성 실패: {exc}") from exc
-
-        # sync_to_async 대신 직접 비동기 처리 시도
-        logger.info(f"🔄 직접 API 호출 시작")
-        
+        generation_config = None
+        if response_schema is not None:
+            generation_config = genai.GenerationConfig(
+                response_mime_type="application/json",
+                response_schema=response_schema,
+            )
+
+        def _call_model_sync():
+            # 동시 호출 수를 제한해 쿼터 초과/대기열 지연을 막음 (요청별 이벤트 루프가 달라 스레드 세마포어 사용)
+            with self._concurrency:
+                return self._generative_model.generate_content(
+                    json_prompt, generation_config=generation_config
+                )
+
         try:
-            # 직접 generate_content 호출
-            result = self._generative_model.generate_content(json_prompt)
+            # 블로킹 SDK 호출은 스레드에서 실행해 이벤트 루프를 막지 않음
+            result = await asyncio.to_thread(_call_model_sync)
             logger.info(f"✅ 직접 API 호출 완료")
         except Exception as exc:
             logger.error(f"❌ 직접 API 호출 실패: {exc}")
@@ -132,9 +153,6 @@ class GeminiService:
     
     def _clean_json_response(self, response: str) -> str:
         """JSON 응답을 정리하여 순수 JSON만 반환합니다."""
-        import re
-        import json
-        
         # 마크다운 코드 블록 제거
         cleaned = response.strip()
         
@@ -160,13 +178,11 @@ class GeminiService:
     
     def _sanitize_json_string(self, json_str: str) -> str:
         """JSON 문자열에서 제어 문자를 안전하게 처리합니다."""
-        import json
-        
         try:
             # 먼저 JSON 파싱을 시도하여 유효성 검사
-            json.loads(json_str)
+            orjson.loads(json_str)
             return json_str
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             # 제어 문자를 이스케이프 처리
             sanitized = json_str.replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
             
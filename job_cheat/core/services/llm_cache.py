@@ -0,0 +1,91 @@
+"""
+Gemini 응답 메모리 캐시 모듈.
+
+프롬프트가 같으면 응답도 재사용할 수 있는 생성 호출(자기소개서, 면접 질문/평가)에서
+동일 프롬프트의 중복 호출과 동시 호출을 막는다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 기본 캐시 설정 (동일 프롬프트 재생성 방지)
+LLM_CACHE_MAX_ENTRIES = 1024
+LLM_CACHE_TTL_SECONDS = 24 * 60 * 60  # 1일
+
+
+class LLMResponseCache:
+    """프롬프트 해시(SHA-256)를 키로 Gemini 응답을 메모리에 캐싱한다 (TTL + LRU).
+
+    요청마다 이벤트 루프가 다를 수 있으므로 진행 중인 호출은 스레드 안전한
+    concurrent.futures.Future로 공유하여 동일 프롬프트의 중복 호출을 막는다.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+        ttl_seconds: int = LLM_CACHE_TTL_SECONDS,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(prompt: str) -> str:
+        return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+    def _get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def get_or_generate(self, prompt: str, generate) -> str:
+        """캐시에 있으면 반환하고, 없으면 generate()를 한 번만 호출해 결과를 저장한다."""
+        key = self.make_key(prompt)
+        with self._lock:
+            cached = self._get(key)
+            if cached is not None:
+                logger.info("✅ Gemini 응답 캐시 적중")
+                return cached
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                future = Future()
+                self._inflight[key] = future
+        if inflight is not None:
+            logger.info("⏳ 진행 중인 동일 Gemini 요청 결과 대기")
+            return await asyncio.wrap_future(inflight)
+
+        try:
+            value = await generate()
+        except BaseException as exc:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(exc)
+            raise
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._inflight.pop(key, None)
+        future.set_result(value)
+        return value
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import logging
 import os
 from typing import Iterable, List, Optional
 
 from dotenv import load_dotenv
 from pinecone import Pinecone, ServerlessSpec
 
+logger = logging.getLogger(__name__)
+
 
 class PineconeServiceError(RuntimeError):
     """Pinecone 연동 과정에서 발생한 예외."""
@@ -73,9 +76,6 @@ class PineconeService:
         include_metadata: bool = True,
         filter: Optional[dict] = None,
     ) -> dict:
-        import logging
-        logger = logging.getLogger(__name__)
-        
         logger.info(f"🔍 Pinecone 유사도 검색 시작")
         logger.info(f"   📊 벡터 차원: {len(vector) if vector else 0}")
         logger.info(f"   📋 namespace: {namespace}")
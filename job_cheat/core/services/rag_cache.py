@@ -0,0 +1,116 @@
+"""
+RAG 컨텍스트 시맨틱 캐시 모듈.
+
+쿼리 임베딩이 기존 쿼리와 충분히 가까우면(코사인 유사도 ≥ 1 - τ)
+Pinecone 검색 없이 이전에 조합한 컨텍스트를 재사용한다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+RAG_CACHE_MAX_ENTRIES_PER_USER = 256
+RAG_CACHE_TTL_SECONDS = 10 * 60  # 다른 프로세스의 업로드로 인한 불일치 상한
+RAG_CACHE_DEFAULT_TAU = 0.05
+
+
+class SemanticRAGCache:
+    """사용자별 (쿼리 임베딩 → RAG 컨텍스트) 근사 캐시 (LRU + TTL)."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = RAG_CACHE_MAX_ENTRIES_PER_USER,
+        ttl_seconds: int = RAG_CACHE_TTL_SECONDS,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # user_id → OrderedDict[entry_id, (만료 시각, top_k, 정규화 임베딩, 컨텍스트)]
+        self._entries: Dict[str, "OrderedDict[int, Tuple[float, int, np.ndarray, str]]"] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    def lookup(
+        self,
+        user_id: str,
+        query_embedding: Sequence[float],
+        top_k: int,
+        tau: float = RAG_CACHE_DEFAULT_TAU,
+    ) -> Optional[str]:
+        """유사한 쿼리로 조합한 컨텍스트가 있으면 반환한다."""
+        query = self._normalize(query_embedding)
+        if query is None:
+            return None
+
+        with self._lock:
+            entries = self._entries.get(user_id)
+            if not entries:
+                return None
+
+            now = time.monotonic()
+            for entry_id in [key for key, entry in entries.items() if entry[0] < now]:
+                del entries[entry_id]
+
+            candidates: List[Tuple[int, np.ndarray]] = [
+                (entry_id, entry[2])
+                for entry_id, entry in entries.items()
+                if entry[1] == top_k and entry[2].shape == query.shape
+            ]
+            if not candidates:
+                return None
+
+            # 정규화된 벡터끼리의 내적 = 코사인 유사도 (한 번의 행렬 연산으로 계산)
+            keys = np.stack([vector for _, vector in candidates])
+            similarities = keys @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] < 1.0 - tau:
+                return None
+
+            entry_id = candidates[best][0]
+            entries.move_to_end(entry_id)
+            return entries[entry_id][3]
+
+    def insert(
+        self,
+        user_id: str,
+        query_embedding: Sequence[float],
+        top_k: int,
+        context: str,
+    ) -> None:
+        """쿼리 임베딩과 조합된 컨텍스트를 저장한다."""
+        query = self._normalize(query_embedding)
+        if query is None:
+            return
+
+        with self._lock:
+            entries = self._entries.setdefault(user_id, OrderedDict())
+            self._next_id += 1
+            entries[self._next_id] = (time.monotonic() + self.ttl_seconds, top_k, query, context)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+    def invalidate(self, user_id: str) -> None:
+        """사용자의 벡터가 갱신되었을 때 캐시를 비운다."""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+
+_rag_cache = SemanticRAGCache()
+
+
+def get_rag_cache() -> SemanticRAGCache:
+    """RAG 시맨틱 캐시 인스턴스를 반환한다."""
+    return _rag_cache
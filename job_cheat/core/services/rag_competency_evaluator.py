@@ -5,12 +5,13 @@ Gemini 모델과 Firestore 벡터 저장소를 이용해 페르소나 역량을
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 from datetime import datetime
 from typing import Any, Dict, Iterable, List, Optional
 
+import orjson
+
 from .gemini_service import get_gemini_service
 from .job_competencies import JobCompetenciesService
 from .pinecone_service import get_pinecone_service, PineconeServiceError
@@ -396,7 +397,7 @@ class RAGCompetencyEvaluator:
                 if parsed is not None:
                     return parsed
                 return {"raw_response": response}
-        except json.JSONDecodeError as exc:
+        except orjson.JSONDecodeError as exc:
             logger.warning("Gemini 응답 JSON 파싱 실패: %s", exc)
             return {"raw_response": response}
         except Exception as exc:  # pragma: no cover - Gemini 호출 예외 래핑
@@ -421,8 +422,8 @@ class RAGCompetencyEvaluator:
             candidate = candidate[start : end + 1]
 
         try:
-            return json.loads(candidate)
-        except json.JSONDecodeError:
+            return orjson.loads(candidate)
+        except orjson.JSONDecodeError:
             logger.warning("Gemini 응답 JSON 파싱 실패: 원본 응답 일부=%s", candidate[:200])
             return None
 
@@ -7,6 +7,9 @@ from google.api_core import exceptions as google_exceptions
 
 from core.services.firebase_personas import (
     PersonaInputSaveError,
+    _persona_cache,
+    get_cached_persona_document,
+    invalidate_persona_cache,
     save_user_persona_input,
 )
 
@@ -81,3 +84,26 @@ class SaveUserPersonaInputTests(SimpleTestCase):
     def test_missing_user_id_raises_value_error(self):
         with self.assertRaises(ValueError):
             save_user_persona_input(user_id="", payload={}, db=MagicMock())
+
+
+class CachedPersonaDocumentTests(SimpleTestCase):
+    """페르소나 문서 TTL 캐시 동작을 검증한다."""
+
+    def setUp(self):
+        _persona_cache.clear()
+
+    def tearDown(self):
+        _persona_cache.clear()
+
+    def test_second_lookup_uses_cache_until_invalidated(self):
+        with patch(
+            "core.services.firebase_personas.get_persona_document",
+            return_value={"id": "persona-1", "major": "컴퓨터공학과"},
+        ) as mock_get:
+            first = get_cached_persona_document(user_id="user-123", persona_id="persona-1")
+            second = get_cached_persona_document(user_id="user-123", persona_id="persona-1")
+            invalidate_persona_cache(user_id="user-123", persona_id="persona-1")
+            get_cached_persona_document(user_id="user-123", persona_id="persona-1")
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_get.call_count, 2)
@@ -0,0 +1,38 @@
+import asyncio
+
+from django.test import SimpleTestCase
+
+from core.services.llm_cache import LLMResponseCache
+
+
+class LLMResponseCacheTests(SimpleTestCase):
+    """Gemini 응답 캐시의 적중/실패 처리 동작을 검증한다."""
+
+    def test_same_prompt_generates_once(self):
+        cache = LLMResponseCache()
+        calls = []
+
+        async def generate():
+            calls.append(1)
+            return '{"ok": true}'
+
+        async def run():
+            first = await cache.get_or_generate("prompt", generate)
+            second = await cache.get_or_generate("prompt", generate)
+            return first, second
+
+        self.assertEqual(asyncio.run(run()), ('{"ok": true}', '{"ok": true}'))
+        self.assertEqual(len(calls), 1)
+
+    def test_failed_generation_is_not_cached(self):
+        cache = LLMResponseCache()
+
+        async def fail():
+            raise ValueError("boom")
+
+        async def succeed():
+            return "value"
+
+        with self.assertRaises(ValueError):
+            asyncio.run(cache.get_or_generate("prompt", fail))
+        self.assertEqual(asyncio.run(cache.get_or_generate("prompt", succeed)), "value")
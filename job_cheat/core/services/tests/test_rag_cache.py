@@ -0,0 +1,28 @@
+from django.test import SimpleTestCase
+
+from core.services.rag_cache import SemanticRAGCache
+
+
+class SemanticRAGCacheTests(SimpleTestCase):
+    """RAG 시맨틱 캐시 조회/무효화 동작을 검증한다."""
+
+    def test_similar_query_hits_cache(self):
+        cache = SemanticRAGCache()
+        cache.insert("user-1", [1.0, 0.0, 0.0], 5, "context")
+
+        self.assertEqual(cache.lookup("user-1", [0.99, 0.05, 0.0], 5), "context")
+
+    def test_dissimilar_query_or_other_user_misses(self):
+        cache = SemanticRAGCache()
+        cache.insert("user-1", [1.0, 0.0, 0.0], 5, "context")
+
+        self.assertIsNone(cache.lookup("user-1", [0.0, 1.0, 0.0], 5))
+        self.assertIsNone(cache.lookup("user-2", [1.0, 0.0, 0.0], 5))
+        self.assertIsNone(cache.lookup("user-1", [1.0, 0.0, 0.0], 3))
+
+    def test_invalidate_clears_user_entries(self):
+        cache = SemanticRAGCache()
+        cache.insert("user-1", [1.0, 0.0, 0.0], 5, "context")
+        cache.invalidate("user-1")
+
+        self.assertIsNone(cache.lookup("user-1", [1.0, 0.0, 0.0], 5))
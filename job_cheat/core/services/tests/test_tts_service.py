@@ -0,0 +1,155 @@
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from core.services.tts_service import TTSService, TTSServiceError, _TTSCache, _split_sentences
+
+
+class TTSCacheTests(SimpleTestCase):
+    """TTS 메모리/디스크 캐시 동작을 검증한다."""
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self._tmp_dir.name)
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_key_depends_on_voice_parameters(self):
+        key_a = _TTSCache.make_key("안녕하세요", "ko-KR", "ko-KR-Wavenet-A", "NEUTRAL", "MP3")
+        key_b = _TTSCache.make_key("안녕하세요", "ko-KR", "ko-KR-Wavenet-B", "NEUTRAL", "MP3")
+        self.assertNotEqual(key_a, key_b)
+
+    def test_set_then_get_from_disk(self):
+        key = _TTSCache.make_key("질문", "ko-KR", "ko-KR-Wavenet-A", "NEUTRAL", "MP3")
+        _TTSCache(self.cache_dir).set(key, b"audio-bytes", {"encoding": "MP3"})
+
+        # 새 인스턴스는 메모리가 비어 있으므로 디스크에서 읽어야 한다.
+        self.assertEqual(_TTSCache(self.cache_dir).get(key), b"audio-bytes")
+
+    def test_memory_tier_evicts_least_recently_used(self):
+        cache = _TTSCache(self.cache_dir / "unused", max_entries=2)
+        cache._remember("a", b"1")
+        cache._remember("b", b"2")
+        cache.get("a")
+        cache._remember("c", b"3")
+
+        self.assertIn("a", cache._memory)
+        self.assertNotIn("b", cache._memory)
+
+    def test_expired_entry_is_ignored(self):
+        cache = _TTSCache(self.cache_dir, ttl_seconds=-1)
+        cache.set("expired", b"old", {})
+        cache._memory.clear()
+
+        self.assertIsNone(cache.get("expired"))
+
+
+class SplitSentencesTests(SimpleTestCase):
+    """긴 텍스트 분할 로직을 검증한다."""
+
+    def test_packs_sentences_up_to_limit(self):
+        chunks = _split_sentences("첫 문장입니다. 둘째 문장입니다! 셋째 문장인가요?", max_chars=20)
+        self.assertEqual(chunks, ["첫 문장입니다. 둘째 문장입니다!", "셋째 문장인가요?"])
+
+    def test_hard_splits_oversized_sentence(self):
+        chunks = _split_sentences("가" * 25, max_chars=10)
+        self.assertEqual([len(chunk) for chunk in chunks], [10, 10, 5])
+
+
+class SynthesizeSpeechBatchTests(SimpleTestCase):
+    """TTS 배치 변환 및 업로드 로직을 검증한다."""
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        with override_settings(TTS_CACHE_DIR=Path(self._tmp_dir.name)), patch.dict(
+            os.environ, {"FIREBASE_CREDENTIALS": "credentials.json"}
+        ):
+            self.service = TTSService()
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_failed_item_does_not_abort_batch(self):
+        async def fake_synthesize(text, **kwargs):
+            if text == "실패":
+                raise TTSServiceError("boom")
+            return text.encode("utf-8")
+
+        def fake_upload(*, user_id, interview_session_id, question_id, audio_data, **kwargs):
+            return {"path": question_id, "url": f"https://cdn/{question_id}", "size": len(audio_data)}
+
+        with patch.object(self.service, "synthesize_speech", side_effect=fake_synthesize), patch(
+            "core.services.firebase_storage.upload_interview_audio", side_effect=fake_upload
+        ):
+            results = asyncio.run(
+                self.service.synthesize_speech_to_firebase_batch(
+                    [("q1", "첫 질문"), ("q2", "실패"), ("q3", "셋째 질문")],
+                    user_id="user-123",
+                    interview_session_id="session-123",
+                )
+            )
+
+        self.assertEqual(results[0]["url"], "https://cdn/q1")
+        self.assertIsNone(results[1])
+        self.assertEqual(results[2]["path"], "q3")
+
+    def test_concurrent_identical_requests_are_coalesced(self):
+        calls = []
+
+        async def fake_request(**kwargs):
+            calls.append(kwargs["text"])
+            await asyncio.sleep(0)
+            return b"audio"
+
+        async def run():
+            return await asyncio.gather(
+                self.service.synthesize_speech("같은 질문"),
+                self.service.synthesize_speech("같은 질문"),
+            )
+
+        with patch.object(self.service, "_request_synthesis", side_effect=fake_request):
+            results = asyncio.run(run())
+
+        self.assertEqual(results, [b"audio", b"audio"])
+        self.assertEqual(calls, ["같은 질문"])
+        self.assertEqual(self.service._inflight, {})
+
+    def test_disk_cache_hit_skips_synthesis(self):
+        key = _TTSCache.make_key("저장된 질문", "ko-KR", "ko-KR-Wavenet-A", "NEUTRAL", "OGG_OPUS")
+        _TTSCache(self.service._cache.cache_dir).set(key, b"cached-audio", {"encoding": "OGG_OPUS"})
+
+        with patch.object(self.service, "_request_synthesis") as request_synthesis:
+            audio_data = asyncio.run(self.service.synthesize_speech("저장된 질문"))
+
+        self.assertEqual(audio_data, b"cached-audio")
+        request_synthesis.assert_not_called()
+        self.assertEqual(self.service._cache.get_memory(key), b"cached-audio")
+
+    def test_duplicate_texts_are_uploaded_once(self):
+        uploads = []
+
+        async def fake_synthesize(text, **kwargs):
+            return text.encode("utf-8")
+
+        def fake_upload(*, user_id, interview_session_id, question_id, audio_data, **kwargs):
+            uploads.append(question_id)
+            return {"path": question_id, "url": f"https://cdn/{question_id}", "size": len(audio_data)}
+
+        with patch.object(self.service, "synthesize_speech", side_effect=fake_synthesize), patch(
+            "core.services.firebase_storage.upload_interview_audio", side_effect=fake_upload
+        ):
+            results = asyncio.run(
+                self.service.synthesize_speech_to_firebase_batch(
+                    [("q1", "같은 질문"), ("q2", "다른 질문"), ("q3", "같은 질문")],
+                    user_id="user-123",
+                    interview_session_id="session-123",
+                )
+            )
+
+        self.assertEqual(sorted(uploads), ["q1", "q2"])
+        self.assertEqual(results[2]["url"], "https://cdn/q1")
@@ -3,46 +3,379 @@ Google Cloud Text-to-Speech API 연동 서비스
 """
 
 import os
+import re
+import json
+import time
+import asyncio
+import hashlib
 import logging
 import tempfile
-from typing import Optional, Dict, Any
-from google.cloud import texttospeech
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
 from dotenv import load_dotenv
+from django.conf import settings
+
+# google-cloud-texttospeech(gRPC 스택)는 무거우므로 실제 사용 시점에 import
+if TYPE_CHECKING:
+    from google.cloud import texttospeech
 
 logger = logging.getLogger(__name__)
 
+# gRPC 응답 최대 크기 (긴 오디오 응답 대비)
+GRPC_MAX_RECEIVE_MESSAGE_LENGTH = 30 * 1024 * 1024
+
+# 유휴 구간에도 HTTP/2 연결이 끊기지 않도록 keepalive ping 유지 (TLS 재협상 방지)
+GRPC_CHANNEL_OPTIONS = [
+    ("grpc.max_receive_message_length", GRPC_MAX_RECEIVE_MESSAGE_LENGTH),
+    ("grpc.keepalive_time_ms", 60 * 1000),
+    ("grpc.keepalive_timeout_ms", 20 * 1000),
+    ("grpc.keepalive_permit_without_calls", 1),
+]
+GOOGLE_CLOUD_SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
+
+# TTS 캐시 설정
+TTS_CACHE_MAX_ENTRIES = 256
+TTS_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # 7일
+
+# 오디오 인코딩별 (파일 확장자, Content-Type)
+# OGG_OPUS는 같은 음질에서 MP3보다 용량이 작아 기본값으로 사용하고, MP3는 호환용으로 유지
+AUDIO_ENCODING_FORMATS = {
+    "OGG_OPUS": ("ogg", "audio/ogg"),
+    "MP3": ("mp3", "audio/mpeg"),
+}
+DEFAULT_AUDIO_ENCODING = "OGG_OPUS"
+# 인코딩별 출력 샘플레이트 (음성 용도로 충분한 24kHz로 낮춰 Opus 비트레이트를 줄임)
+AUDIO_SAMPLE_RATE_HERTZ = {
+    "OGG_OPUS": 24000,
+}
+
+# 긴 텍스트 분할 기준 (길이가 길수록 TTS 지연이 급격히 늘어남)
+TTS_CHUNK_MAX_CHARS = 1500
+# 바이트 단위로 이어 붙여도 재생 가능한 인코딩 (MP3 프레임)
+# OGG_OPUS는 이어 붙이면 Ogg 체인 스트림이 되어 첫 링크까지만 재생하는 플레이어가 많으므로 제외
+CONCATENATABLE_ENCODINGS = {"MP3"}
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。！？])\s+")
+
+# 배치 변환 시 동시 요청 수 (TTS API 쿼터 보호)
+TTS_BATCH_CONCURRENCY = 8
+
+
+_ENV_LOADED = False
+
+
+def _ensure_env() -> None:
+    """.env 로드와 Google Cloud 인증 환경 변수 설정을 프로세스당 한 번만 수행한다."""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    load_dotenv()
+    # Google Cloud TTS는 GOOGLE_APPLICATION_CREDENTIALS 환경 변수를 사용
+    # (Firebase 쪽에서 이미 설정한 값은 덮어쓰지 않음)
+    firebase_credentials = os.getenv("FIREBASE_CREDENTIALS")
+    if firebase_credentials:
+        os.environ.setdefault("GOOGLE_APPLICATION_CREDENTIALS", firebase_credentials)
+    _ENV_LOADED = True
+
 
 class TTSServiceError(RuntimeError):
     """TTS 연동 과정에서 발생한 예외."""
 
 
+def _split_sentences(text: str, max_chars: int = TTS_CHUNK_MAX_CHARS) -> List[str]:
+    """텍스트를 문장 경계 기준으로 max_chars 이하 청크로 묶는다."""
+    chunks: List[str] = []
+    current = ""
+    for sentence in _SENTENCE_BOUNDARY.split(text.strip()):
+        # 한 문장이 기준보다 길면 강제로 자름
+        while len(sentence) > max_chars:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+        if not sentence:
+            continue
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class _TTSCache:
+    """TTS 변환 결과를 메모리(LRU)와 디스크 2단계로 캐싱한다."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        *,
+        max_entries: int = TTS_CACHE_MAX_ENTRIES,
+        ttl_seconds: int = TTS_CACHE_TTL_SECONDS,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        text: str,
+        language_code: str,
+        voice_name: str,
+        ssml_gender: str,
+        encoding: str,
+    ) -> str:
+        """캐시 키(SHA-256)를 생성한다."""
+        raw = "|".join((text, language_code, voice_name, ssml_gender, encoding))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.cache_dir / f"{key}.audio", self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """메모리 → 디스크 순으로 캐시를 조회한다."""
+        audio_data = self.get_memory(key)
+        if audio_data is not None:
+            return audio_data
+        return self.get_disk(key)
+
+    def get_memory(self, key: str) -> Optional[bytes]:
+        """메모리 캐시만 조회한다 (파일 I/O 없음)."""
+        with self._lock:
+            audio_data = self._memory.get(key)
+            if audio_data is not None:
+                self._memory.move_to_end(key)
+            return audio_data
+
+    def get_disk(self, key: str) -> Optional[bytes]:
+        """디스크 캐시를 조회하고, 적중하면 메모리 캐시에도 올린다 (블로킹 파일 I/O)."""
+        audio_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as meta_file:
+                metadata = json.load(meta_file)
+            if time.time() - metadata.get("created_at", 0) > self.ttl_seconds:
+                self._remove_files(key)
+                return None
+            audio_data = audio_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+        self._remember(key, audio_data)
+        return audio_data
+
+    def set(self, key: str, audio_data: bytes, metadata: Dict[str, Any]) -> None:
+        """캐시에 오디오 데이터를 저장한다 (디스크 저장은 원자적으로 교체)."""
+        self._remember(key, audio_data)
+        self.set_disk(key, audio_data, metadata)
+
+    def set_memory(self, key: str, audio_data: bytes) -> None:
+        """메모리 캐시에만 저장한다 (파일 I/O 없음)."""
+        self._remember(key, audio_data)
+
+    def set_disk(self, key: str, audio_data: bytes, metadata: Dict[str, Any]) -> None:
+        """디스크 캐시에만 저장한다 (블로킹 파일 I/O)."""
+        audio_path, meta_path = self._paths(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._atomic_write(audio_path, audio_data)
+            sidecar = {**metadata, "size": len(audio_data), "created_at": time.time()}
+            self._atomic_write(meta_path, json.dumps(sidecar, ensure_ascii=False).encode("utf-8"))
+        except OSError as exc:
+            logger.warning("TTS 디스크 캐시 저장 실패: %s", exc)
+
+    def _remember(self, key: str, audio_data: bytes) -> None:
+        with self._lock:
+            self._memory[key] = audio_data
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _atomic_write(self, path: Path, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def _remove_files(self, key: str) -> None:
+        for path in self._paths(key):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
 class TTSService:
     """Google Cloud Text-to-Speech API 연동 서비스."""
 
     def __init__(self) -> None:
-        load_dotenv()
+        _ensure_env()
 
         # Google Cloud 인증 정보 확인 (Firebase와 동일한 서비스 계정 사용)
         firebase_credentials = os.getenv("FIREBASE_CREDENTIALS")
         if not firebase_credentials:
             raise TTSServiceError("FIREBASE_CREDENTIALS 환경 변수가 설정되지 않았습니다.")
+        logger.info("Google Cloud 인증 설정: %s", os.getenv('GOOGLE_APPLICATION_CREDENTIALS'))
 
-        # Google Cloud TTS는 GOOGLE_APPLICATION_CREDENTIALS 환경 변수를 사용
-        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = firebase_credentials
-        logger.info(f"Google Cloud 인증 설정: {firebase_credentials}")
+        # gRPC asyncio 채널은 이벤트 루프에 묶이므로 루프별로 비동기 클라이언트를 보관
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, texttospeech.TextToSpeechAsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # 인증 정보(액세스 토큰)는 루프와 무관하므로 모든 루프의 채널이 공유
+        self._credentials = None
+        self._cache = _TTSCache(settings.TTS_CACHE_DIR)
+        # 캐시 키별로 진행 중인 변환 요청 (동시 요청 병합용)
+        self._inflight: Dict[str, "asyncio.Future[bytes]"] = {}
+        # (언어, 음성, 성별) / 인코딩별로 재사용하는 요청 설정 proto
+        self._voice_params: "Dict[Tuple[str, str, str], texttospeech.VoiceSelectionParams]" = {}
+        self._audio_configs: "Dict[str, texttospeech.AudioConfig]" = {}
 
-        try:
-            self.client = texttospeech.TextToSpeechClient()
-            logger.info("Google Cloud TTS 클라이언트 초기화 완료")
-        except Exception as e:
-            raise TTSServiceError(f"Google Cloud TTS 클라이언트 초기화 실패: {e}") from e
+    def _get_async_client(self) -> "texttospeech.TextToSpeechAsyncClient":
+        """현재 이벤트 루프에 대응하는 비동기 TTS 클라이언트를 반환합니다."""
+        from google.cloud import texttospeech
+        from google.cloud.texttospeech_v1.services.text_to_speech.transports import (
+            TextToSpeechGrpcAsyncIOTransport,
+        )
+
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            try:
+                channel = TextToSpeechGrpcAsyncIOTransport.create_channel(
+                    host="texttospeech.googleapis.com:443",
+                    credentials=self._get_credentials(),
+                    options=GRPC_CHANNEL_OPTIONS,
+                )
+                transport = TextToSpeechGrpcAsyncIOTransport(channel=channel)
+                client = texttospeech.TextToSpeechAsyncClient(transport=transport)
+            except Exception as e:
+                raise TTSServiceError(f"Google Cloud TTS 클라이언트 초기화 실패: {e}") from e
+            self._async_clients[loop] = client
+            logger.info("Google Cloud TTS 비동기 클라이언트 초기화 완료")
+        return client
+
+    def _get_credentials(self):
+        """gRPC 채널에 사용할 Google Cloud 인증 정보를 반환합니다 (최초 호출 시 로드)."""
+        if self._credentials is None:
+            import google.auth
+
+            self._credentials, _ = google.auth.default(scopes=GOOGLE_CLOUD_SCOPES)
+        return self._credentials
+
+    def warm_up(self) -> None:
+        """이벤트 루프와 무관한 준비(SDK import, 인증 정보 로드 및 토큰 발급)를 미리 수행합니다.
+
+        비동기 클라이언트(gRPC 채널)는 이벤트 루프에 묶이므로 여기서 만들지 않고,
+        요청을 처리하는 루프에서 처음 사용할 때 생성됩니다.
+        """
+        import google.auth.transport.requests
+        from google.cloud import texttospeech  # noqa: F401
+        from google.cloud.texttospeech_v1.services.text_to_speech.transports import (  # noqa: F401
+            TextToSpeechGrpcAsyncIOTransport,
+        )
+
+        self._get_credentials().refresh(google.auth.transport.requests.Request())
+        logger.info("Google Cloud TTS 예열 완료 (SDK 로드 및 인증 토큰 발급)")
+
+    async def _request_synthesis(
+        self,
+        text: str,
+        language_code: str,
+        voice_name: str,
+        ssml_gender: str,
+        audio_encoding: str
+    ) -> bytes:
+        """Google Cloud TTS API를 호출하여 오디오 데이터를 받아옵니다."""
+        from google.cloud import texttospeech
+
+        # 입력 텍스트 설정
+        synthesis_input = texttospeech.SynthesisInput(text=text)
+        
+        # 음성/오디오 설정 (불변 값이므로 조합별로 한 번만 생성하여 재사용)
+        voice_key = (language_code, voice_name, ssml_gender)
+        voice = self._voice_params.get(voice_key)
+        if voice is None:
+            voice = texttospeech.VoiceSelectionParams(
+                language_code=language_code,
+                name=voice_name,
+                ssml_gender=getattr(texttospeech.SsmlVoiceGender, ssml_gender)
+            )
+            self._voice_params[voice_key] = voice
+        
+        audio_config = self._audio_configs.get(audio_encoding)
+        if audio_config is None:
+            audio_config = texttospeech.AudioConfig(
+                audio_encoding=getattr(texttospeech.AudioEncoding, audio_encoding),
+                sample_rate_hertz=AUDIO_SAMPLE_RATE_HERTZ.get(audio_encoding, 0),
+            )
+            self._audio_configs[audio_encoding] = audio_config
+        
+        # TTS 요청 실행 (이벤트 루프를 막지 않도록 비동기 클라이언트 사용)
+        client = self._get_async_client()
+        response = await client.synthesize_speech(
+            request=texttospeech.SynthesizeSpeechRequest(
+                input=synthesis_input,
+                voice=voice,
+                audio_config=audio_config,
+            )
+        )
+        return response.audio_content
+
+    async def _synthesize_text(
+        self,
+        text: str,
+        language_code: str,
+        voice_name: str,
+        ssml_gender: str,
+        audio_encoding: str
+    ) -> bytes:
+        """
+        긴 텍스트는 문장 단위로 나누어 병렬 변환한 뒤 이어 붙입니다.
+        
+        바이트 연결이 안전한 인코딩(MP3)에서만 분할하며,
+        그 외 인코딩은 한 번의 요청으로 변환합니다.
+        """
+        if len(text) <= TTS_CHUNK_MAX_CHARS or audio_encoding not in CONCATENATABLE_ENCODINGS:
+            return await self._request_synthesis(
+                text=text,
+                language_code=language_code,
+                voice_name=voice_name,
+                ssml_gender=ssml_gender,
+                audio_encoding=audio_encoding
+            )
+        
+        chunks = _split_sentences(text)
+        logger.info("✂️ 긴 텍스트 분할 변환: %s자 → %s개 청크", len(text), len(chunks))
+        parts = await asyncio.gather(*(
+            self._request_synthesis(
+                text=chunk,
+                language_code=language_code,
+                voice_name=voice_name,
+                ssml_gender=ssml_gender,
+                audio_encoding=audio_encoding
+            )
+            for chunk in chunks
+        ))
+        return b"".join(parts)
 
     async def synthesize_speech(
         self,
         text: str,
         language_code: str = "ko-KR",
         voice_name: str = "ko-KR-Wavenet-A",
-        ssml_gender: str = "NEUTRAL"
+        ssml_gender: str = "NEUTRAL",
+        audio_encoding: str = DEFAULT_AUDIO_ENCODING
     ) -> bytes:
         """
         텍스트를 음성으로 변환합니다.
@@ -52,45 +385,72 @@ class TTSService:
             language_code: 언어 코드 (기본값: ko-KR)
             voice_name: 음성 이름 (기본값: ko-KR-Wavenet-A)
             ssml_gender: 음성 성별 (기본값: NEUTRAL)
+            audio_encoding: 오디오 인코딩 (기본값: OGG_OPUS, 호환용 MP3)
             
         Returns:
             bytes: 변환된 오디오 데이터
         """
         try:
-            logger.info(f"🎤 TTS 음성 변환 시작")
-            logger.info(f"   📝 변환할 텍스트: {text[:100] + '...' if len(text) > 100 else text}")
-            logger.info(f"   🌐 언어: {language_code}")
-            logger.info(f"   🎵 음성: {voice_name}")
+            # 로그 레벨이 INFO보다 높으면 로그 인자 계산 자체를 건너뜀
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("🎤 TTS 음성 변환 시작")
+                logger.info("   📝 변환할 텍스트: %.100s%s", text, "..." if len(text) > 100 else "")
+                logger.info("   🌐 언어: %s", language_code)
+                logger.info("   🎵 음성: %s", voice_name)
             
-            # 입력 텍스트 설정
-            synthesis_input = texttospeech.SynthesisInput(text=text)
+            # 캐시 조회 (메모리는 바로, 디스크는 이벤트 루프를 막지 않도록 스레드에서)
+            cache_key = _TTSCache.make_key(text, language_code, voice_name, ssml_gender, audio_encoding)
+            cached_audio = self._cache.get_memory(cache_key)
+            if cached_audio is None:
+                cached_audio = await asyncio.to_thread(self._cache.get_disk, cache_key)
+            if cached_audio is not None:
+                logger.info("✅ TTS 캐시 적중: %s bytes", len(cached_audio))
+                return cached_audio
             
-            # 음성 설정
-            voice = texttospeech.VoiceSelectionParams(
-                language_code=language_code,
-                name=voice_name,
-                ssml_gender=getattr(texttospeech.SsmlVoiceGender, ssml_gender)
-            )
+            # 동일한 요청이 이미 진행 중이면 그 결과를 함께 기다림 (중복 API 호출 방지)
+            loop = asyncio.get_running_loop()
+            inflight = self._inflight.get(cache_key)
+            if inflight is not None and inflight.get_loop() is loop:
+                logger.info("⏳ 진행 중인 동일 TTS 요청 결과 대기")
+                return await asyncio.shield(inflight)
             
-            # 오디오 설정 (MP3 형식)
-            audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.MP3
-            )
+            future = loop.create_future()
+            # 대기자가 없을 때 "exception was never retrieved" 경고 방지
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            self._inflight[cache_key] = future
+            try:
+                audio_data = await self._synthesize_text(
+                    text=text,
+                    language_code=language_code,
+                    voice_name=voice_name,
+                    ssml_gender=ssml_gender,
+                    audio_encoding=audio_encoding
+                )
+                future.set_result(audio_data)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                future.set_exception(e)
+                raise
+            finally:
+                if self._inflight.get(cache_key) is future:
+                    del self._inflight[cache_key]
             
-            # TTS 요청 실행
-            response = self.client.synthesize_speech(
-                input=synthesis_input,
-                voice=voice,
-                audio_config=audio_config
-            )
+            logger.info("✅ TTS 음성 변환 완료: %s bytes", len(audio_data))
             
-            audio_data = response.audio_content
-            logger.info(f"✅ TTS 음성 변환 완료: {len(audio_data)} bytes")
+            self._cache.set_memory(cache_key, audio_data)
+            await asyncio.to_thread(self._cache.set_disk, cache_key, audio_data, {
+                "language_code": language_code,
+                "voice_name": voice_name,
+                "ssml_gender": ssml_gender,
+                "encoding": audio_encoding,
+            })
             
             return audio_data
             
         except Exception as e:
-            logger.error(f"❌ TTS 음성 변환 실패: {e}")
+            logger.error("❌ TTS 음성 변환 실패: %s", e)
             raise TTSServiceError(f"TTS 음성 변환 실패: {e}") from e
 
     async def synthesize_speech_to_firebase(
@@ -101,7 +461,8 @@ class TTSService:
         question_id: str,
         language_code: str = "ko-KR",
         voice_name: str = "ko-KR-Wavenet-A",
-        ssml_gender: str = "NEUTRAL"
+        ssml_gender: str = "NEUTRAL",
+        audio_encoding: str = DEFAULT_AUDIO_ENCODING
     ) -> Dict[str, Any]:
         """
         텍스트를 음성으로 변환하여 Firebase Storage에 직접 업로드합니다.
@@ -114,55 +475,182 @@ class TTSService:
             language_code: 언어 코드
             voice_name: 음성 이름
             ssml_gender: 음성 성별
+            audio_encoding: 오디오 인코딩
             
         Returns:
             Dict[str, Any]: 업로드 결과 (path, url, size 등)
         """
         try:
-            logger.info(f"🎤 TTS 음성 변환 및 Firebase Storage 업로드 시작")
-            logger.info(f"   📝 변환할 텍스트: {text[:100] + '...' if len(text) > 100 else text}")
-            logger.info(f"   👤 사용자 ID: {user_id}")
-            logger.info(f"   🆔 세션 ID: {interview_session_id}")
-            logger.info(f"   🆔 질문 ID: {question_id}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("🎤 TTS 음성 변환 및 Firebase Storage 업로드 시작")
+                logger.info("   📝 변환할 텍스트: %.100s%s", text, "..." if len(text) > 100 else "")
+                logger.info("   👤 사용자 ID: %s", user_id)
+                logger.info("   🆔 세션 ID: %s", interview_session_id)
+                logger.info("   🆔 질문 ID: %s", question_id)
             
             # 음성 변환
             audio_data = await self.synthesize_speech(
                 text=text,
                 language_code=language_code,
                 voice_name=voice_name,
-                ssml_gender=ssml_gender
+                ssml_gender=ssml_gender,
+                audio_encoding=audio_encoding
             )
             
-            logger.info(f"✅ TTS 음성 변환 완료: {len(audio_data)} bytes")
+            logger.info("✅ TTS 음성 변환 완료: %s bytes", len(audio_data))
             
             # Firebase Storage에 직접 업로드
             from .firebase_storage import upload_interview_audio
-            upload_result = upload_interview_audio(
+            file_extension, content_type = AUDIO_ENCODING_FORMATS[audio_encoding]
+            # 블로킹 업로드는 스레드에서 실행해 이벤트 루프를 막지 않음
+            upload_result = await asyncio.to_thread(
+                upload_interview_audio,
                 user_id=user_id,
                 interview_session_id=interview_session_id,
                 question_id=question_id,
-                audio_data=audio_data
+                audio_data=audio_data,
+                file_extension=file_extension,
+                content_type=content_type
             )
+            # 업로드가 끝나면 오디오 버퍼 참조를 즉시 해제
+            del audio_data
             
-            logger.info(f"✅ Firebase Storage 업로드 완료")
-            logger.info(f"   📁 저장 경로: {upload_result['path']}")
-            logger.info(f"   🔗 URL: {upload_result['url']}")
-            logger.info(f"   📏 파일 크기: {upload_result['size']} bytes")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("✅ Firebase Storage 업로드 완료")
+                logger.info("   📁 저장 경로: %s", upload_result['path'])
+                logger.info("   🔗 URL: %s", upload_result['url'])
+                logger.info("   📏 파일 크기: %s bytes", upload_result['size'])
             
             return upload_result
             
         except Exception as e:
-            logger.error(f"❌ TTS Firebase Storage 업로드 실패: {e}")
+            logger.error("❌ TTS Firebase Storage 업로드 실패: %s", e)
             raise TTSServiceError(f"TTS Firebase Storage 업로드 실패: {e}") from e
 
+    async def synthesize_speech_batch(
+        self,
+        texts: List[str],
+        language_code: str = "ko-KR",
+        voice_name: str = "ko-KR-Wavenet-A",
+        ssml_gender: str = "NEUTRAL",
+        audio_encoding: str = DEFAULT_AUDIO_ENCODING
+    ) -> List[bytes]:
+        """
+        여러 텍스트를 동시에 음성으로 변환합니다.
+        
+        Args:
+            texts: 변환할 텍스트 목록
+            language_code: 언어 코드
+            voice_name: 음성 이름
+            ssml_gender: 음성 성별
+            audio_encoding: 오디오 인코딩
+            
+        Returns:
+            List[bytes]: 입력 순서와 동일한 오디오 데이터 목록
+        """
+        semaphore = asyncio.Semaphore(TTS_BATCH_CONCURRENCY)
+
+        async def _synthesize(text: str) -> bytes:
+            async with semaphore:
+                return await self.synthesize_speech(
+                    text=text,
+                    language_code=language_code,
+                    voice_name=voice_name,
+                    ssml_gender=ssml_gender,
+                    audio_encoding=audio_encoding
+                )
+
+        return await asyncio.gather(*(_synthesize(text) for text in texts))
+
+    async def synthesize_speech_to_firebase_batch(
+        self,
+        items: List[Tuple[str, str]],
+        user_id: str,
+        interview_session_id: str,
+        language_code: str = "ko-KR",
+        voice_name: str = "ko-KR-Wavenet-A",
+        ssml_gender: str = "NEUTRAL",
+        audio_encoding: str = DEFAULT_AUDIO_ENCODING
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        여러 질문을 동시에 음성으로 변환하여 Firebase Storage에 업로드합니다.
+        
+        Args:
+            items: (질문 ID, 텍스트) 목록
+            user_id: 사용자 ID
+            interview_session_id: 면접 세션 ID
+            language_code: 언어 코드
+            voice_name: 음성 이름
+            ssml_gender: 음성 성별
+            audio_encoding: 오디오 인코딩
+            
+        Returns:
+            List[Optional[Dict[str, Any]]]: 입력 순서와 동일한 업로드 결과 (실패한 항목은 None)
+        """
+        from .firebase_storage import upload_interview_audio
+
+        file_extension, content_type = AUDIO_ENCODING_FORMATS[audio_encoding]
+        logger.info("🎤 TTS 배치 변환 및 Firebase Storage 업로드 시작: %s개", len(items))
+        semaphore = asyncio.Semaphore(TTS_BATCH_CONCURRENCY)
+
+        async def _synthesize_and_upload(question_id: str, text: str) -> Optional[Dict[str, Any]]:
+            # 항목별로 변환이 끝나는 즉시 업로드를 시작하여 변환/업로드 지연을 겹치게 함
+            try:
+                async with semaphore:
+                    audio_data = await self.synthesize_speech(
+                        text=text,
+                        language_code=language_code,
+                        voice_name=voice_name,
+                        ssml_gender=ssml_gender,
+                        audio_encoding=audio_encoding
+                    )
+            except Exception as e:
+                logger.error("❌ TTS 음성 변환 실패: question_id=%s, 오류=%s", question_id, e)
+                return None
+
+            try:
+                async with semaphore:
+                    return await asyncio.to_thread(
+                        upload_interview_audio,
+                        user_id=user_id,
+                        interview_session_id=interview_session_id,
+                        question_id=question_id,
+                        audio_data=audio_data,
+                        file_extension=file_extension,
+                        content_type=content_type,
+                    )
+            except Exception as e:
+                logger.error("❌ TTS Firebase Storage 업로드 실패: question_id=%s, 오류=%s", question_id, e)
+                return None
+            finally:
+                # 업로드가 끝나면 오디오 버퍼 참조를 즉시 해제
+                del audio_data
+
+        # 같은 세션 안에서 텍스트가 같은 질문은 한 번만 변환/업로드하고 결과(URL)를 공유
+        unique_items: Dict[str, str] = {}
+        for question_id, text in items:
+            unique_items.setdefault(text, question_id)
+        unique_results = await asyncio.gather(
+            *(_synthesize_and_upload(question_id, text) for text, question_id in unique_items.items())
+        )
+        result_by_text = dict(zip(unique_items, unique_results))
+        results: List[Optional[Dict[str, Any]]] = [result_by_text[text] for _, text in items]
+
+        logger.info("✅ TTS 배치 처리 완료: 성공 %s/%s개", sum(1 for r in results if r), len(items))
+        return results
+
 
 # 전역 인스턴스
 _tts_service: Optional[TTSService] = None
+_tts_lock = threading.Lock()
 
 
 def get_tts_service() -> TTSService:
     """TTS 서비스 인스턴스를 반환합니다."""
     global _tts_service
     if _tts_service is None:
-        _tts_service = TTSService()
+        # 동시 첫 요청에서 클라이언트가 중복 생성되지 않도록 잠금 후 재확인
+        with _tts_lock:
+            if _tts_service is None:
+                _tts_service = TTSService()
     return _tts_service
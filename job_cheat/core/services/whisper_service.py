@@ -1,15 +1,59 @@
 """OpenAI Whisper STT 서비스 모듈."""
 
+import asyncio
+import io
 import logging
 import os
-import tempfile
-from typing import Optional
+import queue
+import threading
+import weakref
+from typing import TYPE_CHECKING, Optional
 
-import openai
 from dotenv import load_dotenv
 
+# OpenAI SDK(httpx 포함)는 무거우므로 실제 사용 시점에 import
+if TYPE_CHECKING:
+    import openai
+
 logger = logging.getLogger(__name__)
 
+# STT 요청 간 TCP/TLS 연결을 재사용하기 위한 커넥션 풀 설정
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 300
+
+# WebM 업로드 버퍼 풀 (최대 보관 개수로 메모리 상한을 제한)
+WEBM_BUFFER_POOL_SIZE = 16
+_buffer_pool: "queue.LifoQueue[io.BytesIO]" = queue.LifoQueue(maxsize=WEBM_BUFFER_POOL_SIZE)
+
+
+def _acquire_buffer() -> io.BytesIO:
+    """풀에서 재사용 가능한 버퍼를 꺼내고, 없으면 새로 만든다."""
+    try:
+        return _buffer_pool.get_nowait()
+    except queue.Empty:
+        return io.BytesIO()
+
+
+def _release_buffer(buffer: io.BytesIO) -> None:
+    """버퍼를 비운 뒤 풀에 반환한다 (풀이 가득 차면 버린다)."""
+    try:
+        buffer.seek(0)
+        buffer.truncate(0)
+        _buffer_pool.put_nowait(buffer)
+    except (BufferError, ValueError, queue.Full):
+        pass
+
+
+_ENV_LOADED = False
+
+
+def _ensure_env() -> None:
+    """.env 로드를 프로세스당 한 번만 수행한다."""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    load_dotenv()
+    _ENV_LOADED = True
+
 
 class WhisperServiceError(RuntimeError):
     """Whisper 연동 과정에서 발생한 예외."""
@@ -19,13 +63,73 @@ class WhisperService:
     """OpenAI Whisper STT API 연동 서비스."""
 
     def __init__(self) -> None:
-        load_dotenv()
+        _ensure_env()
 
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise WhisperServiceError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
 
-        self.client = openai.OpenAI(api_key=api_key)
+        self._api_key = api_key
+        # 인증서 로드 비용이 드는 SSL 컨텍스트는 루프와 무관하므로 모든 클라이언트가 공유
+        self._ssl_context = None
+        # httpx 비동기 커넥션 풀은 이벤트 루프에 묶이므로 루프별로 클라이언트를 보관
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, openai.AsyncOpenAI]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _get_async_client(self) -> "openai.AsyncOpenAI":
+        """현재 이벤트 루프에 대응하는 비동기 OpenAI 클라이언트를 반환합니다."""
+        import httpx
+        import openai
+
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = openai.AsyncOpenAI(
+                api_key=self._api_key,
+                http_client=httpx.AsyncClient(
+                    verify=self._get_ssl_context(),
+                    limits=httpx.Limits(keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS),
+                    timeout=httpx.Timeout(60.0, connect=10.0),
+                ),
+            )
+            self._async_clients[loop] = client
+        return client
+
+    def _get_ssl_context(self):
+        """httpx 클라이언트가 공유하는 SSL 컨텍스트를 반환합니다 (최초 호출 시 생성)."""
+        if self._ssl_context is None:
+            import ssl
+
+            import certifi
+
+            self._ssl_context = ssl.create_default_context(cafile=certifi.where())
+        return self._ssl_context
+
+    def warm_up(self) -> None:
+        """이벤트 루프와 무관한 준비(SDK import, SSL 컨텍스트 생성)를 미리 수행합니다.
+
+        비동기 클라이언트(httpx 커넥션 풀)는 이벤트 루프에 묶이므로 여기서 만들지 않고,
+        요청을 처리하는 루프에서 처음 사용할 때 생성됩니다.
+        """
+        import httpx  # noqa: F401
+        import openai  # noqa: F401
+
+        self._get_ssl_context()
+        logger.info("OpenAI Whisper 예열 완료 (SDK 로드 및 SSL 컨텍스트 생성)")
+
+    async def _transcribe(self, audio_file, language: str) -> str:
+        """OpenAI Whisper API로 음성 데이터를 텍스트로 변환합니다."""
+        client = self._get_async_client()
+        transcript = await client.audio.transcriptions.create(
+            model="whisper-1",
+            file=audio_file,
+            language=language,
+            # JSON 대신 원문 텍스트로 응답받아 파싱 비용 제거
+            response_format="text"
+        )
+        text = transcript if isinstance(transcript, str) else transcript.text
+        return text.strip()
 
     async def transcribe_audio(
         self,
@@ -34,22 +138,17 @@ class WhisperService:
     ) -> str:
         """음성 파일을 텍스트로 변환합니다."""
         try:
-            logger.info(f"음성 파일 변환 시작: {audio_file_path}")
+            logger.info("음성 파일 변환 시작: %s", audio_file_path)
             
             with open(audio_file_path, "rb") as audio_file:
-                transcript = self.client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    language=language
-                )
+                text = await self._transcribe(audio_file, language)
             
-            text = transcript.text.strip()
-            logger.info(f"음성 파일 변환 완료: {len(text)}자")
-            logger.info(f"📝 변환된 텍스트 내용: {text[:200] + '...' if len(text) > 200 else text}")
+            logger.info("음성 파일 변환 완료: %s자", len(text))
+            logger.info("📝 변환된 텍스트 내용: %.200s%s", text, "..." if len(text) > 200 else "")
             return text
             
         except Exception as e:
-            logger.error(f"음성 파일 변환 실패: {e}")
+            logger.error("음성 파일 변환 실패: %s", e)
             raise WhisperServiceError(f"음성 파일 변환 실패: {e}") from e
 
     async def transcribe_webm_file(
@@ -59,41 +158,40 @@ class WhisperService:
     ) -> str:
         """WebM 파일을 텍스트로 변환합니다."""
         try:
-            logger.info(f"🎤 WebM 파일 STT 변환 시작")
-            logger.info(f"   📁 파일명: {getattr(webm_file, 'name', 'Unknown')}")
-            logger.info(f"   📏 파일 크기: {getattr(webm_file, 'size', 'Unknown')} bytes")
-            
-            # 임시 파일로 저장
-            with tempfile.NamedTemporaryFile(suffix=".webm", delete=False) as temp_file:
-                for chunk in webm_file.chunks():
-                    temp_file.write(chunk)
-                temp_file_path = temp_file.name
-            
-            logger.info(f"📁 임시 파일 생성 완료: {temp_file_path}")
+            logger.info("🎤 WebM 파일 STT 변환 시작")
+            logger.info("   📁 파일명: %s", getattr(webm_file, 'name', 'Unknown'))
+            logger.info("   📏 파일 크기: %s bytes", getattr(webm_file, 'size', 'Unknown'))
             
+            # 임시 파일 없이 메모리 버퍼로 조립하여 바로 업로드 (버퍼는 풀에서 재사용)
+            buffer = _acquire_buffer()
             try:
-                # 음성 변환
-                text = await self.transcribe_audio(temp_file_path, language)
-                logger.info(f"✅ WebM 파일 STT 변환 완료")
-                return text
+                for chunk in webm_file.chunks():
+                    buffer.write(chunk)
+                buffer.seek(0)
+                
+                text = await self._transcribe(("audio.webm", buffer, "audio/webm"), language)
             finally:
-                # 임시 파일 삭제
-                if os.path.exists(temp_file_path):
-                    os.unlink(temp_file_path)
-                    logger.info(f"🗑️ 임시 파일 삭제 완료: {temp_file_path}")
+                _release_buffer(buffer)
+            logger.info("✅ WebM 파일 STT 변환 완료: %s자", len(text))
+            logger.info("📝 변환된 텍스트 내용: %.200s%s", text, "..." if len(text) > 200 else "")
+            return text
                     
         except Exception as e:
-            logger.error(f"WebM 파일 변환 실패: {e}")
+            logger.error("WebM 파일 변환 실패: %s", e)
             raise WhisperServiceError(f"WebM 파일 변환 실패: {e}") from e
 
 
 # 전역 인스턴스
 _whisper_service: Optional[WhisperService] = None
+_whisper_lock = threading.Lock()
 
 
 def get_whisper_service() -> WhisperService:
     """Whisper 서비스 인스턴스를 반환합니다."""
     global _whisper_service
     if _whisper_service is None:
-        _whisper_service = WhisperService()
+        # 동시 첫 요청에서 클라이언트가 중복 생성되지 않도록 잠금 후 재확인
+        with _whisper_lock:
+            if _whisper_service is None:
+                _whisper_service = WhisperService()
     return _whisper_service
@@ -1,3 +1,11 @@
+import functools
+import inspect
+import logging
+import time
+
+from rest_framework import status
+from rest_framework.response import Response
+
 def create_persona_card(persona_data: dict) -> dict:
     """
     페르소나 데이터에서 persona_card 정보를 추출합니다.
@@ -16,3 +24,99 @@ def create_persona_card(persona_data: dict) -> dict:
         'skills': persona_data.get('skills', []),
         'certifications': persona_data.get('certifications', [])
     }
+
+
+def log_call(description: str):
+    """
+    뷰 함수의 요청 시작/종료를 INFO 레벨로 한 줄씩 기록하는 데코레이터입니다.
+
+    @api_view 아래에 적용하며, 종료 로그에는 응답 상태 코드와 처리 시간을 남깁니다.
+    async 뷰에 적용하면 async 래퍼를 반환합니다.
+    
+    Args:
+        description (str): 로그에 표시할 기능 이름
+    """
+    def decorator(view_func):
+        view_logger = logging.getLogger(view_func.__module__)
+
+        def _log_start(request):
+            view_logger.info("▶️ %s 요청 시작: %s %s", description, request.method, request.path)
+            return time.perf_counter()
+
+        def _log_end(response, started):
+            view_logger.info(
+                "⏹️ %s 요청 종료: status=%s (%.1fms)",
+                description,
+                getattr(response, "status_code", None),
+                (time.perf_counter() - started) * 1000,
+            )
+
+        if inspect.iscoroutinefunction(view_func):
+            @functools.wraps(view_func)
+            async def async_wrapper(request, *args, **kwargs):
+                started = _log_start(request)
+                response = await view_func(request, *args, **kwargs)
+                _log_end(response, started)
+                return response
+
+            return async_wrapper
+
+        @functools.wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            started = _log_start(request)
+            response = view_func(request, *args, **kwargs)
+            _log_end(response, started)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def require_auth_and_persona(view_func):
+    """
+    인증된 사용자와 persona_id 쿼리 파라미터를 확인하는 뷰 데코레이터입니다.
+
+    사용자 uid가 없으면 401, persona_id가 없으면 400을 반환하고,
+    통과하면 user_id/persona_id를 키워드 인자로 넘겨 뷰를 호출합니다.
+    async 뷰에 적용하면 async 래퍼를 반환합니다.
+    """
+    view_logger = logging.getLogger(view_func.__module__)
+
+    def _resolve(request):
+        user_id = getattr(getattr(request, 'user', None), 'uid', None)
+        if not user_id:
+            view_logger.warning("❌ 인증되지 않은 사용자")
+            return None, None, Response(
+                {"error": "인증된 사용자만 접근할 수 있습니다."},
+                status=status.HTTP_401_UNAUTHORIZED
+            )
+
+        persona_id = request.query_params.get('persona_id')
+        if not persona_id:
+            view_logger.warning("❌ persona_id 파라미터 누락")
+            return None, None, Response(
+                {"error": "persona_id 파라미터가 필요합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return user_id, persona_id, None
+
+    if inspect.iscoroutinefunction(view_func):
+        @functools.wraps(view_func)
+        async def async_wrapper(request, *args, **kwargs):
+            user_id, persona_id, error_response = _resolve(request)
+            if error_response is not None:
+                return error_response
+            return await view_func(request, *args, user_id=user_id, persona_id=persona_id, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        user_id, persona_id, error_response = _resolve(request)
+        if error_response is not None:
+            return error_response
+        return view_func(request, *args, user_id=user_id, persona_id=persona_id, **kwargs)
+
+    return wrapper
@@ -1,7 +1,10 @@
 from rest_framework import serializers
-from typing import List, Dict, Any
+from typing import Annotated, List, Dict, Any, Literal, TypedDict
+from pydantic import StringConstraints, TypeAdapter, ValidationError
 from core.serializers import DynamicFieldsMixin, TimestampedSerializer
 
+COVER_LETTER_STYLES = ["experience", "knowledge", "creative"]
+
 
 class CoverLetterParagraphSerializer(serializers.Serializer):
     """자기소개서 문단 시리얼라이저."""
@@ -61,6 +64,57 @@ class CoverLetterRequestSerializer(serializers.Serializer):
         return value.strip()
 
 
+# 생성 요청 본문은 필드별 run_validation 대신 pydantic TypeAdapter로 한 번에 검증한다.
+# (CoverLetterRequestSerializer와 같은 규칙: 앞뒤 공백 제거, 빈 값 불가, 최대 길이, 스타일 선택지)
+def _required_text(max_length: int):
+    return Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=max_length)]
+
+
+class _CoverLetterRequest(TypedDict):
+    user_id: _required_text(100)
+    persona_id: _required_text(100)
+    company_name: _required_text(200)
+    strengths: _required_text(1000)
+    activities: _required_text(1000)
+    style: Literal["experience", "knowledge", "creative"]
+
+
+_validate_cover_letter_request = TypeAdapter(_CoverLetterRequest).validate_python
+
+# 필수 값 누락/빈 값일 때의 필드별 오류 메시지
+_REQUIRED_FIELD_MESSAGES = {
+    "user_id": "user_id는 필수입니다.",
+    "persona_id": "persona_id는 필수입니다.",
+    "company_name": "지원 회사 이름은 필수입니다.",
+    "strengths": "본인의 강점은 필수입니다.",
+    "activities": "관련 활동 정보는 필수입니다.",
+    "style": "자기소개서 스타일은 필수입니다.",
+}
+
+
+def validate_cover_letter_request(data):
+    """
+    자기소개서 생성 요청 본문을 검증합니다.
+
+    Returns:
+        tuple: (검증된 데이터, None) 또는 (None, DRF 형식의 필드별 오류 dict)
+    """
+    try:
+        return _validate_cover_letter_request(data), None
+    except ValidationError as exc:
+        errors: Dict[str, List[str]] = {}
+        for error in exc.errors():
+            field = str(error["loc"][0]) if error["loc"] else "non_field_errors"
+            if error["type"] in ("missing", "string_too_short") and field in _REQUIRED_FIELD_MESSAGES:
+                message = _REQUIRED_FIELD_MESSAGES[field]
+            elif error["type"] == "literal_error":
+                message = f"자기소개서 스타일은 {COVER_LETTER_STYLES} 중 하나여야 합니다."
+            else:
+                message = error["msg"]
+            errors.setdefault(field, []).append(message)
+        return None, errors
+
+
 class CoverLetterResponseSerializer(serializers.Serializer):
     """자기소개서 응답 시리얼라이저."""
     id = serializers.CharField(help_text="자기소개서 ID")
@@ -74,6 +128,14 @@ class CoverLetterResponseSerializer(serializers.Serializer):
     updated_at = serializers.DateTimeField(help_text="수정일시")
 
 
+class CoverLetterJobSerializer(serializers.Serializer):
+    """자기소개서 생성 작업 상태 시리얼라이저."""
+    job_id = serializers.CharField(help_text="생성 작업 ID")
+    status = serializers.CharField(help_text="작업 상태 (queued/running/completed/failed)")
+    cover_letter_id = serializers.CharField(allow_null=True, required=False, help_text="생성된 자기소개서 ID (완료 시)")
+    error = serializers.CharField(allow_null=True, required=False, help_text="실패 사유 (실패 시)")
+
+
 class CoverLetterSummarySerializer(serializers.Serializer):
     """자기소개서 요약 시리얼라이저."""
     id = serializers.CharField(help_text="자기소개서 ID")
@@ -86,8 +148,13 @@ class CoverLetterSummarySerializer(serializers.Serializer):
 class CoverLetterListResponseSerializer(serializers.Serializer):
     """자기소개서 목록 응답 시리얼라이저."""
     cover_letters = CoverLetterSummarySerializer(many=True, help_text="자기소개서 목록")
-    total_count = serializers.IntegerField(help_text="총 개수")
+    total_count = serializers.IntegerField(help_text="총 개수 (페이지와 무관한 전체 자기소개서 수)")
     persona_card = serializers.DictField(help_text="페르소나 카드 데이터")
+    next_cursor = serializers.CharField(
+        allow_null=True,
+        required=False,
+        help_text="다음 페이지 조회 시 cursor로 전달할 값 (마지막 페이지면 null)",
+    )
 
 
 class HealthSerializer(serializers.Serializer):
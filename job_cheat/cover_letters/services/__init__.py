@@ -3,6 +3,9 @@
 from .cover_letter_service import (
     CoverLetterService,
     CoverLetterServiceError,
+    InvalidCoverLetterCursorError,
+    COVER_LETTER_SUMMARY_FIELDS,
+    count_cover_letters,
     generate_cover_letter,
     get_cover_letters,
     get_cover_letter_detail,
@@ -11,6 +14,9 @@ from .cover_letter_service import (
 __all__ = [
     "CoverLetterService",
     "CoverLetterServiceError", 
+    "InvalidCoverLetterCursorError",
+    "COVER_LETTER_SUMMARY_FIELDS",
+    "count_cover_letters",
     "generate_cover_letter",
     "get_cover_letters",
     "get_cover_letter_detail",
@@ -0,0 +1,144 @@
+"""
+자기소개서 생성(LLM 호출)을 요청 스레드 밖에서 실행하는 백그라운드 작업 모듈.
+
+생성 요청은 작업 문서를 만든 뒤 바로 반환하고, 작업 상태와 결과(cover_letter_id)는
+users/{user_id}/personas/{persona_id}/cover_letter_jobs/{job_id} 문서에 기록된다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from firebase_admin import firestore
+
+from .cover_letter_service import (
+    PERSONA_SUBCOLLECTION,
+    USER_COLLECTION,
+    generate_cover_letter,
+)
+
+logger = logging.getLogger(__name__)
+
+COVER_LETTER_JOB_SUBCOLLECTION = "cover_letter_jobs"
+
+# 작업 문서의 status 값
+JOB_STATUS_QUEUED = "queued"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_COMPLETED = "completed"
+JOB_STATUS_FAILED = "failed"
+
+# 동시에 실행되는 생성 작업 수 상한 (초과 요청은 queued 상태로 대기)
+COVER_LETTER_JOB_MAX_WORKERS = 4
+
+_executor = ThreadPoolExecutor(
+    max_workers=COVER_LETTER_JOB_MAX_WORKERS, thread_name_prefix="cover-letter-job"
+)
+
+
+def enqueue_cover_letter_job(
+    *,
+    user_id: str,
+    persona_id: str,
+    company_name: str,
+    strengths: str,
+    activities: str,
+    style: str,
+) -> str:
+    """자기소개서 생성 작업 문서를 만들고 백그라운드 작업을 시작한 뒤 작업 ID를 반환한다."""
+
+    if not user_id:
+        raise ValueError("user_id 값이 필요합니다.")
+    if not persona_id:
+        raise ValueError("persona_id 값이 필요합니다.")
+
+    job_id = str(uuid.uuid4())
+    _job_ref(user_id, persona_id, job_id).set(
+        {
+            "status": JOB_STATUS_QUEUED,
+            "company_name": company_name,
+            "style": style,
+            "cover_letter_id": None,
+            "error": None,
+            "created_at": firestore.SERVER_TIMESTAMP,
+            "updated_at": firestore.SERVER_TIMESTAMP,
+        }
+    )
+
+    _executor.submit(
+        _run_cover_letter_job, job_id, user_id, persona_id, company_name, strengths, activities, style
+    )
+    return job_id
+
+
+def get_cover_letter_job(user_id: str, persona_id: str, job_id: str) -> Optional[Dict[str, Any]]:
+    """작업 문서를 조회한다. 없으면 None을 반환한다."""
+
+    snapshot = _job_ref(user_id, persona_id, job_id).get()
+    if not snapshot.exists:
+        return None
+    return {**snapshot.to_dict(), "job_id": snapshot.id}
+
+
+def _run_cover_letter_job(
+    job_id: str,
+    user_id: str,
+    persona_id: str,
+    company_name: str,
+    strengths: str,
+    activities: str,
+    style: str,
+) -> None:
+    """새로운 이벤트 루프에서 자기소개서 생성 작업을 실행한다."""
+
+    _update_job(user_id, persona_id, job_id, {"status": JOB_STATUS_RUNNING})
+    try:
+        cover_letter = asyncio.run(
+            generate_cover_letter(
+                user_id=user_id,
+                persona_id=persona_id,
+                company_name=company_name,
+                strengths=strengths,
+                activities=activities,
+                style=style,
+            )
+        )
+    except Exception as exc:
+        logger.exception("자기소개서 생성 백그라운드 작업이 실패했습니다: job_id=%s", job_id)
+        _update_job(user_id, persona_id, job_id, {"status": JOB_STATUS_FAILED, "error": str(exc)})
+        return
+
+    _update_job(
+        user_id,
+        persona_id,
+        job_id,
+        {"status": JOB_STATUS_COMPLETED, "cover_letter_id": cover_letter["id"]},
+    )
+    logger.info("자기소개서 생성 백그라운드 작업 완료: job_id=%s, cover_letter_id=%s", job_id, cover_letter["id"])
+
+
+def _job_ref(user_id: str, persona_id: str, job_id: str):
+    db = getattr(settings, "FIREBASE_DB", None)
+    if db is None:
+        raise RuntimeError("Firestore 클라이언트를 찾을 수 없습니다.")
+    return (
+        db.collection(USER_COLLECTION)
+        .document(user_id)
+        .collection(PERSONA_SUBCOLLECTION)
+        .document(persona_id)
+        .collection(COVER_LETTER_JOB_SUBCOLLECTION)
+        .document(job_id)
+    )
+
+
+def _update_job(user_id: str, persona_id: str, job_id: str, payload: Dict[str, Any]) -> None:
+    """작업 문서에 상태를 기록한다."""
+
+    try:
+        _job_ref(user_id, persona_id, job_id).update({**payload, "updated_at": firestore.SERVER_TIMESTAMP})
+    except Exception:
+        logger.exception("자기소개서 생성 작업 상태를 Firestore에 기록하지 못했습니다: job_id=%s", job_id)
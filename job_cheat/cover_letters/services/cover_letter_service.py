@@ -8,18 +8,25 @@
 지원 회사에 맞는 자기소개서를 생성하는 서비스를 제공합니다.
 """
 
-import json
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+import threading
+from concurrent.futures import Future
+from string import Template
+from typing import Dict, List, Any, NotRequired, Optional, Tuple, TypedDict
+from datetime import datetime, timezone
 
+import orjson
 from django.conf import settings
+from pydantic import TypeAdapter, ValidationError
 from firebase_admin import firestore
 from google.api_core import exceptions as google_exceptions
 
-from core.services.firebase_personas import get_persona_document, PersonaNotFoundError
+from core.services.firebase_personas import get_cached_persona_document, PersonaNotFoundError
 from core.services.conversation_rag_service import get_rag_context
 from core.services.gemini_service import get_gemini_service
+from core.services.llm_cache import LLMResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -27,11 +34,177 @@ USER_COLLECTION = "users"
 PERSONA_SUBCOLLECTION = "personas"
 COVER_LETTER_SUBCOLLECTION = "cover_letter"
 
+# 목록 조회 시 서버에서 프로젝션할 요약 필드 (paragraph/reason 본문 제외)
+COVER_LETTER_SUMMARY_FIELDS = ["company_name", "created_at", "character_count", "style"]
+COVER_LETTER_LIST_DEFAULT_LIMIT = 20
+COVER_LETTER_LIST_MAX_LIMIT = 100
+
+# 스타일별 가이드라인
+_STYLE_GUIDELINES = {
+    "experience": "구체적인 프로젝트 경험, 성과, 도전과제 해결 과정을 중심으로 작성하세요.",
+    "knowledge": "전문 지식, 기술적 이해도, 학습 과정을 중심으로 작성하세요. 이론적 배경과 실무 적용 사례를 강조하세요.",
+    "creative": "독창적인 아이디어, 혁신적 사고, 창의적 문제 해결 과정을 중심으로 작성하세요. 상상력과 비전을 표현하세요."
+}
+_DEFAULT_STYLE_GUIDE = "균형 잡힌 자기소개서를 작성하세요."
+
+# 자기소개서에 도움이 될 만한 대화 검색용 고정 키워드 (미리 join)
+_RAG_QUERY_TAIL = " ".join((
+    "프로젝트 경험",
+    "성과",
+    "도전",
+    "성장",
+    "문제 해결",
+    "리더십",
+    "협업",
+    "기술",
+    "목표",
+    "성격",
+    "가치관",
+))
+
+# 정적 지시문(요구사항/응답 형식)을 앞에, 요청별 데이터를 뒤에 배치해
+# Gemini 암묵적 컨텍스트 캐시가 공통 접두부를 재사용할 수 있도록 한다.
+_PROMPT_TEMPLATE_SOURCE = """
+당신은 취업 전문가입니다. 아래 지원 정보와 개인 정보, 관련 대화 내역을 바탕으로 지원 회사에 제출할 자기소개서를 작성해주세요.
+
+## 요구사항
+1. 자기소개서는 여러개의 문단으로 구성해주세요.
+2. 각 문단마다 자연스러운 연결과 전환을 포함해주세요.
+3. 각 문단마다 작성 이유를 포함해주세요. 
+4. RAG 검색 결과에서 찾은 관련 경험을 적절히 활용해주세요.
+5. 관련 대화 내역을 토대로 작성한 문단이라면 그 내용을 이유로 포함해주세요.
+6. 회사와 직무에 맞는 구체적인 경험과 성과를 포함해주세요.
+7. 스타일 가이드라인: $style_guide
+
+## 응답 형식
+다음 JSON 형식으로 응답해주세요:
+{
+  "cover_letter": [
+    {
+      "paragraph": "문단 내용",
+      "reason": "이 문단을 작성한 이유"
+    },
+    {
+      "paragraph": "문단 내용", 
+      "reason": "이 문단을 작성한 이유"
+    }
+  ],
+  "style": "$style",
+  "character_count": 0
+}
+
+## 지원 정보
+- 회사명: $company_name
+- 직무 분야: $job_category
+- 직무 역할: $job_role
+- 본인의 강점: $strengths
+- 관련 활동: $activities
+- 자기소개서 스타일: $style
+
+## 개인 정보
+- 학력: $school_name $major
+- 보유 기술: $skills_csv
+- 자격증: $certifications_csv
+- 평가 결과: $final_evaluation
+
+## 관련 대화 내역 (RAG 검색 결과)
+$rag_context
+"""
+
+
+def _build_prompt_template(style: str, style_guide: str) -> Template:
+    """스타일 관련 부분을 미리 채운 프롬프트 템플릿을 만듭니다."""
+    source = Template(_PROMPT_TEMPLATE_SOURCE).safe_substitute(
+        style=style.replace("$", "$$"),
+        style_guide=style_guide,
+    )
+    return Template(source)
+
+
+# 스타일별로 미리 특수화한 프롬프트 템플릿 (요청마다 정적 부분을 다시 만들지 않음)
+_PROMPT_TEMPLATES: Dict[str, Template] = {
+    style: _build_prompt_template(style, guide) for style, guide in _STYLE_GUIDELINES.items()
+}
+
+
+class _CoverLetterParagraph(TypedDict):
+    paragraph: str
+    reason: str
+
+
+class _CoverLetterPayload(TypedDict):
+    """Gemini 자기소개서 응답 스키마 (Gemini response_schema 및 응답 검증에 공용)."""
+
+    cover_letter: List[_CoverLetterParagraph]
+    style: str
+    character_count: NotRequired[int]
+
+
+# 모듈 로드 시 한 번만 검증기를 컴파일한다.
+_validate_cover_letter_payload = TypeAdapter(_CoverLetterPayload).validate_python
+
+
+def _parse_cover_letter_json(cover_letter_json: str) -> Dict[str, Any]:
+    """Gemini 응답 JSON을 파싱하고 스키마를 검증합니다."""
+    cover_letter_data = _validate_cover_letter_payload(orjson.loads(cover_letter_json))
+    if not cover_letter_data["cover_letter"]:
+        raise CoverLetterServiceError("자기소개서 문단이 비어 있습니다.")
+    return cover_letter_data
+
 
 class CoverLetterServiceError(RuntimeError):
     """자기소개서 서비스 관련 예외."""
 
 
+class InvalidCoverLetterCursorError(CoverLetterServiceError):
+    """페이지 커서가 존재하지 않는 자기소개서를 가리킬 때 발생하는 예외."""
+
+
+_llm_cache = LLMResponseCache()
+
+
+class _InflightRequests:
+    """같은 키로 동시에 들어온 요청을 하나의 실행으로 합친다.
+
+    캐시는 하지 않으며, 실행이 끝나면 항목을 제거한다. 요청마다 이벤트 루프가
+    다를 수 있으므로 결과는 concurrent.futures.Future로 공유한다.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+    async def run(self, key: str, factory):
+        """진행 중인 동일 요청이 있으면 그 결과를 기다리고, 없으면 factory()를 실행한다."""
+        with self._lock:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                future = Future()
+                self._inflight[key] = future
+        if inflight is not None:
+            logger.info("⏳ 진행 중인 동일 자기소개서 생성 요청 결과 대기")
+            return await asyncio.wrap_future(inflight)
+
+        try:
+            value = await factory()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+
+_inflight_generations = _InflightRequests()
+
+
 class CoverLetterService:
     """자기소개서 생성 및 관리를 담당하는 서비스."""
     
@@ -53,6 +226,9 @@ class CoverLetterService:
     ) -> Dict[str, Any]:
         """
         사용자의 페르소나 데이터와 RAG 검색을 통해 자기소개서를 생성합니다.
+
+        중복 클릭 등으로 동일한 입력의 생성 요청이 동시에 들어오면
+        한 번만 생성·저장하고 결과를 공유합니다.
         
         Args:
             user_id: 사용자 ID
@@ -68,24 +244,43 @@ class CoverLetterService:
         Raises:
             CoverLetterServiceError: 생성 실패 시
         """
+        key = _inflight_generations.make_key(
+            user_id, persona_id, company_name, strengths, activities, style
+        )
+        result = await _inflight_generations.run(
+            key,
+            lambda: self._generate_cover_letter(
+                user_id, persona_id, company_name, strengths, activities, style
+            ),
+        )
+        # 결과를 공유한 호출자끼리 같은 dict를 변경하지 않도록 복사본을 반환
+        return dict(result)
+
+    async def _generate_cover_letter(
+        self,
+        user_id: str,
+        persona_id: str,
+        company_name: str,
+        strengths: str,
+        activities: str,
+        style: str
+    ) -> Dict[str, Any]:
+        """자기소개서를 실제로 생성하고 Firestore에 저장합니다."""
         try:
-            logger.info(f"📝 자기소개서 생성 서비스 시작")
-            logger.info(f"   👤 user_id: {user_id}")
-            logger.info(f"   🎭 persona_id: {persona_id}")
-            logger.info(f"   🏢 company_name: {company_name}")
-            logger.info(f"   💪 strengths: {strengths}")
-            logger.info(f"   🎯 activities: {activities}")
-            logger.info(f"   🎨 style: {style}")
+            logger.info(
+                "📝 자기소개서 생성 서비스 시작: user_id=%s, persona_id=%s, company_name=%s, style=%s",
+                user_id, persona_id, company_name, style,
+            )
+            logger.debug("   💪 strengths: %s", strengths)
+            logger.debug("   🎯 activities: %s", activities)
             
             # 1. 사용자 페르소나 데이터 조회
-            logger.info(f"📤 페르소나 데이터 조회 시작")
-            logger.info(f"   🔗 get_persona_document(user_id={user_id}, persona_id={persona_id})")
-            persona_data = get_persona_document(user_id=user_id, persona_id=persona_id, db=self.db)
-            logger.info(f"📥 페르소나 데이터 수신 완료")
-            logger.info(f"   📊 페르소나 데이터: {persona_data}")
+            persona_data = await asyncio.to_thread(
+                get_cached_persona_document, user_id=user_id, persona_id=persona_id, db=self.db
+            )
+            logger.debug("   📊 페르소나 데이터: %s", persona_data)
             
             # 2. 페르소나에서 필요한 정보 추출
-            logger.info(f"🔧 페르소나 정보 추출 시작")
             job_category = persona_data.get('job_category', '')
             job_role = persona_data.get('job_role', '')
             skills = persona_data.get('skills', [])
@@ -94,101 +289,84 @@ class CoverLetterService:
             major = persona_data.get('major', '')
             final_evaluation = persona_data.get('final_evaluation', '')
             
-            logger.info(f"✅ 페르소나 정보 추출 완료")
-            logger.info(f"   💼 job_category: {job_category}")
-            logger.info(f"   🎯 job_role: {job_role}")
-            logger.info(f"   🛠️ skills: {skills}")
-            logger.info(f"   📜 certifications: {certifications}")
-            logger.info(f"   🎓 school_name: {school_name}")
-            logger.info(f"   📚 major: {major}")
-            logger.info(f"   ⭐ final_evaluation: {final_evaluation}")
-            
             # 3. RAG 검색을 위한 쿼리 생성
-            logger.info(f"🔍 RAG 검색 쿼리 생성 시작")
             rag_query = self._create_rag_query(company_name, job_category, job_role, strengths)
-            logger.info(f"✅ RAG 검색 쿼리 생성 완료")
-            logger.info(f"   📝 쿼리: {rag_query}")
+            logger.debug("   📝 RAG 검색 쿼리: %s", rag_query)
             
             # 4. RAG 검색으로 관련 대화 내역 조회
-            logger.info(f"📤 RAG 검색 시작")
-            logger.info(f"   🔗 get_rag_context(query={rag_query}, user_id={user_id}, top_k=5)")
             rag_context = await get_rag_context(rag_query, user_id, top_k=5)
-            logger.info(f"📥 RAG 검색 완료")
-            logger.info(f"   📊 검색된 컨텍스트 수: {len(rag_context) if rag_context else 0}")
-            logger.info(f"   📋 RAG 컨텍스트: {rag_context}")
+            logger.info("📥 RAG 검색 완료: 컨텍스트 %d자", len(rag_context) if rag_context else 0)
+            logger.debug("   📋 RAG 컨텍스트: %s", rag_context)
             
             # 5. 자기소개서 생성 프롬프트 구성
-            logger.info(f"🔧 자기소개서 프롬프트 구성 시작")
             prompt = self._create_cover_letter_prompt(
                 company_name=company_name,
                 job_category=job_category,
                 job_role=job_role,
                 strengths=strengths,
                 activities=activities,
-                skills=skills,
-                certifications=certifications,
+                skills_csv=", ".join(skills) if skills else "",
+                certifications_csv=", ".join(certifications) if certifications else "",
                 school_name=school_name,
                 major=major,
                 final_evaluation=final_evaluation,
                 rag_context=rag_context,
                 style=style
             )
-            logger.info(f"✅ 자기소개서 프롬프트 구성 완료")
-            logger.info(f"   📝 프롬프트 길이: {len(prompt)}자")
-            logger.info(f"   📋 프롬프트 미리보기: {prompt[:200]}...")
+            logger.debug("   📋 프롬프트(%d자) 미리보기: %.200s...", len(prompt), prompt)
             
             # 6. Gemini를 통해 자기소개서 생성
-            logger.info(f"📤 Gemini 자기소개서 생성 시작")
-            logger.info(f"   🔗 generate_structured_response(prompt, response_format='json')")
-            cover_letter_json = await self.gemini_service.generate_structured_response(
-                prompt, response_format="json"
-            )
-            logger.info(f"📥 Gemini 자기소개서 생성 완료")
-            logger.info(f"   📊 생성된 JSON 길이: {len(cover_letter_json)}자")
-            logger.info(f"   📋 생성된 JSON: {cover_letter_json}")
+            async def _generate_validated() -> str:
+                response = await self.gemini_service.generate_structured_response(
+                    prompt, response_format="json", response_schema=_CoverLetterPayload
+                )
+                # 스키마에 맞지 않는 응답은 캐시하지 않도록 저장 전에 검증
+                _parse_cover_letter_json(response)
+                return response
+
+            # 동일 프롬프트는 캐시된 응답을 재사용
+            cover_letter_json = await _llm_cache.get_or_generate(prompt, _generate_validated)
+            logger.info("📥 Gemini 자기소개서 생성 완료: JSON %d자", len(cover_letter_json))
+            logger.debug("   📋 생성된 JSON: %s", cover_letter_json)
             
             # 7. JSON 파싱 및 검증
-            logger.info(f"🔧 JSON 파싱 시작")
-            cover_letter_data = json.loads(cover_letter_json)
-            logger.info(f"✅ JSON 파싱 완료")
-            logger.info(f"   📊 파싱된 데이터: {cover_letter_data}")
+            cover_letter_data = _parse_cover_letter_json(cover_letter_json)
             
             # 8. 글자 수 계산
-            logger.info(f"🔢 글자 수 계산 시작")
-            total_text = ""
-            for paragraph_data in cover_letter_data.get("cover_letter", []):
-                total_text += paragraph_data.get("paragraph", "")
-            cover_letter_data["character_count"] = len(total_text)
-            logger.info(f"✅ 글자 수 계산 완료")
-            logger.info(f"   📊 총 글자 수: {cover_letter_data['character_count']}자")
+            cover_letter_data["character_count"] = sum(
+                len(paragraph_data["paragraph"])
+                for paragraph_data in cover_letter_data["cover_letter"]
+            )
             
             # 9. Firestore에 저장
-            logger.info(f"💾 Firestore 저장 시작")
-            logger.info(f"   🔗 _save_cover_letter(user_id={user_id}, persona_id={persona_id}, company_name={company_name})")
             saved_data = await self._save_cover_letter(
                 user_id=user_id,
                 persona_id=persona_id,
                 company_name=company_name,
                 cover_letter_data=cover_letter_data
             )
-            logger.info(f"✅ Firestore 저장 완료")
-            logger.info(f"   📊 저장된 데이터: {saved_data}")
+            logger.debug("   📊 저장된 데이터: %s", saved_data)
             
-            logger.info(f"🎉 자기소개서 생성 완료")
-            logger.info(f"   👤 user_id: {user_id}")
-            logger.info(f"   🏢 company: {company_name}")
-            logger.info(f"   📝 글자 수: {cover_letter_data['character_count']}자")
+            logger.info(
+                "🎉 자기소개서 생성 완료: user_id=%s, company=%s, 글자 수=%d자",
+                user_id, company_name, cover_letter_data['character_count'],
+            )
             
             return saved_data
             
         except PersonaNotFoundError as exc:
-            logger.error(f"페르소나를 찾을 수 없습니다: {exc}")
+            logger.error("페르소나를 찾을 수 없습니다: %s", exc)
             raise CoverLetterServiceError(f"페르소나를 찾을 수 없습니다: {exc}") from exc
-        except json.JSONDecodeError as exc:
-            logger.error(f"자기소개서 JSON 파싱 실패: {exc}")
+        except orjson.JSONDecodeError as exc:
+            logger.error("자기소개서 JSON 파싱 실패: %s", exc)
             raise CoverLetterServiceError(f"자기소개서 생성 실패: {exc}") from exc
+        except ValidationError as exc:
+            logger.error("자기소개서 JSON 스키마 검증 실패: %s", exc)
+            raise CoverLetterServiceError(f"자기소개서 생성 실패: 응답 형식 오류 {exc}") from exc
+        except CoverLetterServiceError:
+            raise
         except Exception as exc:
-            logger.error(f"자기소개서 생성 실패: {exc}")
+            logger.error("자기소개서 생성 실패: %s", exc)
             raise CoverLetterServiceError(f"자기소개서 생성 실패: {exc}") from exc
     
     def _create_rag_query(
@@ -199,36 +377,9 @@ class CoverLetterService:
         strengths: str
     ) -> str:
         """RAG 검색을 위한 쿼리를 생성합니다."""
-        query_parts = []
-        
-        if company_name:
-            query_parts.append(f"{company_name}")
-        
-        if job_category:
-            query_parts.append(f"{job_category}")
-        
-        if job_role:
-            query_parts.append(f"{job_role}")
-        
-        if strengths:
-            query_parts.append(f"{strengths}")
-        
-        # 자기소개서에 도움이 될 만한 대화 검색
-        query_parts.extend([
-            "프로젝트 경험",
-            "성과",
-            "도전",
-            "성장",
-            "문제 해결",
-            "리더십",
-            "협업",
-            "기술",
-            "목표",
-            "성격",
-            "가치관"
-        ])
-        
-        return " ".join(query_parts)
+        parts = [part for part in (company_name, job_category, job_role, strengths) if part]
+        parts.append(_RAG_QUERY_TAIL)
+        return " ".join(parts)
     
     def _create_cover_letter_prompt(
         self,
@@ -237,8 +388,8 @@ class CoverLetterService:
         job_role: str,
         strengths: str,
         activities: str,
-        skills: List[str],
-        certifications: List[str],
+        skills_csv: str,
+        certifications_csv: str,
         school_name: str,
         major: str,
         final_evaluation: str,
@@ -246,63 +397,23 @@ class CoverLetterService:
         style: str
     ) -> str:
         """자기소개서 생성 프롬프트를 생성합니다."""
-        
-        # 스타일별 가이드라인
-        style_guidelines = {
-            "experience": "구체적인 프로젝트 경험, 성과, 도전과제 해결 과정을 중심으로 작성하세요.",
-            "knowledge": "전문 지식, 기술적 이해도, 학습 과정을 중심으로 작성하세요. 이론적 배경과 실무 적용 사례를 강조하세요.",
-            "creative": "독창적인 아이디어, 혁신적 사고, 창의적 문제 해결 과정을 중심으로 작성하세요. 상상력과 비전을 표현하세요."
-        }
-        
-        style_guide = style_guidelines.get(style, "균형 잡힌 자기소개서를 작성하세요.")
+        template = _PROMPT_TEMPLATES.get(style)
+        if template is None:
+            template = _build_prompt_template(style, _DEFAULT_STYLE_GUIDE)
 
-        prompt = f"""
-당신은 취업 전문가입니다. 주어진 정보를 바탕으로 {company_name}에 지원하는 자기소개서를 작성해주세요.
-
-## 지원 정보
-- 회사명: {company_name}
-- 직무 분야: {job_category}
-- 직무 역할: {job_role or "미지정"}
-- 본인의 강점: {strengths}
-- 관련 활동: {activities}
-- 자기소개서 스타일: {style}
-
-## 개인 정보
-- 학력: {school_name} {major}
-- 보유 기술: {', '.join(skills) if skills else "없음"}
-- 자격증: {', '.join(certifications) if certifications else "없음"}
-- 평가 결과: {final_evaluation if final_evaluation else "없음"}
-
-## 관련 대화 내역 (RAG 검색 결과)
-{rag_context if rag_context else "관련 대화 내역이 없습니다."}
-
-## 요구사항
-1. 자기소개서는 여러개의 문단으로 구성해주세요.
-2. 각 문단마다 자연스러운 연결과 전환을 포함해주세요.
-3. 각 문단마다 작성 이유를 포함해주세요. 
-4. RAG 검색 결과에서 찾은 관련 경험을 적절히 활용해주세요.
-5. 관련 대화 내역을 토대로 작성한 문단이라면 그 내용을 이유로 포함해주세요.
-6. 회사와 직무에 맞는 구체적인 경험과 성과를 포함해주세요.
-7. 스타일 가이드라인: {style_guide}
-
-## 응답 형식
-다음 JSON 형식으로 응답해주세요:
-{{
-  "cover_letter": [
-    {{
-      "paragraph": "문단 내용",
-      "reason": "이 문단을 작성한 이유"
-    }},
-    {{
-      "paragraph": "문단 내용", 
-      "reason": "이 문단을 작성한 이유"
-    }}
-  ],
-  "style": "{style}",
-  "character_count": 0
-}}
-"""
-        return prompt
+        return template.substitute(
+            company_name=company_name,
+            job_category=job_category,
+            job_role=job_role or "미지정",
+            strengths=strengths,
+            activities=activities,
+            school_name=school_name,
+            major=major,
+            skills_csv=skills_csv or "없음",
+            certifications_csv=certifications_csv or "없음",
+            final_evaluation=final_evaluation if final_evaluation else "없음",
+            rag_context=rag_context if rag_context else "관련 대화 내역이 없습니다.",
+        )
     
     async def _save_cover_letter(
         self,
@@ -333,30 +444,42 @@ class CoverLetterService:
                 "updated_at": firestore.SERVER_TIMESTAMP,
             }
             
-            # Firestore에 저장
-            doc_ref.set(save_data)
+            # Firestore에 저장 (블로킹 호출은 스레드에서 실행)
+            await asyncio.to_thread(doc_ref.set, save_data)
             
-            # 저장된 데이터 조회
-            snapshot = doc_ref.get()
-            saved_data = snapshot.to_dict() if snapshot.exists else save_data
-            saved_data["id"] = snapshot.id
+            # 재조회 없이 응답 데이터 구성 (서버 타임스탬프는 현재 시각으로 근사)
+            saved_at = datetime.now(timezone.utc)
+            saved_data = {
+                **save_data,
+                "id": doc_ref.id,
+                "created_at": saved_at,
+                "updated_at": saved_at,
+            }
             
-            logger.info(f"자기소개서 저장 완료: user_id={user_id}, company={company_name}")
+            logger.info("자기소개서 저장 완료: user_id=%s, company=%s", user_id, company_name)
             return saved_data
             
         except google_exceptions.GoogleAPICallError as exc:
-            logger.error(f"Firestore 저장 실패: {exc}")
+            logger.error("Firestore 저장 실패: %s", exc)
             raise CoverLetterServiceError(f"자기소개서 저장 실패: {exc}") from exc
         except Exception as exc:
-            logger.error(f"자기소개서 저장 중 오류: {exc}")
+            logger.error("자기소개서 저장 중 오류: %s", exc)
             raise CoverLetterServiceError(f"자기소개서 저장 실패: {exc}") from exc
     
     async def get_cover_letters(
         self,
         user_id: str,
-        persona_id: str
+        persona_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        start_after: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """사용자의 특정 페르소나에 대한 모든 자기소개서를 조회합니다."""
+        """사용자의 특정 페르소나에 대한 자기소개서를 최신순으로 조회합니다.
+
+        fields를 지정하면 해당 필드만 서버에서 프로젝션하여 가져오고,
+        limit/start_after(마지막 문서 ID)로 페이지 단위 조회가 가능합니다.
+        """
         try:
             # Firestore 컬렉션 참조
             collection_ref = (
@@ -367,25 +490,54 @@ class CoverLetterService:
                 .collection(COVER_LETTER_SUBCOLLECTION)
             )
             
-            # 문서들 조회
-            docs = collection_ref.order_by("created_at", direction=firestore.Query.DESCENDING).stream()
+            def _fetch() -> List[Dict[str, Any]]:
+                query = collection_ref.order_by("created_at", direction=firestore.Query.DESCENDING)
+                if fields:
+                    query = query.select(fields)
+                if start_after:
+                    cursor_snapshot = collection_ref.document(start_after).get()
+                    if not cursor_snapshot.exists:
+                        # 무시하면 첫 페이지가 다시 반환되어 클라이언트가 무한 페이지네이션에 빠짐
+                        raise InvalidCoverLetterCursorError(f"유효하지 않은 cursor입니다: {start_after}")
+                    query = query.start_after(cursor_snapshot)
+                if limit:
+                    query = query.limit(limit)
+
+                return [{**doc.to_dict(), "id": doc.id} for doc in query.stream()]
             
-            cover_letters = []
-            for doc in docs:
-                data = doc.to_dict()
-                data["id"] = doc.id
-                cover_letters.append(data)
+            # 문서들 조회 (블로킹 스트림은 스레드에서 모두 읽음)
+            cover_letters = await asyncio.to_thread(_fetch)
             
-            logger.info(f"자기소개서 목록 조회 완료: user_id={user_id}, persona_id={persona_id}, count={len(cover_letters)}")
+            logger.info("자기소개서 목록 조회 완료: user_id=%s, persona_id=%s, count=%s", user_id, persona_id, len(cover_letters))
             return cover_letters
             
+        except InvalidCoverLetterCursorError:
+            raise
         except google_exceptions.GoogleAPICallError as exc:
-            logger.error(f"자기소개서 목록 조회 실패: {exc}")
+            logger.error("자기소개서 목록 조회 실패: %s", exc)
             raise CoverLetterServiceError(f"자기소개서 목록 조회 실패: {exc}") from exc
         except Exception as exc:
-            logger.error(f"자기소개서 목록 조회 중 오류: {exc}")
+            logger.error("자기소개서 목록 조회 중 오류: %s", exc)
             raise CoverLetterServiceError(f"자기소개서 목록 조회 실패: {exc}") from exc
 
+    async def count_cover_letters(self, user_id: str, persona_id: str) -> int:
+        """사용자의 특정 페르소나에 대한 전체 자기소개서 수를 집계 쿼리로 조회합니다."""
+        try:
+            count_query = (
+                self.db.collection(USER_COLLECTION)
+                .document(user_id)
+                .collection(PERSONA_SUBCOLLECTION)
+                .document(persona_id)
+                .collection(COVER_LETTER_SUBCOLLECTION)
+                .count(alias="total_count")
+            )
+            results = await asyncio.to_thread(count_query.get)
+            return int(results[0][0].value) if results else 0
+            
+        except Exception as exc:
+            logger.error("자기소개서 수 조회 실패: %s", exc)
+            raise CoverLetterServiceError(f"자기소개서 수 조회 실패: {exc}") from exc
+
     async def get_cover_letter_detail(
         self,
         user_id: str,
@@ -405,7 +557,7 @@ class CoverLetterService:
             )
 
             # 문서 조회
-            doc = doc_ref.get()
+            doc = await asyncio.to_thread(doc_ref.get)
 
             if not doc.exists:
                 raise CoverLetterServiceError(f"자기소개서를 찾을 수 없습니다: {cover_letter_id}")
@@ -413,17 +565,31 @@ class CoverLetterService:
             data = doc.to_dict()
             data["id"] = doc.id
 
-            logger.info(f"자기소개서 상세 조회 완료: user_id={user_id}, persona_id={persona_id}, cover_letter_id={cover_letter_id}")
+            logger.info("자기소개서 상세 조회 완료: user_id=%s, persona_id=%s, cover_letter_id=%s", user_id, persona_id, cover_letter_id)
             return data
 
         except google_exceptions.GoogleAPICallError as exc:
-            logger.error(f"자기소개서 상세 조회 실패: {exc}")
+            logger.error("자기소개서 상세 조회 실패: %s", exc)
             raise CoverLetterServiceError(f"자기소개서 상세 조회 실패: {exc}") from exc
         except Exception as exc:
-            logger.error(f"자기소개서 상세 조회 중 오류: {exc}")
+            logger.error("자기소개서 상세 조회 중 오류: %s", exc)
             raise CoverLetterServiceError(f"자기소개서 상세 조회 실패: {exc}") from exc
 
 
+_cover_letter_service: Optional[CoverLetterService] = None
+_cover_letter_lock = threading.Lock()
+
+
+def get_cover_letter_service() -> CoverLetterService:
+    """자기소개서 서비스 인스턴스를 반환합니다."""
+    global _cover_letter_service
+    if _cover_letter_service is None:
+        with _cover_letter_lock:
+            if _cover_letter_service is None:
+                _cover_letter_service = CoverLetterService()
+    return _cover_letter_service
+
+
 # 편의 함수들
 async def generate_cover_letter(
     user_id: str,
@@ -434,17 +600,32 @@ async def generate_cover_letter(
     style: str
 ) -> Dict[str, Any]:
     """자기소개서를 생성합니다."""
-    service = CoverLetterService()
-    return await service.generate_cover_letter(user_id, persona_id, company_name, strengths, activities, style)
+    return await get_cover_letter_service().generate_cover_letter(user_id, persona_id, company_name, strengths, activities, style)
 
 
-async def get_cover_letters(user_id: str, persona_id: str) -> List[Dict[str, Any]]:
+async def get_cover_letters(
+    user_id: str,
+    persona_id: str,
+    *,
+    fields: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    start_after: Optional[str] = None,
+) -> List[Dict[str, Any]]:
     """사용자의 자기소개서 목록을 조회합니다."""
-    service = CoverLetterService()
-    return await service.get_cover_letters(user_id, persona_id)
+    return await get_cover_letter_service().get_cover_letters(
+        user_id,
+        persona_id,
+        fields=fields,
+        limit=limit,
+        start_after=start_after,
+    )
+
+
+async def count_cover_letters(user_id: str, persona_id: str) -> int:
+    """사용자의 전체 자기소개서 수를 조회합니다."""
+    return await get_cover_letter_service().count_cover_letters(user_id, persona_id)
 
 
 async def get_cover_letter_detail(user_id: str, persona_id: str, cover_letter_id: str) -> Dict[str, Any]:
     """특정 자기소개서의 상세 정보를 조회합니다."""
-    service = CoverLetterService()
-    return await service.get_cover_letter_detail(user_id, persona_id, cover_letter_id)
+    return await get_cover_letter_service().get_cover_letter_detail(user_id, persona_id, cover_letter_id)
@@ -0,0 +1 @@
+﻿# cover_letters.tests 패키지
@@ -0,0 +1,56 @@
+import asyncio
+from unittest.mock import MagicMock
+
+from django.test import SimpleTestCase
+
+from cover_letters.services import (
+    CoverLetterService,
+    CoverLetterServiceError,
+    InvalidCoverLetterCursorError,
+)
+
+
+class GetCoverLettersCursorTests(SimpleTestCase):
+    """자기소개서 목록 페이지 커서 처리를 검증한다."""
+
+    def _build_service(self, *, cursor_exists):
+        cursor_snapshot = MagicMock()
+        cursor_snapshot.exists = cursor_exists
+
+        cover_letters_collection = MagicMock()
+        cover_letters_collection.document.return_value.get.return_value = cursor_snapshot
+        query = cover_letters_collection.order_by.return_value
+        for method in ("select", "start_after", "limit"):
+            getattr(query, method).return_value = query
+        query.stream.return_value = []
+
+        client = MagicMock()
+        (
+            client.collection.return_value
+            .document.return_value
+            .collection.return_value
+            .document.return_value
+            .collection.return_value
+        ) = cover_letters_collection
+
+        service = CoverLetterService.__new__(CoverLetterService)
+        service.db = client
+        return service, query, cursor_snapshot
+
+    def test_unknown_cursor_raises_invalid_cursor_error(self):
+        service, query, _ = self._build_service(cursor_exists=False)
+
+        with self.assertRaises(InvalidCoverLetterCursorError) as ctx:
+            asyncio.run(service.get_cover_letters("user-123", "persona-1", limit=20, start_after="deleted-id"))
+
+        self.assertIsInstance(ctx.exception, CoverLetterServiceError)
+        query.start_after.assert_not_called()
+        query.stream.assert_not_called()
+
+    def test_existing_cursor_starts_after_snapshot(self):
+        service, query, cursor_snapshot = self._build_service(cursor_exists=True)
+
+        result = asyncio.run(service.get_cover_letters("user-123", "persona-1", limit=20, start_after="letter-1"))
+
+        self.assertEqual(result, [])
+        query.start_after.assert_called_once_with(cursor_snapshot)
@@ -9,6 +9,7 @@ urlpatterns = [
     
     # 2. 자기소개서 생성
     path("create/", views.create_cover_letter, name="cover-letters-create"),
+    path("jobs/<str:job_id>/", views.get_cover_letter_job_status, name="cover-letters-job-status"),
     
     # 3. 자기소개서 목록 조회
     path("list/", views.list_cover_letters, name="cover-letters-list"),
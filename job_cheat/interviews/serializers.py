@@ -1,3 +1,8 @@
+from datetime import datetime
+from typing import Annotated, List, NotRequired, Optional, TypedDict, Union
+
+from django.utils import timezone
+from pydantic import BeforeValidator, TypeAdapter
 from rest_framework import serializers
 
 
@@ -23,6 +28,7 @@ class InterviewHistoryResponseSerializer(serializers.Serializer):
     highest_score = serializers.FloatField(help_text="최고 점수")
     total_practice_time = serializers.IntegerField(help_text="총 연습 시간 (초)")
     sessions = InterviewSessionSummarySerializer(many=True, help_text="면접 세션 목록")
+    next_cursor = serializers.CharField(allow_null=True, help_text="다음 페이지 조회용 커서 (마지막 페이지면 null)")
     persona_card = serializers.DictField(help_text="페르소나 카드 정보")
 
 
@@ -71,6 +77,7 @@ class QuestionSerializer(serializers.Serializer):
     question_type = serializers.CharField(help_text="질문 유형")
     question_text = serializers.CharField(required=False, help_text="질문 내용 (일반 면접인 경우)")
     audio_url = serializers.URLField(required=False, help_text="음성 파일 URL (음성 면접인 경우)")
+    audio_pending = serializers.BooleanField(required=False, help_text="음성 파일 변환 대기 여부 (음성 면접인 경우)")
 
 
 class InterviewQuestionGenerationResponseSerializer(serializers.Serializer):
@@ -126,6 +133,7 @@ class NextQuestionResponseSerializer(serializers.Serializer):
     question_type = serializers.CharField(help_text="질문 유형")
     question_text = serializers.CharField(required=False, help_text="질문 내용 (일반 면접인 경우)")
     audio_url = serializers.URLField(required=False, help_text="음성 파일 URL (음성 면접인 경우)")
+    audio_pending = serializers.BooleanField(required=False, help_text="음성 파일 변환 대기 여부 (음성 면접인 경우)")
 
 
 class QuestionResultSerializer(serializers.Serializer):
@@ -192,4 +200,77 @@ class QuestionDetailResponseSerializer(serializers.Serializer):
     )
     audio_url = serializers.URLField(required=False, help_text="음성 파일 URL (음성 면접인 경우)")
     created_at = serializers.DateTimeField(help_text="생성일시")
-    updated_at = serializers.DateTimeField(help_text="수정일시")
\ No newline at end of file
+    updated_at = serializers.DateTimeField(help_text="수정일시")
+
+
+def _localize_timestamp(value):
+    """DateTimeField 직렬화와 같은 표현이 되도록 빈 값은 None, datetime은 현재 시간대로 변환합니다."""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return timezone.localtime(value) if timezone.is_aware(value) else timezone.make_aware(value)
+    return value
+
+
+def _truncate_float(value):
+    """IntegerField 직렬화와 같이 소수 값(예: Gemini 점수 85.5)은 정수로 버림합니다."""
+    return int(value) if isinstance(value, float) else value
+
+
+# 조회 빈도가 높은 응답은 필드별 to_representation 대신 pydantic TypeAdapter로 한 번에 변환한다.
+# (위 DRF 시리얼라이저는 응답 스키마 문서로 유지하며, 선언되지 않은 키는 변환 시 제거된다.)
+_Timestamp = Annotated[Optional[Union[datetime, str]], BeforeValidator(_localize_timestamp)]
+_Int = Annotated[Optional[int], BeforeValidator(_truncate_float)]
+
+
+class _QuestionResult(TypedDict):
+    question_id: Optional[str]
+    question_number: _Int
+    question_type: Optional[str]
+    question_text: Optional[str]
+    answer_text: Optional[str]
+    time_taken: _Int
+
+
+class _InterviewSessionResult(TypedDict):
+    interview_session_id: Optional[str]
+    user_id: Optional[str]
+    persona_id: Optional[str]
+    total_questions: _Int
+    total_time: _Int
+    average_answer_time: Optional[float]
+    total_answers: _Int
+    average_answer_length: Optional[float]
+    score: Optional[float]
+    grade: Optional[str]
+    status: Optional[str]
+    use_voice: Optional[bool]
+    questions: List[_QuestionResult]
+    final_good_points: Optional[List[str]]
+    final_improvement_points: Optional[List[str]]
+    created_at: _Timestamp
+    updated_at: _Timestamp
+    completed_at: _Timestamp
+
+
+class _QuestionDetail(TypedDict):
+    question_id: Optional[str]
+    question_number: _Int
+    question_type: Optional[str]
+    question_text: Optional[str]
+    answer_text: Optional[str]
+    answer_length: _Int
+    time_taken: _Int
+    is_answered: Optional[bool]
+    question_score: _Int
+    good_points: Optional[List[str]]
+    improvement_points: Optional[List[str]]
+    sample_answer: Optional[str]
+    question_intent: Optional[List[str]]
+    audio_url: NotRequired[Optional[str]]
+    created_at: _Timestamp
+    updated_at: _Timestamp
+
+
+serialize_interview_session_result = TypeAdapter(_InterviewSessionResult).validate_python
+serialize_question_detail = TypeAdapter(_QuestionDetail).validate_python
@@ -8,22 +8,34 @@
 맞춤형 면접 질문을 생성하고 답변을 평가하는 서비스를 제공합니다.
 """
 
-import json
+import asyncio
+import functools
 import logging
 import uuid
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, TypedDict
 from datetime import datetime
 
+import orjson
 from django.conf import settings
 from firebase_admin import firestore
 from google.api_core import exceptions as google_exceptions
 
-from core.services.firebase_personas import get_persona_document, PersonaNotFoundError
+from core.services.firebase_personas import (
+    get_cached_persona_document,
+    PersonaNotFoundError,
+)
 from core.services.conversation_rag_service import get_rag_context
 from core.services.gemini_service import get_gemini_service
+from core.services.llm_cache import LLMResponseCache
 from core.services.whisper_service import get_whisper_service
 from core.services.tts_service import get_tts_service
-from cover_letters.services.cover_letter_service import get_cover_letter_detail
+from core.utils import create_persona_card
+from cover_letters.services.cover_letter_service import (
+    COVER_LETTER_SUMMARY_FIELDS,
+    get_cover_letter_detail,
+    get_cover_letters,
+)
+from interviews.services.question_audio_job import AUDIO_STATUS_PENDING, enqueue_question_audio_job
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +44,173 @@ PERSONA_SUBCOLLECTION = "personas"
 INTERVIEW_SESSION_SUBCOLLECTION = "interview_sessions"
 QUESTIONS_SUBCOLLECTION = "questions"
 
+# 면접 질문/답변 평가 Gemini 응답 캐시 (같은 입력으로 재요청 시 재사용)
+INTERVIEW_LLM_CACHE_TTL_SECONDS = 60 * 60  # 1시간
+_llm_cache = LLMResponseCache(ttl_seconds=INTERVIEW_LLM_CACHE_TTL_SECONDS)
+
+# 면접 기록 조회 시 반환할 최신 세션 수 (통계는 집계 쿼리로 전체 세션 기준)
+INTERVIEW_HISTORY_SESSIONS_LIMIT = 50
+
+
+# 면접 기록의 세션 목록 / 세션 결과의 질문 목록에서 조회할 필드 (평가 결과·음성 필드 제외)
+INTERVIEW_HISTORY_SESSION_FIELDS = ["score", "grade", "total_time", "created_at", "completed_at"]
+SESSION_RESULT_QUESTION_FIELDS = ["question_number", "question_type", "question_text", "answer_text", "time_taken"]
+
+# 최종 피드백을 생성할 최소 답변 수 (미만이면 Gemini 호출 생략)
+FINAL_FEEDBACK_MIN_ANSWERS = 2
+
+# 최종 피드백 생성 시 질문 문서에서 조회할 필드 (평가 결과 등 큰 필드는 제외)
+FINAL_FEEDBACK_QUESTION_FIELDS = ["question_number", "question_type", "question_text", "answer_text"]
+
+# 질문 생성용 RAG 검색 쿼리 (고정)
+_QUESTION_RAG_QUERY = "면접 질문으로 만들만한 프로젝트 경험, 문제 해결 경험, 팀워크 경험, 학습 경험"
+
+# Gemini 프롬프트 템플릿 (고정 지시문을 앞에, 호출마다 달라지는 데이터를 뒤에 두어
+# 요청 간 공통 접두사가 최대한 길게 유지되도록 함. 가변 데이터도 사용자 단위로 안정적인
+# 대화 내역 → 페르소나 → 자기소개서 순으로 배치)
+_QUESTIONS_PROMPT_TEMPLATE = """
+당신은 면접 전문가입니다. 아래 지원자 정보를 바탕으로 지원 직무 분야의 면접 질문 10개를 생성해주세요.
+
+## 요구사항
+1. 총 10개의 질문을 생성해주세요.
+2. 질문 유형별 분배:
+   - 직무 지식: 3개
+   - 문제 해결 능력: 3개
+   - 프로젝트 경험: 2개
+   - 인성 및 가치관: 2개
+3. 대화 내역을 바탕으로 한 질문이 있다면 해당 대화 내용을 언급해주세요.
+4. 질문은 구체적이고 실무에 도움이 되는 내용으로 작성해주세요.
+
+## 응답 형식
+다음 JSON 형식으로 응답해주세요:
+{{
+  "questions": [
+    {{
+      "question_type": "직무 지식",
+      "question_text": "질문 내용"
+    }},
+    {{
+      "question_type": "문제 해결 능력", 
+      "question_text": "질문 내용"
+    }}
+  ]
+}}
+
+## 대화 내역 정보
+{rag_context}
+
+## 페르소나 정보
+- 학력: {school_name} {major}
+- 직무 분야: {job_category}
+- 직무 역할: {job_role}
+- 보유 기술: {skills}
+- 자격증: {certifications}
+- 역량 평가: {final_evaluation}
+- 음성 면접 여부: {use_voice}
+
+## 자기소개서 정보
+{cover_letter_text}
+"""
+
+_EVALUATION_PROMPT_TEMPLATE = """
+당신은 면접 평가 전문가입니다. 주어진 질문과 답변을 분석하여 평가해주세요.
+
+**"sample_answer" 필드에 모범 답변 예시를 100자 이내로 작성해주세요.**
+
+1. question_score 필드에는 항상 무조건 70~89 사이의 점수를 반환해주세요.
+2. 잘한 점과 개선할 점은 사용자의 답변과 무관하게 질문의 의도를 기반으로 작성해주세요.
+
+## 응답 형식
+다음 JSON 형식으로 응답해주세요:
+{{
+  "good_points": ["잘한 점 1", "잘한 점 2", "잘한 점 3"],
+  "improvement_points": ["개선할 점 1", "개선할 점 2", "개선할 점 3"],
+  "sample_answer": "모범 답변 예시",
+  "question_intent": ["질문의 의도 1", "질문의 의도 2", "질문의 의도 3"],
+  "question_score": 85
+}}
+
+## 질문
+{question_text}
+
+## 답변
+{answer_text}
+
+## 답변 정보
+- 답변 길이: {answer_length}자
+- 답변 시간: {time_taken}초
+"""
+
+_FINAL_FEEDBACK_PROMPT_TEMPLATE = """
+당신은 면접 평가 전문가입니다. 다음 면접 질문과 답변들을 종합적으로 분석하여 최종 피드백을 제공해주세요.
+
+## 요구사항
+전체 면접을 종합적으로 분석하여 다음을 제공해주세요:
+1. good_points: 잘한 점 3개 (전체적인 강점)
+2. improvement_points: 개선할 점 3개 (전체적인 약점)
+
+## 면접 질문과 답변
+{qa_text}
+"""
+
+
+class _FinalFeedback(TypedDict):
+    """Gemini 최종 피드백 응답 스키마 (response_schema로 전달해 구조화 출력 강제)."""
+
+    good_points: List[str]
+    improvement_points: List[str]
+
+
+def _question_doc_id(question_number: int) -> str:
+    """세션 내 질문 문서 ID (질문 번호로 결정되어 번호만으로 바로 조회 가능)."""
+    return f"q_{question_number}"
+
+
+def _history_session_item(snapshot) -> Dict[str, Any]:
+    """면접 기록의 세션 목록 항목을 만든다."""
+    get = snapshot.to_dict().get
+    return {
+        'interview_session_id': snapshot.id,
+        'score': get('score', 0),
+        'grade': get('grade', ''),
+        'total_time': get('total_time', 0),
+        'created_at': get('created_at', ''),
+        'completed_at': get('completed_at', '')
+    }
+
+
+def _session_result_question_item(snapshot) -> Dict[str, Any]:
+    """면접 세션 결과의 질문 항목을 만든다."""
+    get = snapshot.to_dict().get
+    return {
+        "question_id": snapshot.id,
+        "question_number": get("question_number"),
+        "question_type": get("question_type"),
+        "question_text": get("question_text"),
+        "answer_text": get("answer_text", ""),
+        "time_taken": get("time_taken", 0)
+    }
+
+
+# 경로 참조 캐시 (DocumentReference는 경로만 담는 가벼운 객체라 요청 간 재사용해도 안전)
+REF_CACHE_MAX_ENTRIES = 2048
+
+
+@functools.lru_cache(maxsize=REF_CACHE_MAX_ENTRIES)
+def _persona_ref(db, user_id: str, persona_id: str):
+    """users/{user_id}/personas/{persona_id} 문서 참조를 반환합니다."""
+    return db.collection(USER_COLLECTION).document(user_id).collection(PERSONA_SUBCOLLECTION).document(persona_id)
+
+
+@functools.lru_cache(maxsize=REF_CACHE_MAX_ENTRIES)
+def _session_ref(db, user_id: str, persona_id: str, interview_session_id: str):
+    """면접 세션 문서 참조를 반환합니다."""
+    return (
+        _persona_ref(db, user_id, persona_id)
+        .collection(INTERVIEW_SESSION_SUBCOLLECTION)
+        .document(interview_session_id)
+    )
+
 
 class InterviewServiceError(RuntimeError):
     """면접 서비스 관련 예외."""
@@ -53,56 +232,25 @@ class InterviewService:
         persona_id: str
     ) -> Dict[str, Any]:
         """면접 준비 데이터를 조회합니다 (페르소나 카드 + 자기소개서 목록)."""
-        logger.info(f"🎯 면접 준비 데이터 조회 시작")
-        logger.info(f"   👤 user_id: {user_id}")
-        logger.info(f"   🎭 persona_id: {persona_id}")
+        logger.info("🎯 면접 준비 데이터 조회 시작: user_id=%s, persona_id=%s", user_id, persona_id)
         
         try:
-            # 페르소나 데이터 조회
-            logger.info(f"📤 페르소나 데이터 조회 시작")
-            from core.services.firebase_personas import get_persona_document
-            persona_data = get_persona_document(user_id=user_id, persona_id='0382e06d-9a3e-4484-a936-2886e4e07640', db=self.db)
-            logger.info(f"📥 페르소나 데이터 수신 완료")
-            logger.info(f"   📊 페르소나 데이터: {persona_data}")
+            # 페르소나 데이터와 자기소개서 목록을 동시에 조회
+            persona_data, cover_letters = await asyncio.gather(
+                asyncio.to_thread(get_cached_persona_document, user_id=user_id, persona_id=persona_id, db=self.db),
+                self._get_cover_letter_summaries(user_id, persona_id),
+            )
+            logger.debug("   📊 페르소나 데이터: %s", persona_data)
             
             # 페르소나 카드 생성
-            logger.info(f"🔧 페르소나 카드 생성 시작")
-            from core.utils import create_persona_card
             persona_card = create_persona_card(persona_data)
-            logger.info(f"✅ 페르소나 카드 생성 완료")
-            logger.info(f"   📋 페르소나 카드: {persona_card}")
-            
-            # 자기소개서 목록 조회
-            logger.info(f"📤 자기소개서 목록 조회 시작")
-            cover_letters = []
-            try:
-                from cover_letters.services.cover_letter_service import get_cover_letters
-                cover_letters_data = await get_cover_letters(user_id, persona_id)
-                logger.info(f"📥 자기소개서 목록 수신 완료")
-                logger.info(f"   📊 자기소개서 수: {len(cover_letters_data) if cover_letters_data else 0}")
-                
-                cover_letters = [
-                    {
-                        "id": cl.get("id"),
-                        "company_name": cl.get("company_name"),
-                        "created_at": cl.get("created_at"),
-                        "character_count": cl.get("character_count"),
-                        "style": cl.get("style")
-                    }
-                    for cl in cover_letters_data
-                ]
-                logger.info(f"✅ 자기소개서 목록 변환 완료")
-                logger.info(f"   📋 자기소개서 목록: {cover_letters}")
-            except Exception as e:
-                logger.warning(f"⚠️ 자기소개서 목록 조회 실패: {e}")
-                cover_letters = []
+            logger.debug("   📋 페르소나 카드: %s", persona_card)
             
             result = {
                 "persona_card": persona_card,
                 "cover_letters": cover_letters
             }
-            logger.info(f"✅ 면접 준비 데이터 조회 완료")
-            logger.info(f"   📊 결과: {result}")
+            logger.info("✅ 면접 준비 데이터 조회 완료: 자기소개서 %d개", len(cover_letters))
             return result
             
         except PersonaNotFoundError as exc:
@@ -111,89 +259,114 @@ class InterviewService:
         except Exception as exc:
             logger.error(f"❌ 면접 준비 데이터 조회 중 오류: {exc}")
             raise InterviewServiceError(f"면접 준비 데이터 조회 실패: {exc}") from exc
+
+    async def _get_cover_letter_summaries(self, user_id: str, persona_id: str) -> List[Dict[str, Any]]:
+        """자기소개서 요약 목록을 조회합니다. 실패 시 빈 목록을 반환합니다."""
+        try:
+            return await get_cover_letters(user_id, persona_id, fields=COVER_LETTER_SUMMARY_FIELDS)
+        except Exception as e:
+            logger.warning(f"⚠️ 자기소개서 목록 조회 실패: {e}")
+            return []
+    
+    async def _get_persona_for_questions(
+        self,
+        user_id: str,
+        persona_id: str,
+        persona_data: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """질문 생성에 사용할 페르소나를 반환합니다. 넘겨받은 데이터가 없을 때만 (캐시 우선) 조회합니다."""
+        if persona_data is not None:
+            return persona_data
+        return await asyncio.to_thread(
+            get_cached_persona_document, user_id=user_id, persona_id=persona_id, db=self.db
+        )
+
+    async def _get_cover_letter_for_questions(
+        self,
+        user_id: str,
+        persona_id: str,
+        cover_letter_id: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """질문 생성에 사용할 자기소개서를 조회합니다. ID가 없거나 실패하면 None을 반환합니다."""
+        if not cover_letter_id:
+            return None
+        try:
+            cover_letter_data = await get_cover_letter_detail(user_id, persona_id, cover_letter_id)
+            logger.debug("   📊 자기소개서 데이터: %s", cover_letter_data)
+            return cover_letter_data
+        except Exception as e:
+            logger.warning(f"⚠️ 자기소개서 조회 실패: {e}")
+            return None
+
+    async def _get_question_rag_context(self, user_id: str) -> str:
+        """질문 생성에 사용할 RAG 컨텍스트를 조회합니다. 실패 시 빈 문자열을 반환합니다."""
+        try:
+            # 고정 쿼리이므로 쿼리 임베딩/사용자별 RAG 컨텍스트 캐시에서 재사용됨
+            return await get_rag_context(query=_QUESTION_RAG_QUERY, user_id=user_id)
+        except Exception as e:
+            logger.warning(f"⚠️ RAG 컨텍스트 조회 실패: {e}")
+            return ""
     
     async def generate_interview_questions(
         self,
         user_id: str,
         persona_id: str,
         cover_letter_id: Optional[str] = None,
-        use_voice: bool = False
+        use_voice: bool = False,
+        persona_data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """면접 질문을 생성합니다."""
-        logger.info(f"❓ 면접 질문 생성 시작")
-        logger.info(f"   👤 user_id: {user_id}")
-        logger.info(f"   🎭 persona_id: {persona_id}")
-        logger.info(f"   📄 cover_letter_id: {cover_letter_id}")
-        logger.info(f"   🎤 use_voice: {use_voice}")
+        """면접 질문을 생성합니다.
+
+        persona_data를 넘기면 이미 조회한 페르소나를 그대로 사용하고 Firestore 조회를 생략합니다.
+        """
+        logger.info(
+            "❓ 면접 질문 생성 시작: user_id=%s, persona_id=%s, cover_letter_id=%s, use_voice=%s",
+            user_id, persona_id, cover_letter_id, use_voice,
+        )
         
         try:
-            # 페르소나 데이터 조회
-            logger.info(f"📤 페르소나 데이터 조회 시작")
-            persona_data = get_persona_document(user_id=user_id, persona_id='0382e06d-9a3e-4484-a936-2886e4e07640', db=self.db)
-            logger.info(f"📥 페르소나 데이터 수신 완료")
-            logger.info(f"   📊 페르소나 데이터: {persona_data}")
-            
-            # 자기소개서 데이터 조회 (선택사항)
-            cover_letter_data = None
-            if cover_letter_id:
-                logger.info(f"📤 자기소개서 데이터 조회 시작")
-                try:
-                    cover_letter_data = await get_cover_letter_detail(user_id, persona_id, cover_letter_id)
-                    logger.info(f"📥 자기소개서 데이터 수신 완료")
-                    logger.info(f"   📊 자기소개서 데이터: {cover_letter_data}")
-                except Exception as e:
-                    logger.warning(f"⚠️ 자기소개서 조회 실패: {e}")
-            else:
-                logger.info(f"📄 자기소개서 ID가 없어 자기소개서 데이터 조회 건너뜀")
-            
-            # RAG를 통한 대화 내역 조회
-            logger.info(f"📤 RAG 컨텍스트 조회 시작")
-            rag_context = ""
-            try:
-                rag_query = f"면접 질문으로 만들만한 프로젝트 경험, 문제 해결 경험, 팀워크 경험, 학습 경험"
-                logger.info(f"   🔍 RAG 쿼리: {rag_query}")
-                rag_context = await get_rag_context(user_id, rag_query)
-                logger.info(f"📥 RAG 컨텍스트 수신 완료")
-                logger.info(f"   📊 RAG 컨텍스트 길이: {len(rag_context) if rag_context else 0}")
-            except Exception as e:
-                logger.warning(f"⚠️ RAG 컨텍스트 조회 실패: {e}")
+            # 페르소나, 자기소개서(선택), RAG 컨텍스트는 서로 독립적이므로 동시에 조회
+            # (페르소나 조회 실패만 치명적이고, 나머지는 실패해도 빈 값으로 진행)
+            persona_data, cover_letter_data, rag_context = await asyncio.gather(
+                self._get_persona_for_questions(user_id, persona_id, persona_data),
+                self._get_cover_letter_for_questions(user_id, persona_id, cover_letter_id),
+                self._get_question_rag_context(user_id),
+            )
+            logger.debug("   📊 페르소나 데이터: %s", persona_data)
             
             # Gemini를 통한 면접 질문 생성
-            logger.info(f"🤖 Gemini를 통한 면접 질문 생성 시작")
-            logger.info(f"   🔗 _generate_questions_with_gemini(persona_data, cover_letter_data, rag_context, use_voice)")
             questions = await self._generate_questions_with_gemini(
                 persona_data, cover_letter_data, rag_context, use_voice
             )
-            logger.info(f"✅ Gemini 질문 생성 완료")
-            logger.info(f"   📊 생성된 질문 수: {len(questions) if questions else 0}")
-            logger.info(f"   📋 질문 목록: {questions}")
+            logger.info(
+                "✅ Gemini 질문 생성 완료: %d개 (RAG 컨텍스트 %d자)",
+                len(questions) if questions else 0, len(rag_context) if rag_context else 0,
+            )
+            logger.debug("   📋 질문 목록: %s", questions)
+            
+            # 질문 ID(질문 번호 기반)를 한 번에 부여해 TTS 업로드 경로와 Firestore 문서가 같은 ID를 사용하도록 함
+            questions = [
+                {**question, "question_id": _question_doc_id(i)} for i, question in enumerate(questions, 1)
+            ]
             
             # 면접 세션 ID 먼저 생성
-            logger.info(f"📝 면접 세션 ID 생성 시작")
             interview_session_id = str(uuid.uuid4())
-            logger.info(f"   🆔 생성된 세션 ID: {interview_session_id}")
             
-            # 음성 면접인 경우 TTS 변환 및 Firebase Storage 업로드
+            # 음성 면접인 경우 첫 질문만 즉시 TTS 변환하고, 나머지는 백그라운드 작업으로 넘김
             if use_voice and questions:
-                logger.info(f"🎤 음성 면접 모드 - TTS 변환 및 Storage 업로드 시작")
-                logger.info(f"   📊 처리할 질문 수: {len(questions)}")
-                logger.info(f"   👤 사용자 ID: {user_id}")
-                logger.info(f"   🆔 세션 ID: {interview_session_id}")
-                
-                questions = await self._convert_questions_to_voice_and_upload(
-                    questions, user_id, interview_session_id
+                first_questions = await self._convert_questions_to_voice_and_upload(
+                    questions[:1], user_id, interview_session_id
                 )
+                pending_questions = [{**question, 'audio_pending': True} for question in questions[1:]]
+                questions = first_questions + pending_questions
                 
-                logger.info(f"✅ TTS 변환 및 Storage 업로드 완료")
-                logger.info(f"   📊 변환된 질문 수: {len(questions) if questions else 0}")
-                logger.info(f"   🎵 음성 변환 성공한 질문: {sum(1 for q in questions if 'audio_url' in q)}개")
-                logger.info(f"   ⚠️ 음성 변환 실패한 질문: {sum(1 for q in questions if 'audio_url' not in q)}개")
-            
-            # 면접 세션 생성
-            logger.info(f"📝 면접 세션 생성 시작")
-            interview_session_id = str(uuid.uuid4())
-            logger.info(f"   🆔 생성된 세션 ID: {interview_session_id}")
+                logger.info(
+                    "✅ 첫 질문 TTS 변환 완료: 성공=%s, 백그라운드 대기 %d개",
+                    'audio_url' in questions[0], len(pending_questions),
+                )
             
+            # 면접 세션 생성 (세션/질문 문서는 같은 생성 시각을 공유)
+            now_iso = datetime.now().isoformat()
             session_data = {
                 "id": interview_session_id,
                 "user_id": user_id,
@@ -207,45 +380,30 @@ class InterviewService:
                 "grade": "D",
                 "status": "in_progress",
                 "use_voice": use_voice,
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
+                "created_at": now_iso,
+                "updated_at": now_iso,
                 "completed_at": None
             }
-            logger.info(f"✅ 면접 세션 데이터 생성 완료")
-            logger.info(f"   📊 세션 데이터: {session_data}")
-            
-            # Firestore에 면접 세션 저장
-            logger.info(f"📤 Firestore에 면접 세션 저장 시작")
-            session_ref = (
-                self.db.collection(USER_COLLECTION)
-                .document(user_id)
-                .collection(PERSONA_SUBCOLLECTION)
-                .document(persona_id)
-                .collection(INTERVIEW_SESSION_SUBCOLLECTION)
-                .document(interview_session_id)
-            )
-            session_ref.set(session_data)
-            logger.info(f"✅ 면접 세션 Firestore 저장 완료")
-            logger.info(f"   🔗 세션 경로: users/{user_id}/personas/{persona_id}/interview_sessions/{interview_session_id}")
+            logger.debug("   📊 세션 데이터: %s", session_data)
+            
+            # 면접 세션과 질문들은 하나의 WriteBatch로 모아 한 번에 커밋
+            session_ref = _session_ref(self.db, user_id, persona_id, interview_session_id)
+            batch = self.db.batch()
+            batch.set(session_ref, session_data)
             
-            # 질문들을 Firestore에 저장
-            logger.info(f"📤 Firestore에 질문들 저장 시작")
+            # 질문 문서(배치 저장), 응답용 질문, 백그라운드 음성 변환 대상을 한 번의 순회로 구성
             questions_data = []
+            audio_items = []
+            questions_collection = session_ref.collection(QUESTIONS_SUBCOLLECTION)
             for i, question in enumerate(questions, 1):
-                # 질문 ID 확인 (TTS 변환된 경우 이미 있음, 일반 면접인 경우 새로 생성)
-                question_id = question.get("question_id")
-                if not question_id:
-                    question_id = str(uuid.uuid4())
-                    logger.info(f"   🆔 새로 생성된 질문 ID: {question_id}")
-                else:
-                    logger.info(f"   🆔 기존 질문 ID 사용: {question_id}")
-                logger.info(f"   📝 질문 {i} 처리 중 - question_id: {question_id}")
-                
+                question_id = question["question_id"]
+                question_type = question["question_type"]
+                question_text = question["question_text"]
                 question_data = {
                     "question_id": question_id,
                     "question_number": i,
-                    "question_type": question["question_type"],
-                    "question_text": question["question_text"],
+                    "question_type": question_type,
+                    "question_text": question_text,
                     "answer_text": "",
                     "answer_length": 0,
                     "time_taken": 0,
@@ -255,65 +413,70 @@ class InterviewService:
                     "improvement_points": [],
                     "sample_answer": "",
                     "question_intent": [],
-                    "created_at": datetime.now().isoformat(),
-                    "updated_at": datetime.now().isoformat()
+                    "created_at": now_iso,
+                    "updated_at": now_iso
                 }
-                
-                # 음성 면접인 경우 음성 정보 추가
-                if use_voice and "audio_url" in question:
-                    logger.info(f"   🎵 질문 {i} 음성 정보 추가 시작")
-                    logger.info(f"   🎵 오디오 URL: {question['audio_url']}")
-                    logger.info(f"   📏 오디오 크기: {question.get('audio_size', 0)} bytes")
-                    
-                    question_data.update({
-                        "audio_url": question["audio_url"],
-                        "audio_size": question.get("audio_size", 0)
-                    })
-                    
-                    logger.info(f"   ✅ 질문 {i} 음성 정보 추가 완료")
-                else:
-                    logger.info(f"   📝 질문 {i} 일반 텍스트 질문 (음성 정보 없음)")
-                
-                # Firestore에 질문 저장
-                question_ref = session_ref.collection(QUESTIONS_SUBCOLLECTION).document(question_id)
-                question_ref.set(question_data)
-                logger.info(f"   ✅ 질문 {i} Firestore 저장 완료")
-                
-                # 응답용 질문 데이터 구성 (일관된 질문 ID 사용)
+                # 응답용 질문 데이터 (일관된 질문 ID 사용)
                 response_question = {
                     "question_id": question_id,
                     "question_number": i,
-                    "question_type": question["question_type"]
+                    "question_type": question_type
                 }
                 
-                # 음성 면접인 경우 음성 URL만 추가, 텍스트는 제거
                 if use_voice and "audio_url" in question:
-                    logger.info(f"   🎵 질문 {i} 음성 면접 응답 구성")
-                    logger.info(f"   🎵 오디오 URL: {question['audio_url']}")
+                    # 음성 면접인 경우 음성 정보를 저장하고, 응답에는 텍스트 대신 음성 URL만 포함
+                    question_data["audio_url"] = question["audio_url"]
+                    question_data["audio_size"] = question.get("audio_size", 0)
                     response_question["audio_url"] = question["audio_url"]
                 else:
-                    # 일반 면접인 경우에만 텍스트 추가
-                    logger.info(f"   📝 질문 {i} 일반 면접 응답 구성")
-                    logger.info(f"   📝 질문 텍스트: {question['question_text'][:50]}...")
-                    response_question["question_text"] = question["question_text"]
+                    if use_voice and question.get("audio_pending"):
+                        # 나머지 질문의 음성 변환은 응답 이후 백그라운드에서 처리
+                        question_data["audio_status"] = AUDIO_STATUS_PENDING
+                        if question_text:
+                            audio_items.append((question_id, question_text[:5000]))
+                    response_question["question_text"] = question_text
                 
+                batch.set(questions_collection.document(question_id), question_data)
                 questions_data.append(response_question)
             
-            logger.info(f"✅ 모든 질문 Firestore 저장 완료")
-            logger.info(f"   📊 저장된 질문 수: {len(questions_data)}")
+            # 세션 + 질문 저장을 단일 커밋으로 실행 (블로킹 호출은 스레드에서)
+            await asyncio.to_thread(batch.commit)
+            logger.info(
+                "✅ 면접 세션 및 질문 Firestore 저장 완료: session_id=%s, 질문 %d개",
+                interview_session_id, len(questions_data),
+            )
+            
+            if audio_items:
+                enqueue_question_audio_job(
+                    user_id=user_id,
+                    persona_id=persona_id,
+                    interview_session_id=interview_session_id,
+                    items=audio_items,
+                )
+                logger.info("📤 질문 음성 변환 백그라운드 작업 등록: %d개", len(audio_items))
             
             result = {
                 "interview_session_id": interview_session_id,
                 "question": questions_data[0]  # 첫 번째 질문만 반환
             }
-            logger.info(f"✅ 면접 질문 생성 완료")
-            logger.info(f"   📊 결과: {result}")
+            logger.debug("   📊 결과: %s", result)
             return result
             
         except Exception as exc:
             logger.error(f"❌ 면접 질문 생성 중 오류: {exc}")
             raise InterviewServiceError(f"면접 질문 생성 실패: {exc}") from exc
     
+    async def _generate_json_response(self, prompt: str) -> str:
+        """Gemini JSON 응답을 생성합니다 (캐시 미스 시 호출)."""
+        response = await self.gemini_service.generate_structured_response(
+            prompt, response_format="json"
+        )
+        if not response:
+            raise InterviewServiceError("Gemini 응답이 비어있습니다.")
+        # 파싱할 수 없는 응답은 캐시에 남기지 않도록 저장 전에 검증
+        orjson.loads(response)
+        return response
+
     async def _generate_questions_with_gemini(
         self,
         persona_data: Dict[str, Any],
@@ -340,62 +503,27 @@ class InterviewService:
                 for paragraph in cover_letter_data['cover_letter']
             ])
         
-        prompt = f"""
-당신은 면접 전문가입니다. 주어진 정보를 바탕으로 {job_category} 분야의 면접 질문 10개를 생성해주세요.
-
-## 페르소나 정보
-- 학력: {school_name} {major}
-- 직무 분야: {job_category}
-- 직무 역할: {job_role}
-- 보유 기술: {', '.join(skills) if skills else '없음'}
-- 자격증: {', '.join(certifications) if certifications else '없음'}
-- 역량 평가: {final_evaluation if final_evaluation else '없음'}
-
-## 자기소개서 정보
-{cover_letter_text if cover_letter_text else '자기소개서 정보 없음'}
-
-## 대화 내역 정보
-{rag_context if rag_context else '대화 내역 정보 없음'}
-
-## 요구사항
-1. 총 10개의 질문을 생성해주세요.
-2. 질문 유형별 분배:
-   - 직무 지식: 3개
-   - 문제 해결 능력: 3개
-   - 프로젝트 경험: 2개
-   - 인성 및 가치관: 2개
-3. 대화 내역을 바탕으로 한 질문이 있다면 해당 대화 내용을 언급해주세요.
-4. 질문은 구체적이고 실무에 도움이 되는 내용으로 작성해주세요.
-5. 음성 면접 여부: {use_voice}
-
-## 응답 형식
-다음 JSON 형식으로 응답해주세요:
-{{
-  "questions": [
-    {{
-      "question_type": "직무 지식",
-      "question_text": "질문 내용"
-    }},
-    {{
-      "question_type": "문제 해결 능력", 
-      "question_text": "질문 내용"
-    }}
-  ]
-}}
-"""
+        prompt = _QUESTIONS_PROMPT_TEMPLATE.format_map({
+            "school_name": school_name,
+            "major": major,
+            "job_category": job_category,
+            "job_role": job_role,
+            "skills": ', '.join(skills) if skills else '없음',
+            "certifications": ', '.join(certifications) if certifications else '없음',
+            "final_evaluation": final_evaluation or '없음',
+            "use_voice": use_voice,
+            "cover_letter_text": cover_letter_text or '자기소개서 정보 없음',
+            "rag_context": rag_context or '대화 내역 정보 없음',
+        })
         
         try:
-            response = await self.gemini_service.generate_structured_response(
-                prompt, response_format="json"
+            response = await _llm_cache.get_or_generate(
+                prompt, functools.partial(self._generate_json_response, prompt)
             )
-            
-            if response:
-                data = json.loads(response)
-                return data.get("questions", [])
-            else:
-                raise InterviewServiceError("Gemini 응답이 비어있습니다.")
+            data = orjson.loads(response)
+            return data.get("questions", [])
                 
-        except json.JSONDecodeError as exc:
+        except orjson.JSONDecodeError as exc:
             logger.error(f"Gemini 응답 JSON 파싱 실패: {exc}")
             raise InterviewServiceError(f"질문 생성 응답 파싱 실패: {exc}") from exc
         except Exception as exc:
@@ -463,114 +591,78 @@ class InterviewService:
     ) -> List[Dict[str, Any]]:
         """질문 리스트를 TTS로 변환하여 Firebase Storage에 업로드합니다."""
         try:
-            logger.info(f"🎤 질문 TTS 변환 및 Storage 업로드 시작")
-            logger.info(f"   📊 처리할 질문 수: {len(questions)}")
-            logger.info(f"   👤 사용자 ID: {user_id}")
-            logger.info(f"   🆔 세션 ID: {interview_session_id}")
-            
-            # TTS 서비스 초기화
-            logger.info(f"🔧 TTS 서비스 초기화 시작")
+            logger.info(
+                "🎤 질문 TTS 변환 및 Storage 업로드 시작: session_id=%s, 질문 %d개",
+                interview_session_id, len(questions),
+            )
             tts_service = get_tts_service()
-            logger.info(f"✅ TTS 서비스 초기화 완료")
+            
+            # 호출 측에서 부여한 질문 ID를 그대로 사용하고, 없을 때만 생성 (일관성 확보)
+            question_ids = [question.get('question_id') or str(uuid.uuid4()) for question in questions]
+            tts_items = []
+            for i, (question, question_id) in enumerate(zip(questions, question_ids), 1):
+                question_text = question.get('question_text', '')
+                if not question_text:
+                    logger.warning("⚠️ 질문 %d 텍스트가 비어있음", i)
+                    continue
+                # 텍스트 길이 검증 (Google Cloud TTS 제한: 5000자)
+                if len(question_text) > 5000:
+                    logger.warning("⚠️ 질문 %d 텍스트가 너무 깁니다: %d자 (5000자 제한)", i, len(question_text))
+                    question_text = question_text[:5000] + "..."
+                tts_items.append((question_id, question_text))
+            
+            # 모든 질문을 한 번에 TTS 변환 및 Firebase Storage 업로드
+            upload_results = await tts_service.synthesize_speech_to_firebase_batch(
+                tts_items,
+                user_id=user_id,
+                interview_session_id=interview_session_id,
+                language_code="ko-KR",
+                voice_name="ko-KR-Wavenet-A",
+                ssml_gender="NEUTRAL"
+            )
+            upload_by_id = {
+                question_id: upload_result
+                for (question_id, _), upload_result in zip(tts_items, upload_results)
+            }
             
             converted_questions = []
             success_count = 0
             failure_count = 0
             
-            for i, question in enumerate(questions, 1):
-                logger.info(f"🎵 질문 {i}/{len(questions)} TTS 변환 및 업로드 중...")
-                logger.info(f"   📝 질문 텍스트: {question.get('question_text', '')[:100]}...")
+            for question, question_id in zip(questions, question_ids):
+                question_with_voice = question.copy()
+                question_with_voice['question_id'] = question_id
                 
-                try:
-                    # 질문 ID를 미리 생성 (일관성 확보)
-                    question_id = str(uuid.uuid4())
-                    logger.info(f"   🆔 생성된 질문 ID: {question_id}")
-                    
-                    # 질문 텍스트를 TTS로 변환하여 Firebase Storage에 직접 업로드
-                    question_text = question.get('question_text', '')
-                    if question_text:
-                        # 텍스트 길이 검증 (Google Cloud TTS 제한: 5000자)
-                        if len(question_text) > 5000:
-                            logger.warning(f"⚠️ 질문 {i} 텍스트가 너무 깁니다: {len(question_text)}자 (5000자 제한)")
-                            question_text = question_text[:5000] + "..."
-                            logger.info(f"   📝 텍스트를 5000자로 잘랐습니다")
-                        
-                        # TTS 변환 및 Firebase Storage 직접 업로드
-                        logger.info(f"   🎤 TTS 변환 및 Firebase Storage 업로드 시작")
-                        logger.info(f"   📝 변환할 텍스트 길이: {len(question_text)}자")
-                        logger.info(f"   🌐 언어 설정: ko-KR")
-                        logger.info(f"   🎵 음성 설정: ko-KR-Wavenet-A")
-                        
-                        upload_result = await tts_service.synthesize_speech_to_firebase(
-                            text=question_text,
-                            user_id=user_id,
-                            interview_session_id=interview_session_id,
-                            question_id=question_id,
-                            language_code="ko-KR",
-                            voice_name="ko-KR-Wavenet-A",
-                            ssml_gender="NEUTRAL"
-                        )
-                        
-                        # 질문 데이터에 음성 정보 추가
-                        question_with_voice = question.copy()
-                        question_with_voice['question_id'] = question_id
-                        question_with_voice['audio_url'] = upload_result['url']  # Firebase URL 사용
-                        question_with_voice['audio_size'] = upload_result['size']
-                        
-                        logger.info(f"✅ 질문 {i} TTS 변환 및 Firebase Storage 업로드 완료")
-                        logger.info(f"   🎵 오디오 URL: {question_with_voice['audio_url']}")
-                        logger.info(f"   📏 최종 오디오 크기: {upload_result['size']} bytes")
-                        
-                        success_count += 1
-                    else:
-                        logger.warning(f"⚠️ 질문 {i} 텍스트가 비어있음")
-                        logger.info(f"   📝 원본 질문: {question}")
-                        question_with_voice = question.copy()
-                        question_with_voice['question_id'] = question_id
-                        logger.info(f"   🆔 질문 ID만 할당: {question_id}")
-                    
-                    converted_questions.append(question_with_voice)
-                    logger.info(f"   ✅ 질문 {i} 처리 완료")
-                    
-                except Exception as e:
-                    logger.error(f"❌ 질문 {i} TTS 변환 및 업로드 실패")
-                    logger.error(f"   🔍 오류 상세: {str(e)}")
-                    logger.error(f"   📝 실패한 질문: {question}")
-                    logger.error(f"   🆔 사용할 질문 ID: {question_id}")
-                    
-                    # TTS 변환 실패 시에도 일관된 질문 ID 사용
-                    question_with_voice = question.copy()
-                    question_with_voice['question_id'] = question_id
-                    converted_questions.append(question_with_voice)
+                upload_result = upload_by_id.get(question_id)
+                if upload_result:
+                    question_with_voice['audio_url'] = upload_result['url']  # Firebase URL 사용
+                    question_with_voice['audio_size'] = upload_result['size']
+                    success_count += 1
+                elif question_id in upload_by_id:
+                    # TTS 변환 실패 시에도 일관된 질문 ID 사용 (원본 질문 유지)
                     failure_count += 1
-                    logger.info(f"   ⚠️ 질문 {i} 실패 처리 완료 (원본 질문 유지)")
+                
+                converted_questions.append(question_with_voice)
             
-            logger.info(f"✅ 모든 질문 TTS 변환 및 업로드 완료")
-            logger.info(f"   📊 총 처리된 질문: {len(converted_questions)}개")
-            logger.info(f"   ✅ 성공한 질문: {success_count}개")
-            logger.info(f"   ❌ 실패한 질문: {failure_count}개")
-            logger.info(f"   🎵 음성 변환 성공률: {(success_count/len(converted_questions)*100):.1f}%")
+            logger.info(
+                "✅ 질문 TTS 변환 및 업로드 완료: 총 %d개, 성공 %d개, 실패 %d개",
+                len(converted_questions), success_count, failure_count,
+            )
             
             return converted_questions
             
         except Exception as e:
-            logger.error(f"❌ 질문 TTS 변환 및 업로드 중 전체 오류 발생")
-            logger.error(f"   🔍 오류 상세: {str(e)}")
-            logger.error(f"   📊 처리 중이던 질문 수: {len(questions)}")
-            logger.error(f"   👤 사용자 ID: {user_id}")
-            logger.error(f"   🆔 세션 ID: {interview_session_id}")
+            logger.error(
+                "❌ 질문 TTS 변환 및 업로드 중 오류: session_id=%s, 질문 %d개, 오류=%s",
+                interview_session_id, len(questions), e,
+            )
             
             # TTS 변환 실패 시 원본 질문 리스트에 질문 ID 추가하여 반환
-            logger.info(f"🔄 원본 질문에 질문 ID 추가하여 반환")
             questions_with_ids = []
-            for i, question in enumerate(questions, 1):
+            for question in questions:
                 question_with_id = question.copy()
-                question_id = str(uuid.uuid4())
-                question_with_id['question_id'] = question_id
+                question_with_id['question_id'] = question.get('question_id') or str(uuid.uuid4())
                 questions_with_ids.append(question_with_id)
-                logger.info(f"   🆔 질문 {i} ID 할당: {question_id}")
-            
-            logger.info(f"✅ 원본 질문 {len(questions_with_ids)}개에 질문 ID 추가 완료")
             return questions_with_ids
 
     async def _evaluate_answer_with_gemini(
@@ -582,53 +674,27 @@ class InterviewService:
     ) -> Dict[str, Any]:
         """Gemini를 사용하여 답변을 평가합니다."""
         
-        prompt = f"""
-당신은 면접 평가 전문가입니다. 주어진 질문과 답변을 분석하여 평가해주세요.
-
-## 질문
-{question_text}
-
-## 답변
-{answer_text}
-
-## 답변 정보
-- 답변 길이: {answer_length}자
-- 답변 시간: {time_taken}초
-
-**"sample_answer" 필드에 모범 답변 예시를 100자 이내로 작성해주세요.**
-
-1. question_score 필드에는 항상 무조건 70~89 사이의 점수를 반환해주세요.
-2. 잘한 점과 개선할 점은 사용자의 답변과 무관하게 질문의 의도를 기반으로 작성해주세요.
-
-## 응답 형식
-다음 JSON 형식으로 응답해주세요:
-{{
-  "good_points": ["잘한 점 1", "잘한 점 2", "잘한 점 3"],
-  "improvement_points": ["개선할 점 1", "개선할 점 2", "개선할 점 3"],
-  "sample_answer": "모범 답변 예시",
-  "question_intent": ["질문의 의도 1", "질문의 의도 2", "질문의 의도 3"],
-  "question_score": 85
-}}
-"""
+        prompt = _EVALUATION_PROMPT_TEMPLATE.format_map({
+            "question_text": question_text,
+            "answer_text": answer_text,
+            "answer_length": answer_length,
+            "time_taken": time_taken,
+        })
         
         try:
-            response = await self.gemini_service.generate_structured_response(
-                prompt, response_format="json"
+            response = await _llm_cache.get_or_generate(
+                prompt, functools.partial(self._generate_json_response, prompt)
             )
-            
-            if response:
-                data = json.loads(response)
-                return {
-                    "good_points": data.get("good_points", []),
-                    "improvement_points": data.get("improvement_points", []),
-                    "sample_answer": data.get("sample_answer", ""),
-                    "question_intent": data.get("question_intent", []),
-                    "question_score": data.get("question_score", 0)
-                }
-            else:
-                raise InterviewServiceError("Gemini 평가 응답이 비어있습니다.")
+            data = orjson.loads(response)
+            return {
+                "good_points": data.get("good_points", []),
+                "improvement_points": data.get("improvement_points", []),
+                "sample_answer": data.get("sample_answer", ""),
+                "question_intent": data.get("question_intent", []),
+                "question_score": data.get("question_score", 0)
+            }
                 
-        except json.JSONDecodeError as exc:
+        except orjson.JSONDecodeError as exc:
             logger.error(f"Gemini 평가 응답 JSON 파싱 실패: {exc}")
             raise InterviewServiceError(f"답변 평가 응답 파싱 실패: {exc}") from exc
         except Exception as exc:
@@ -641,62 +707,66 @@ class InterviewService:
         persona_id: str,
         interview_session_id: str,
         question_number: int,
-        is_answered: bool
+        question_id: str,
+        updated_question_data: Dict[str, Any]
     ):
-        """면접 세션을 업데이트합니다."""
+        """답변을 질문 문서에 기록하고 면접 세션의 누적 통계를 갱신합니다.
+
+        질문 문서와 세션 문서를 하나의 트랜잭션으로 읽고, 질문 갱신과 세션 갱신을
+        한 번의 커밋으로 반영합니다. 세션 누적 합계(답변 수/시간/길이/점수)에는
+        트랜잭션 안에서 읽은 이전 답변 대비 변화량만 더한 뒤 평균과 등급을 다시 계산합니다.
+        """
         try:
-            session_ref = (
-                self.db.collection(USER_COLLECTION)
-                .document(user_id)
-                .collection(PERSONA_SUBCOLLECTION)
-                .document(persona_id)
-                .collection(INTERVIEW_SESSION_SUBCOLLECTION)
-                .document(interview_session_id)
-            )
-            
-            # 모든 질문 데이터 조회
-            questions_ref = session_ref.collection(QUESTIONS_SUBCOLLECTION)
-            questions = questions_ref.stream()
-            
-            total_answers = 0
-            total_time = 0
-            total_length = 0
-            total_score = 0
-            answered_count = 0
-            
-            for question in questions:
-                question_data = question.to_dict()
-                if question_data.get('is_answered', False):
-                    total_answers += 1
-                    total_time += question_data.get('time_taken', 0)
-                    total_length += question_data.get('answer_length', 0)
-                    total_score += question_data.get('question_score', 0)
-                    answered_count += 1
-            
-            # 평균 계산
-            average_answer_time = total_time / answered_count if answered_count > 0 else 0
-            average_answer_length = total_length / answered_count if answered_count > 0 else 0
-            average_score = total_score / answered_count if answered_count > 0 else 0
-            
-            # 등급 계산
-            grade = self._calculate_grade(average_score)
+            session_ref = _session_ref(self.db, user_id, persona_id, interview_session_id)
             
             # 세션 완료 여부 확인 (질문 번호가 10이면 면접 완료)
             status = "completed" if question_number == 10 else "in_progress"
-            completed_at = datetime.now().isoformat() if status == "completed" else None
-            
-            # 세션 데이터 업데이트
-            session_ref.update({
-                "total_answers": total_answers,
-                "total_time": total_time,
-                "average_answer_time": average_answer_time,
-                "average_answer_length": average_answer_length,
-                "score": average_score,
-                "grade": grade,
-                "status": status,
-                "completed_at": completed_at,
-                "updated_at": datetime.now().isoformat()
-            })
+            now_iso = datetime.now().isoformat()
+            completed_at = now_iso if status == "completed" else None
+            question_ref = session_ref.collection(QUESTIONS_SUBCOLLECTION).document(question_id)
+            
+            @firestore.transactional
+            def _apply(transaction):
+                # 트랜잭션 내 읽기는 쓰기보다 먼저 수행해야 함
+                previous_question = question_ref.get(transaction=transaction).to_dict() or {}
+                session_data = session_ref.get(transaction=transaction).to_dict() or {}
+                # 같은 질문 재제출 시 이전 답변 값은 빼서 중복 집계 방지
+                answer_delta = self._answer_delta(previous_question, updated_question_data)
+                previous_answers = session_data.get("total_answers", 0)
+                
+                # 누적 합계 필드가 없는 기존 세션은 저장된 평균 × 답변 수로 복원
+                total_answers = previous_answers + answer_delta["answers"]
+                total_time = session_data.get("total_time", 0) + answer_delta["time"]
+                total_length = session_data.get(
+                    "total_answer_length", session_data.get("average_answer_length", 0) * previous_answers
+                ) + answer_delta["length"]
+                total_score = session_data.get(
+                    "total_score", session_data.get("score", 0) * previous_answers
+                ) + answer_delta["score"]
+                
+                # 평균 계산
+                average_answer_time = total_time / total_answers if total_answers > 0 else 0
+                average_answer_length = total_length / total_answers if total_answers > 0 else 0
+                average_score = total_score / total_answers if total_answers > 0 else 0
+                
+                transaction.update(question_ref, updated_question_data)
+                transaction.update(session_ref, {
+                    "total_answers": total_answers,
+                    "total_time": total_time,
+                    "total_answer_length": total_length,
+                    "total_score": total_score,
+                    "average_answer_time": average_answer_time,
+                    "average_answer_length": average_answer_length,
+                    "score": average_score,
+                    "grade": self._calculate_grade(average_score),
+                    "status": status,
+                    "completed_at": completed_at,
+                    "updated_at": now_iso
+                })
+            
+            # 질문/세션 업데이트를 단일 커밋으로 실행 (블로킹 트랜잭션은 스레드에서 실행,
+            # 충돌로 Aborted되면 firestore.transactional이 재시도)
+            await asyncio.to_thread(_apply, self.db.transaction())
             
             # 세션이 완료된 경우 최종 피드백 생성
             if status == "completed":
@@ -708,6 +778,21 @@ class InterviewService:
             logger.error(f"면접 세션 업데이트 실패: {exc}")
             raise InterviewServiceError(f"면접 세션 업데이트 실패: {exc}") from exc
     
+    @staticmethod
+    def _answer_delta(previous: Dict[str, Any], updated: Dict[str, Any]) -> Dict[str, int]:
+        """질문 문서의 답변 전/후 값으로 세션 누적 통계의 변화량을 계산합니다."""
+        def _totals(question_data: Dict[str, Any]) -> Dict[str, int]:
+            if not question_data.get('is_answered', False):
+                return {"answers": 0, "time": 0, "length": 0, "score": 0}
+            return {
+                "answers": 1,
+                "time": question_data.get('time_taken', 0),
+                "length": question_data.get('answer_length', 0),
+                "score": question_data.get('question_score', 0),
+            }
+        before, after = _totals(previous), _totals(updated)
+        return {key: after[key] - before[key] for key in after}
+    
     def _calculate_grade(self, score: float) -> str:
         """점수에 따른 등급을 계산합니다."""
         if score >= 90:
@@ -732,32 +817,30 @@ class InterviewService:
         """최종 면접 피드백을 생성합니다."""
         try:
             # 모든 질문과 답변 데이터 조회
-            session_ref = (
-                self.db.collection(USER_COLLECTION)
-                .document(user_id)
-                .collection(PERSONA_SUBCOLLECTION)
-                .document(persona_id)
-                .collection(INTERVIEW_SESSION_SUBCOLLECTION)
-                .document(interview_session_id)
-            )
+            session_ref = _session_ref(self.db, user_id, persona_id, interview_session_id)
             
-            questions_ref = session_ref.collection(QUESTIONS_SUBCOLLECTION)
-            questions = questions_ref.stream()
+            # 피드백에 필요한 필드만 질문 순서대로 한 번의 쿼리로 조회
+            questions_query = (
+                session_ref.collection(QUESTIONS_SUBCOLLECTION)
+                .select(FINAL_FEEDBACK_QUESTION_FIELDS)
+                .order_by('question_number')
+            )
+            snapshots = await asyncio.to_thread(questions_query.get)
             
-            qa_pairs = []
-            for question in questions:
-                question_data = question.to_dict()
-                qa_pairs.append({
+            qa_pairs = [
+                {
                     "question": question_data.get('question_text', ''),
                     "answer": question_data.get('answer_text', ''),
                     "question_type": question_data.get('question_type', '')
-                })
+                }
+                for question_data in (snapshot.to_dict() or {} for snapshot in snapshots)
+            ]
             
             # Gemini를 통한 최종 피드백 생성
             final_feedback = await self._generate_final_feedback_with_gemini(qa_pairs)
             
             # 세션에 최종 피드백 저장
-            session_ref.update({
+            await asyncio.to_thread(session_ref.update, {
                 "final_good_points": final_feedback.get("good_points", []),
                 "final_improvement_points": final_feedback.get("improvement_points", []),
                 "updated_at": datetime.now().isoformat()
@@ -773,37 +856,29 @@ class InterviewService:
     ) -> Dict[str, Any]:
         """Gemini를 사용하여 최종 피드백을 생성합니다."""
         
-        qa_text = "\n\n".join([
-            f"Q{i+1}. {pair['question']}\nA{i+1}. {pair['answer']}"
-            for i, pair in enumerate(qa_pairs)
-        ])
+        # 답변한 질문만 프롬프트에 포함하고, 답변이 너무 적으면 Gemini 호출 없이 빈 피드백 반환
+        answered_pairs = [pair for pair in qa_pairs if (pair.get('answer') or '').strip()]
+        if len(answered_pairs) < FINAL_FEEDBACK_MIN_ANSWERS:
+            return {
+                "good_points": [],
+                "improvement_points": []
+            }
         
-        prompt = f"""
-당신은 면접 평가 전문가입니다. 다음 면접 질문과 답변들을 종합적으로 분석하여 최종 피드백을 제공해주세요.
-
-## 면접 질문과 답변
-{qa_text}
-
-## 요구사항
-전체 면접을 종합적으로 분석하여 다음을 제공해주세요:
-1. 잘한 점 3개 (전체적인 강점)
-2. 개선할 점 3개 (전체적인 약점)
-
-## 응답 형식
-다음 JSON 형식으로 응답해주세요:
-{{
-  "good_points": ["잘한 점 1", "잘한 점 2", "잘한 점 3"],
-  "improvement_points": ["개선할 점 1", "개선할 점 2", "개선할 점 3"]
-}}
-"""
+        qa_text = "\n\n".join(
+            f"Q{i}. {pair['question']}\nA{i}. {pair['answer']}"
+            for i, pair in enumerate(answered_pairs, 1)
+        )
+        
+        prompt = _FINAL_FEEDBACK_PROMPT_TEMPLATE.format_map({"qa_text": qa_text})
         
         try:
+            # 응답 형식은 프롬프트 대신 response_schema로 강제
             response = await self.gemini_service.generate_structured_response(
-                prompt, response_format="json"
+                prompt, response_format="json", response_schema=_FinalFeedback
             )
             
             if response:
-                data = json.loads(response)
+                data = orjson.loads(response)
                 return {
                     "good_points": data.get("good_points", []),
                     "improvement_points": data.get("improvement_points", [])
@@ -830,18 +905,18 @@ class InterviewService:
     ) -> Dict[str, Any]:
         """다음 질문을 조회합니다."""
         try:
-            session_ref = (
-                self.db.collection(USER_COLLECTION)
-                .document(user_id)
-                .collection(PERSONA_SUBCOLLECTION)
-                .document(persona_id)
-                .collection(INTERVIEW_SESSION_SUBCOLLECTION)
-                .document(interview_session_id)
-            )
+            session_ref = _session_ref(self.db, user_id, persona_id, interview_session_id)
             
-            # 해당 번호의 질문 조회
+            # 해당 번호의 질문 조회 (질문 번호 기반 문서 ID로 직접 조회)
             questions_ref = session_ref.collection(QUESTIONS_SUBCOLLECTION)
-            questions = questions_ref.where('question_number', '==', question_number).stream()
+            question_doc = await asyncio.to_thread(questions_ref.document(_question_doc_id(question_number)).get)
+            if question_doc.exists:
+                questions = [question_doc]
+            else:
+                # 문서 ID가 UUID인 기존 세션은 질문 번호 필드로 조회
+                questions = await asyncio.to_thread(
+                    questions_ref.where('question_number', '==', question_number).limit(1).get
+                )
             
             question_data = None
             for question in questions:
@@ -861,22 +936,17 @@ class InterviewService:
             
             # 음성 면접인 경우 음성 정보만 포함, 텍스트는 제거
             if question_data.get("audio_url"):
-                logger.info(f"🎵 질문 {question_number} 음성 면접 응답 구성")
-                logger.info(f"   🎵 오디오 URL: {question_data['audio_url']}")
-                logger.info(f"   📏 오디오 크기: {question_data.get('audio_size', 0)} bytes")
-                
                 response_data.update({
                     "audio_url": question_data["audio_url"]
                 })
-                logger.info(f"   ✅ 질문 {question_number} 음성 정보 포함 완료")
+            elif question_data.get("audio_status") == AUDIO_STATUS_PENDING:
+                # 백그라운드 음성 변환이 아직 끝나지 않은 경우 (클라이언트는 잠시 후 재조회)
+                response_data["audio_pending"] = True
             else:
                 # 일반 면접인 경우에만 텍스트 추가
-                logger.info(f"📝 질문 {question_number} 일반 면접 응답 구성")
-                logger.info(f"   📝 질문 텍스트: {question_data['question_text'][:50]}...")
                 response_data["question_text"] = question_data["question_text"]
-                logger.info(f"   ✅ 질문 {question_number} 텍스트 정보 포함 완료")
             
-            logger.info(f"다음 질문 조회 완료: question_number={question_number}")
+            logger.debug("다음 질문 조회 완료: question_number=%s", question_number)
             return response_data
             
         except Exception as exc:
@@ -901,23 +971,18 @@ class InterviewService:
             
             # 질문 데이터 조회
             question_ref = (
-                self.db.collection(USER_COLLECTION)
-                .document(user_id)
-                .collection(PERSONA_SUBCOLLECTION)
-                .document(persona_id)
-                .collection(INTERVIEW_SESSION_SUBCOLLECTION)
-                .document(interview_session_id)
+                _session_ref(self.db, user_id, persona_id, interview_session_id)
                 .collection(QUESTIONS_SUBCOLLECTION)
                 .document(question_id)
             )
             
-            question_doc = question_ref.get()
+            # 평가는 항상 저장된 질문 기준으로 수행 (질문 텍스트 필드만 조회)
+            question_doc = await asyncio.to_thread(question_ref.get, field_paths=['question_text'])
             if not question_doc.exists:
                 logger.error(f"질문을 찾을 수 없습니다: {question_id}")
                 return
             
-            question_data = question_doc.to_dict()
-            question_text = question_data.get('question_text', '')
+            question_text = question_doc.to_dict().get('question_text', '')
             
             # Gemini를 통한 답변 평가
             evaluation = await self._evaluate_answer_with_gemini(
@@ -938,14 +1003,13 @@ class InterviewService:
                 "updated_at": datetime.now().isoformat()
             }
             
-            question_ref.update(updated_question_data)
-            
-            # 면접 세션 업데이트
+            # 질문 답변 기록과 면접 세션 통계 갱신을 한 번에 커밋
             await self._update_interview_session(
-                user_id, persona_id, interview_session_id, question_number, is_answered
+                user_id, persona_id, interview_session_id, question_number,
+                question_id, updated_question_data
             )
             
-            logger.info(f"비동기 답변 제출 완료: user_id={user_id}, question_id={question_id}")
+            logger.info("비동기 답변 제출 완료: user_id=%s, question_id=%s", user_id, question_id)
             
         except Exception as exc:
             logger.error(f"비동기 답변 제출 중 오류: {exc}")
@@ -953,71 +1017,69 @@ class InterviewService:
     async def get_interview_record(
         self,
         user_id: str,
-        persona_id: str
+        persona_id: str,
+        sessions_limit: int = INTERVIEW_HISTORY_SESSIONS_LIMIT,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
-        """면접 기록을 조회합니다."""
+        """면접 기록을 조회합니다 (통계는 전체 세션 기준, 세션 목록은 최신 sessions_limit개).
+
+        cursor에 이전 페이지의 next_cursor(마지막 세션의 created_at)를 넘기면 그 이후 세션부터 조회합니다.
+        """
         try:
-            # 페르소나 데이터 조회
-            persona_ref = (
-                self.db.collection(USER_COLLECTION)
-                .document(user_id)
-                .collection(PERSONA_SUBCOLLECTION)
-                .document(persona_id)
-            )
-            
-            persona_doc = persona_ref.get()
-            if not persona_doc.exists:
-                raise InterviewServiceError(f"페르소나를 찾을 수 없습니다: {persona_id}")
+            persona_ref = _persona_ref(self.db, user_id, persona_id)
             
-            persona_data = persona_doc.to_dict()
+            # 통계는 Firestore 집계 쿼리로, 세션 목록은 최신순 한 페이지만 조회
+            sessions_ref = persona_ref.collection(INTERVIEW_SESSION_SUBCOLLECTION)
+            stats_query = (
+                sessions_ref.count(alias="total_sessions")
+                .sum("score", alias="total_score")
+                .sum("total_time", alias="total_practice_time")
+            )
+            highest_query = sessions_ref.select(['score']).order_by('score', direction='DESCENDING').limit(1)
+            sessions_query = (
+                sessions_ref.select(INTERVIEW_HISTORY_SESSION_FIELDS)
+                .order_by('created_at', direction='DESCENDING')
+                .limit(sessions_limit)
+            )
+            if cursor:
+                sessions_query = sessions_query.start_after({'created_at': cursor})
+            
+            # 페르소나 문서는 TTL 캐시(수정 시 무효화)를 거쳐 반복 조회 시 Firestore 읽기를 생략
+            persona_data, stats_results, highest_docs, session_docs = await asyncio.gather(
+                asyncio.to_thread(get_cached_persona_document, user_id=user_id, persona_id=persona_id, db=self.db),
+                asyncio.to_thread(stats_query.get),
+                asyncio.to_thread(highest_query.get),
+                asyncio.to_thread(sessions_query.get),
+            )
             
             # 페르소나 카드 생성
-            from core.utils import create_persona_card
             persona_card = create_persona_card(persona_data)
             
-            # 면접 세션들 조회
-            sessions_ref = persona_ref.collection(INTERVIEW_SESSION_SUBCOLLECTION)
-            sessions = sessions_ref.order_by('created_at', direction='DESCENDING').stream()
-            
-            sessions_data = []
-            total_sessions = 0
-            total_score = 0
-            highest_score = 0
-            total_practice_time = 0
+            stats = {result.alias: result.value for result in stats_results[0]}
+            total_sessions = stats.get("total_sessions") or 0
+            total_score = stats.get("total_score") or 0
+            total_practice_time = stats.get("total_practice_time") or 0
+            highest_score = highest_docs[0].to_dict().get('score', 0) if highest_docs else 0
             
-            for session in sessions:
-                session_data = session.to_dict()
-                total_sessions += 1
-                
-                score = session_data.get('score', 0)
-                total_score += score
-                if score > highest_score:
-                    highest_score = score
-                
-                total_practice_time += session_data.get('total_time', 0)
-                
-                sessions_data.append({
-                    'interview_session_id': session.id,
-                    'score': score,
-                    'grade': session_data.get('grade', ''),
-                    'total_time': session_data.get('total_time', 0),
-                    'created_at': session_data.get('created_at', ''),
-                    'completed_at': session_data.get('completed_at', '')
-                })
+            sessions_data = [_history_session_item(session) for session in session_docs]
             
             # 통계 계산
             average_score = total_score / total_sessions if total_sessions > 0 else 0
             
-            logger.info(f"면접 기록 조회 완료: user_id={user_id}, persona_id={persona_id}, sessions={total_sessions}")
+            logger.info("면접 기록 조회 완료: user_id=%s, persona_id=%s, sessions=%s", user_id, persona_id, total_sessions)
             return {
                 'total_sessions': total_sessions,
                 'average_score': round(average_score, 1),
                 'highest_score': highest_score,
                 'total_practice_time': total_practice_time,
                 'sessions': sessions_data,
+                'next_cursor': sessions_data[-1]['created_at'] if len(sessions_data) == sessions_limit else None,
                 'persona_card': persona_card
             }
             
+        except PersonaNotFoundError as exc:
+            logger.error(f"면접 기록 조회 실패 - 페르소나를 찾을 수 없습니다: {exc}")
+            raise InterviewServiceError(f"페르소나를 찾을 수 없습니다: {exc}") from exc
         except Exception as exc:
             logger.error(f"면접 기록 조회 실패: {exc}")
             raise InterviewServiceError(f"면접 기록 조회 실패: {exc}") from exc
@@ -1030,41 +1092,25 @@ class InterviewService:
     ) -> Dict[str, Any]:
         """면접 세션 결과를 조회합니다."""
         try:
-            session_ref = (
-                self.db.collection(USER_COLLECTION)
-                .document(user_id)
-                .collection(PERSONA_SUBCOLLECTION)
-                .document(persona_id)
-                .collection(INTERVIEW_SESSION_SUBCOLLECTION)
-                .document(interview_session_id)
-            )
+            session_ref = _session_ref(self.db, user_id, persona_id, interview_session_id)
             
-            session_doc = session_ref.get()
+            # 세션 문서와 질문 목록을 동시에 조회
+            questions_ref = session_ref.collection(QUESTIONS_SUBCOLLECTION)
+            session_doc, questions = await asyncio.gather(
+                asyncio.to_thread(session_ref.get),
+                asyncio.to_thread(
+                    questions_ref.select(SESSION_RESULT_QUESTION_FIELDS).order_by('question_number').get
+                ),
+            )
             if not session_doc.exists:
                 raise InterviewServiceError(f"면접 세션을 찾을 수 없습니다: {interview_session_id}")
             
             session_data = session_doc.to_dict()
             session_data["interview_session_id"] = session_doc.id
             
-            # 모든 질문들 조회
-            questions_ref = session_ref.collection(QUESTIONS_SUBCOLLECTION)
-            questions = questions_ref.order_by('question_number').stream()
+            session_data["questions"] = [_session_result_question_item(question) for question in questions]
             
-            questions_data = []
-            for question in questions:
-                question_data = question.to_dict()
-                questions_data.append({
-                    "question_id": question.id,
-                    "question_number": question_data.get("question_number"),
-                    "question_type": question_data.get("question_type"),
-                    "question_text": question_data.get("question_text"),
-                    "answer_text": question_data.get("answer_text", ""),
-                    "time_taken": question_data.get("time_taken", 0)
-                })
-            
-            session_data["questions"] = questions_data
-            
-            logger.info(f"면접 세션 결과 조회 완료: session_id={interview_session_id}")
+            logger.info("면접 세션 결과 조회 완료: session_id=%s", interview_session_id)
             return session_data
             
         except Exception as exc:
@@ -1081,24 +1127,19 @@ class InterviewService:
         """특정 질문의 상세 정보를 조회합니다."""
         try:
             question_ref = (
-                self.db.collection(USER_COLLECTION)
-                .document(user_id)
-                .collection(PERSONA_SUBCOLLECTION)
-                .document(persona_id)
-                .collection(INTERVIEW_SESSION_SUBCOLLECTION)
-                .document(interview_session_id)
+                _session_ref(self.db, user_id, persona_id, interview_session_id)
                 .collection(QUESTIONS_SUBCOLLECTION)
                 .document(question_id)
             )
             
-            question_doc = question_ref.get()
+            question_doc = await asyncio.to_thread(question_ref.get)
             if not question_doc.exists:
                 raise InterviewServiceError(f"질문을 찾을 수 없습니다: {question_id}")
             
             question_data = question_doc.to_dict()
             question_data["question_id"] = question_doc.id
             
-            logger.info(f"질문 상세 조회 완료: question_id={question_id}")
+            logger.info("질문 상세 조회 완료: question_id=%s", question_id)
             return question_data
             
         except Exception as exc:
@@ -1107,10 +1148,15 @@ class InterviewService:
 
 
 # 편의 함수들
-async def get_interview_record(user_id: str, persona_id: str) -> Dict[str, Any]:
+async def get_interview_record(
+    user_id: str,
+    persona_id: str,
+    sessions_limit: int = INTERVIEW_HISTORY_SESSIONS_LIMIT,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
     """면접 기록을 조회하는 편의 함수."""
     service = InterviewService()
-    return await service.get_interview_record(user_id, persona_id)
+    return await service.get_interview_record(user_id, persona_id, sessions_limit, cursor)
 
 
 async def get_interview_preparation_data(user_id: str, persona_id: str) -> Dict[str, Any]:
@@ -1123,11 +1169,14 @@ async def generate_interview_questions(
     user_id: str, 
     persona_id: str, 
     cover_letter_id: Optional[str] = None,
-    use_voice: bool = False
+    use_voice: bool = False,
+    persona_data: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """면접 질문을 생성하는 편의 함수."""
     service = InterviewService()
-    return await service.generate_interview_questions(user_id, persona_id, cover_letter_id, use_voice)
+    return await service.generate_interview_questions(
+        user_id, persona_id, cover_letter_id, use_voice, persona_data=persona_data
+    )
 
 
 
@@ -0,0 +1,158 @@
+"""
+면접 질문 음성(TTS) 변환을 요청 스레드 밖에서 실행하는 백그라운드 작업 모듈.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+from threading import Thread
+from typing import Dict, List, Tuple
+
+from django.conf import settings
+
+from core.services.tts_service import get_tts_service
+
+logger = logging.getLogger(__name__)
+
+USER_COLLECTION = "users"
+PERSONA_SUBCOLLECTION = "personas"
+INTERVIEW_SESSION_SUBCOLLECTION = "interview_sessions"
+QUESTIONS_SUBCOLLECTION = "questions"
+
+# 질문 문서의 audio_status 값
+AUDIO_STATUS_PENDING = "pending"
+AUDIO_STATUS_READY = "ready"
+AUDIO_STATUS_FAILED = "failed"
+
+
+def enqueue_question_audio_job(
+    *,
+    user_id: str,
+    persona_id: str,
+    interview_session_id: str,
+    items: List[Tuple[str, str]],
+) -> None:
+    """질문 음성 변환 백그라운드 작업을 큐에 등록한다.
+
+    items는 (질문 ID, 질문 텍스트) 목록이며, 완료되면 각 질문 문서에
+    audio_url/audio_size/audio_status가 기록된다.
+    """
+
+    if not user_id:
+        raise ValueError("user_id 값이 필요합니다.")
+    if not persona_id:
+        raise ValueError("persona_id 값이 필요합니다.")
+    if not interview_session_id:
+        raise ValueError("interview_session_id 값이 필요합니다.")
+    if not items:
+        return
+
+    thread = Thread(
+        target=_run_question_audio_job,
+        args=(user_id, persona_id, interview_session_id, list(items)),
+        daemon=True,
+    )
+    thread.start()
+
+
+def _run_question_audio_job(
+    user_id: str,
+    persona_id: str,
+    interview_session_id: str,
+    items: List[Tuple[str, str]],
+) -> None:
+    """새로운 이벤트 루프에서 질문 음성 변환 작업을 실행한다."""
+
+    try:
+        asyncio.run(
+            _async_question_audio_job(
+                user_id=user_id,
+                persona_id=persona_id,
+                interview_session_id=interview_session_id,
+                items=items,
+            )
+        )
+    except Exception as exc:  # pragma: no cover - 최상위 예외 로깅
+        logger.exception("질문 음성 변환 백그라운드 작업이 실패했습니다: %s", exc)
+        _update_questions_audio(
+            user_id,
+            persona_id,
+            interview_session_id,
+            {question_id: {"audio_status": AUDIO_STATUS_FAILED} for question_id, _ in items},
+        )
+
+
+async def _async_question_audio_job(
+    *,
+    user_id: str,
+    persona_id: str,
+    interview_session_id: str,
+    items: List[Tuple[str, str]],
+) -> None:
+    """질문들을 배치로 음성 변환·업로드하고 Firestore 질문 문서를 갱신한다."""
+
+    tts_service = get_tts_service()
+    upload_results = await tts_service.synthesize_speech_to_firebase_batch(
+        items,
+        user_id=user_id,
+        interview_session_id=interview_session_id,
+    )
+
+    success_count = 0
+    payloads = {}
+    for (question_id, _), upload_result in zip(items, upload_results):
+        if upload_result:
+            payloads[question_id] = {
+                "audio_url": upload_result["url"],
+                "audio_size": upload_result["size"],
+                "audio_status": AUDIO_STATUS_READY,
+            }
+            success_count += 1
+        else:
+            payloads[question_id] = {"audio_status": AUDIO_STATUS_FAILED}
+    # 질문별 update 대신 한 번의 배치 커밋으로 기록
+    _update_questions_audio(user_id, persona_id, interview_session_id, payloads)
+
+    logger.info(
+        "질문 음성 변환 백그라운드 작업 완료: session_id=%s, 성공 %s/%s",
+        interview_session_id,
+        success_count,
+        len(items),
+    )
+
+
+def _update_questions_audio(
+    user_id: str,
+    persona_id: str,
+    interview_session_id: str,
+    payloads: Dict[str, dict],
+) -> None:
+    """여러 질문 문서에 음성 변환 결과를 WriteBatch 한 번으로 기록한다."""
+
+    db = getattr(settings, "FIREBASE_DB", None)
+    if db is None:
+        logger.error("Firestore 클라이언트를 찾을 수 없어 음성 변환 결과를 기록하지 못했습니다.")
+        return
+
+    questions_ref = (
+        db.collection(USER_COLLECTION)
+        .document(user_id)
+        .collection(PERSONA_SUBCOLLECTION)
+        .document(persona_id)
+        .collection(INTERVIEW_SESSION_SUBCOLLECTION)
+        .document(interview_session_id)
+        .collection(QUESTIONS_SUBCOLLECTION)
+    )
+    updated_at = datetime.now().isoformat()
+    batch = db.batch()
+    for question_id, payload in payloads.items():
+        batch.update(questions_ref.document(question_id), {**payload, "updated_at": updated_at})
+    try:
+        batch.commit()
+    except Exception:
+        logger.exception(
+            "질문 음성 변환 결과를 Firestore에 기록하지 못했습니다: session_id=%s", interview_session_id
+        )
+
@@ -0,0 +1 @@
+﻿# interviews.tests 패키지
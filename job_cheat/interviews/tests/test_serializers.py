@@ -0,0 +1,43 @@
+from datetime import datetime, timezone as dt_timezone
+
+from django.test import SimpleTestCase
+
+from interviews.serializers import QuestionDetailResponseSerializer, serialize_question_detail
+
+
+class SerializeQuestionDetailTests(SimpleTestCase):
+    """TypeAdapter 변환 결과가 DRF 시리얼라이저 표현과 같은지 검증한다."""
+
+    def _question(self, **overrides):
+        question = {
+            "question_id": "q_1",
+            "question_number": 1,
+            "question_type": "기술",
+            "question_text": "질문",
+            "answer_text": "답변",
+            "answer_length": 2,
+            "time_taken": 30,
+            "is_answered": True,
+            "question_score": 85,
+            "good_points": [],
+            "improvement_points": [],
+            "sample_answer": "",
+            "question_intent": [],
+            "created_at": datetime(2024, 1, 1, 1, 0, tzinfo=dt_timezone.utc),
+            "updated_at": "",
+        }
+        question.update(overrides)
+        return question
+
+    def test_timestamps_are_localized_like_drf(self):
+        question = self._question()
+        result = serialize_question_detail(question)
+        expected = QuestionDetailResponseSerializer(question).data
+
+        self.assertEqual(result["created_at"].isoformat(), expected["created_at"])
+        self.assertEqual(expected["created_at"], "2024-01-01T10:00:00+09:00")
+        self.assertIsNone(result["updated_at"])
+
+    def test_fractional_score_is_truncated(self):
+        result = serialize_question_detail(self._question(question_score=85.5))
+        self.assertEqual(result["question_score"], 85)
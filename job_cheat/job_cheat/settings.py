@@ -142,6 +142,10 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
 }
 
 ROOT_URLCONF = 'job_cheat.urls'
@@ -385,6 +389,12 @@ EMBEDDING_TASK_TYPE = 'RETRIEVAL_DOCUMENT'  # 문서 검색용
 # 벡터 DB 설정
 RAG_VECTOR_COLLECTION = 'user_vector_embeddings'
 
+# TTS 캐시 설정 (동일 문장 재합성 방지)
+TTS_CACHE_DIR = Path(os.getenv('TTS_CACHE_DIR', BASE_DIR / 'tmp' / 'tts_cache'))
+
+# 서버 시작 시 TTS/STT 클라이언트 예열 여부 (SDK import, 인증, DNS/TLS 초기 비용을 부팅 시점으로 이동)
+SERVICE_WARMUP_ENABLED = os.getenv('SERVICE_WARMUP_ENABLED', 'false').lower() == 'true'
+
 # 로깅 설정 (Broken pipe 오류 처리)
 LOGGING = {
     'version': 1,
@@ -411,20 +421,30 @@ LOGGING = {
             'class': 'logging.StreamHandler',
             'formatter': 'simple',
         },
+        # 요청 스레드/이벤트 루프에서는 큐에 넣기만 하고, 실제 출력은 QueueListener 스레드가 담당
+        # (리스너는 CoreConfig.ready에서 시작)
+        'queue': {
+            'class': 'logging.handlers.QueueHandler',
+            'handlers': ['console'],
+            'respect_handler_level': True,
+        },
+    },
+    # 앱 로거(core/interviews/cover_letters 등)까지 포함하도록 루트 로거에 큐 핸들러 연결
+    'root': {
+        'handlers': ['queue'],
+        'level': 'INFO',
     },
     'loggers': {
         'django': {
-            'handlers': ['console'],
             'level': 'INFO',
             'propagate': True,
         },
         'django.request': {
-            'handlers': ['console'],
+            'handlers': ['queue'],
             'level': 'WARNING',  # Broken pipe 오류를 WARNING으로 처리
             'propagate': False,
         },
         'corsheaders': {
-            'handlers': ['console'],
             'level': 'DEBUG',  # CORS 디버깅 로그
             'propagate': True,
         },
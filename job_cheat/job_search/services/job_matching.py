@@ -4,7 +4,6 @@ from firebase_admin import firestore
 from sentence_transformers import SentenceTransformer
 from pinecone import Pinecone
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -1,10 +1,11 @@
+import asyncio
+import json
 import os
 import logging
 import openai
 from firebase_admin import firestore
 from core.utils import create_persona_card
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -98,7 +99,6 @@ def get_user_recommendations(user_id: str, persona_id: str) -> dict:
         
         # 1. 페르소나 정보 가져오기
         logger.info(f"👤 페르소나 정보 가져오기 중...")
-        persona_id = '0382e06d-9a3e-4484-a936-2886e4e07640'
         persona_doc = db.collection('users').document(user_id).collection('personas').document(persona_id).get()
         
         if not persona_doc.exists:
@@ -248,8 +248,6 @@ def get_job_detail_with_recommendation(user_id: str, persona_id: str, job_postin
     try:
         db = firestore.client()
         logger.info(f"✅ Firestore 클라이언트 초기화 완료")
-
-        persona_id = '0382e06d-9a3e-4484-a936-2886e4e07640'
         
         # 1. 페르소나 정보 가져오기
         logger.info(f"👤 페르소나 정보 조회 중...")
@@ -356,7 +354,6 @@ def get_job_detail_with_recommendation(user_id: str, persona_id: str, job_postin
         
         if not cover_letter_preview:
             logger.info(f"⚠️  자기소개서 미리보기가 없음. LLM으로 생성 중...")
-            import asyncio
             cover_letter_result = asyncio.run(generate_cover_letter_preview_with_llm(persona_data, job_data))
             
             if cover_letter_result['success']:
@@ -594,7 +591,6 @@ def generate_reason_summary_with_llm(persona_data: dict, job_data: dict) -> dict
         logger.info(f"   📝 응답 길이: {len(content)}자")
         
         # JSON 파싱 시도
-        import json
         try:
             result = json.loads(content)
             logger.info(f"✅ JSON 파싱 성공")
@@ -12,6 +12,8 @@ from typing import Dict, List, Any
 from firebase_admin import firestore
 from google.api_core import exceptions as google_exceptions
 
+from core.services.firebase_personas import invalidate_persona_cache
+
 logger = logging.getLogger(__name__)
 
 USER_COLLECTION = "users"
@@ -88,6 +90,7 @@ def add_job_to_scrap(user_id: str, persona_id: str, job_posting_id: str) -> Dict
         persona_ref.update({
             'scrap': scrap_list
         })
+        invalidate_persona_cache(user_id=user_id, persona_id=persona_id)
         logger.info(f"✅ 페르소나 문서 업데이트 완료")
         
         logger.info(f"🎉 스크랩 추가 완료: {job_posting_id}")
@@ -147,6 +150,7 @@ def remove_job_from_scrap(user_id: str, persona_id: str, job_posting_id: str) ->
             persona_ref.update({
                 'scrap': scrap_list
             })
+            invalidate_persona_cache(user_id=user_id, persona_id=persona_id)
             
             logger.info(f"스크랩 제거 완료: {job_posting_id}")
             
@@ -1,4 +1,5 @@
 import logging
+from django.conf import settings
 from rest_framework.decorators import api_view, permission_classes, authentication_classes
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
@@ -6,6 +7,8 @@ from .services.job_posting import add_job_to_firestore, get_all_jobs_from_firest
 from .services.job_matching import save_persona_recommendations_score, calculate_persona_job_scores, calculate_persona_job_scores_from_data
 from .services.recommendation import get_user_recommendations, get_job_detail_with_recommendation
 from .services.scrap_service import add_job_to_scrap, remove_job_from_scrap, get_scraped_jobs, ScrapServiceError
+from core.services.firebase_personas import get_cached_persona_document
+from core.utils import create_persona_card
 
 logger = logging.getLogger(__name__)
 
@@ -29,8 +32,8 @@ def get_user_recommendations_view(request):
     """
     logger.info("사용자 추천 공고 조회 요청")
     try:
-        user_id = request.GET.get('user_id')
-        persona_id = request.GET.get('persona_id')
+        user_id = request.query_params.get('user_id')
+        persona_id = request.query_params.get('persona_id')
         logger.info(f"요청 파라미터 - user_id: {user_id}, persona_id: {persona_id}")
         
         if not user_id:
@@ -87,8 +90,8 @@ def get_job_detail_with_recommendation_view(request, job_posting_id):
     """
     logger.info(f"공고 상세 정보 조회 요청 - job_posting_id: {job_posting_id}")
     try:
-        user_id = request.GET.get('user_id')
-        persona_id = request.GET.get('persona_id')
+        user_id = request.query_params.get('user_id')
+        persona_id = request.query_params.get('persona_id')
         logger.info(f"요청 파라미터 - user_id: {user_id}, persona_id: {persona_id}")
         
         if not user_id:
@@ -321,11 +324,11 @@ def get_scraped_jobs_view(request):
     logger.info("📋 스크랩된 공고 목록 조회 요청 시작")
     logger.info(f"🔍 요청 메서드: {request.method}")
     logger.info(f"🔍 요청 헤더: {dict(request.headers)}")
-    logger.info(f"🔍 쿼리 파라미터: {dict(request.GET)}")
+    logger.info(f"🔍 쿼리 파라미터: {dict(request.query_params)}")
     
     try:
-        user_id = request.GET.get('user_id')
-        persona_id = request.GET.get('persona_id')
+        user_id = request.query_params.get('user_id')
+        persona_id = request.query_params.get('persona_id')
         
         logger.info(f"📋 파라미터 추출 완료")
         logger.info(f"   👤 user_id: {user_id}")
@@ -366,10 +369,6 @@ def get_scraped_jobs_view(request):
         
         # 페르소나 카드 데이터 조회
         logger.info(f"📤 페르소나 데이터 조회 시작")
-        from core.services.firebase_personas import get_persona_document
-        from core.utils import create_persona_card
-        from django.conf import settings
-        
         db = getattr(settings, "FIREBASE_DB", None)
         if not db:
             error_response = {
@@ -381,9 +380,9 @@ def get_scraped_jobs_view(request):
             return Response(error_response, status=500)
         
         logger.info(f"🔗 Firestore 클라이언트 확인 완료")
-        logger.info(f"   🔗 get_persona_document(user_id={user_id}, persona_id={persona_id})")
+        logger.info(f"   🔗 get_cached_persona_document(user_id={user_id}, persona_id={persona_id})")
         
-        persona_data = get_persona_document(user_id=user_id, persona_id=persona_id, db=db)
+        persona_data = get_cached_persona_document(user_id=user_id, persona_id=persona_id, db=db)
         logger.info(f"📥 페르소나 데이터 수신 완료")
         logger.info(f"   📊 페르소나 데이터: {persona_data}")
         